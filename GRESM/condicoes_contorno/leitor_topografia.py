@@ -18,6 +18,76 @@ from typing import Dict, Any, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+from collections import OrderedDict
+
+class CacheTilesLRU:
+    """
+    Cache LRU de tiles decodificados/reamostrados, limitado em bytes.
+
+    As chaves são (nome_raster, fator, iy, ix); o tile menos recentemente usado é
+    descartado quando a soma de `nbytes` excede `capacidade_bytes`.
+    """
+
+    def __init__(self, capacidade_bytes=256 * 2**20):
+        self.capacidade_bytes = int(capacidade_bytes)
+        self._tiles = OrderedDict()
+        self.bytes_ocupados = 0
+        self.acertos = 0
+        self.faltas = 0
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def obter(self, chave, gerar):
+        """Tile da `chave`, chamando `gerar()` apenas em caso de falta."""
+        tile = self._tiles.get(chave)
+        if tile is not None:
+            self._tiles.move_to_end(chave)
+            self.acertos += 1
+            return tile
+        self.faltas += 1
+        tile = gerar()
+        tile.setflags(write=False)
+        self._tiles[chave] = tile
+        self.bytes_ocupados += tile.nbytes
+        while self.bytes_ocupados > self.capacidade_bytes and len(self._tiles) > 1:
+            _, antigo = self._tiles.popitem(last=False)
+            self.bytes_ocupados -= antigo.nbytes
+        return tile
+
+    def limpar(self):
+        self._tiles.clear()
+        self.bytes_ocupados = 0
+
+
+def _abrir_raster(caminho, forma=None, dtype=None):
+    """
+    Abre um raster 2D sem ler os dados: `.npy` via np.load(mmap_mode='r') e
+    binário cru via np.memmap. Para binário cru, `forma`/`dtype` vêm dos
+    argumentos ou de um cabeçalho `<caminho>.json` ({"forma": [ny, nx], "dtype": "<f4"}).
+    """
+    if caminho.endswith(".npy"):
+        return np.load(caminho, mmap_mode="r")
+    if forma is None or dtype is None:
+        with open(caminho + ".json") as arquivo:
+            cabecalho = json.load(arquivo)
+        forma = tuple(cabecalho["forma"]) if forma is None else forma
+        dtype = cabecalho["dtype"] if dtype is None else dtype
+    return np.memmap(caminho, dtype=np.dtype(dtype), mode="r", shape=tuple(forma))
+
+
+def _media_em_blocos(bloco, fator):
+    """Reamostragem por média em blocos fator x fator (blocos parciais nas bordas)."""
+    bloco = np.asarray(bloco, dtype=np.float64)
+    if fator == 1:
+        return bloco
+    linhas = np.arange(0, bloco.shape[0], fator)
+    colunas = np.arange(0, bloco.shape[1], fator)
+    soma = np.add.reduceat(np.add.reduceat(bloco, linhas, axis=0), colunas, axis=1)
+    n_linhas = np.diff(np.append(linhas, bloco.shape[0]))
+    n_colunas = np.diff(np.append(colunas, bloco.shape[1]))
+    return soma / np.outer(n_linhas, n_colunas)
+
 class LeitorTopografiaBase(ABC):
     """Classe base abstrata para LeitorTopografia."""
     @abstractmethod
@@ -47,6 +117,11 @@ class LeitorTopografia(LeitorTopografiaBase):
             "cp": 2097.0
         }
         
+        # Rasters mapeados em memória e cache de tiles (ver abrir_rasters)
+        self._rasters = {}
+        self._tiles = CacheTilesLRU(self._config.get("cache_tiles_bytes", 256 * 2**20))
+        self.tamanho_tile = int(self._config.get("tamanho_tile", 256))
+        
         self.inicializar()
 
     # ==========================================================================
@@ -101,6 +176,147 @@ class LeitorTopografia(LeitorTopografiaBase):
             return 0.0
         
 
+    def abrir_rasters(self, caminhos, forma=None, dtype=None):
+        """
+        Abre os rasters de leito, superfície e/ou espessura por mapeamento em memória.
+
+        `caminhos` é um dict {"leito": ..., "superficie": ..., "espessura": ...}
+        (ao menos dois); nada é lido do disco além dos cabeçalhos. O terceiro campo,
+        se ausente, é derivado tile a tile dos outros dois. Com menos de dois,
+        arquivo que não abre ou formas diferentes levanta ValueError e os
+        rasters já registrados ficam intactos.
+        """
+        self._status = "COMPUTING_ABRIR_RASTERS"
+        presentes = {"leito", "superficie", "espessura"} & set(caminhos)
+        if len(presentes) < 2:
+            raise ValueError(f"abrir_rasters requer ao menos dois de leito/superficie/espessura; "
+                             f"recebidos: {sorted(caminhos)}")
+        # Tudo é aberto e validado antes de registrar: um conjunto parcial deixaria
+        # campos derivados sem as duas fontes
+        abertos = {}
+        for nome, caminho in caminhos.items():
+            try:
+                abertos[nome] = _abrir_raster(caminho, forma, dtype)
+            except Exception as e:
+                self._tratar_erro_execucao(e)
+                raise ValueError(f"Raster '{nome}' ({caminho}) não pôde ser aberto: {e}") from e
+        formas = {r.shape for r in abertos.values()}
+        if len(formas) != 1 or len(next(iter(formas))) != 2:
+            raise ValueError(f"Rasters devem ser 2D e da mesma forma: "
+                             f"{ {nome: r.shape for nome, r in abertos.items()} }")
+        self._rasters = abertos
+        self._tiles.limpar()
+        return self.forma_raster
+
+    @property
+    def forma_raster(self):
+        return next(iter(self._rasters.values())).shape if self._rasters else None
+
+    def _tile_fonte(self, nome, fator, iy, ix):
+        """Decodifica um tile: lê só a região do memmap e reamostra por `fator`."""
+        if nome not in self._rasters:
+            # Campo derivado: superficie = leito + espessura, espessura = superficie - leito
+            if nome == "superficie":
+                return self.ler_tile("leito", iy, ix, fator) + self.ler_tile("espessura", iy, ix, fator)
+            if nome == "espessura":
+                return self.ler_tile("superficie", iy, ix, fator) - self.ler_tile("leito", iy, ix, fator)
+            if nome == "leito":
+                return self.ler_tile("superficie", iy, ix, fator) - self.ler_tile("espessura", iy, ix, fator)
+            raise KeyError(nome)
+        passo = self.tamanho_tile * fator
+        raster = self._rasters[nome]
+        return _media_em_blocos(raster[iy * passo:(iy + 1) * passo, ix * passo:(ix + 1) * passo], fator)
+
+    def ler_tile(self, nome, iy, ix, fator=1):
+        """
+        Tile (iy, ix) do raster `nome` na resolução reduzida por `fator`.
+
+        O tile cobre `tamanho_tile` x `tamanho_tile` células reamostradas e fica no
+        cache LRU; o array devolvido é somente leitura.
+        """
+        return self._tiles.obter((nome, fator, iy, ix), lambda: self._tile_fonte(nome, fator, iy, ix))
+
+    def _validar_janela(self, linhas, colunas, fator):
+        """Exige 0 <= l0 < l1 <= ny e 0 <= c0 < c1 <= nx na grade reamostrada por `fator`."""
+        if self.forma_raster is None:
+            raise ValueError("Nenhum raster aberto: chame abrir_rasters antes")
+        ny, nx = (-(-n // fator) for n in self.forma_raster)
+        (l0, l1), (c0, c1) = linhas, colunas
+        if not (0 <= l0 < l1 <= ny and 0 <= c0 < c1 <= nx):
+            raise ValueError(f"Janela {tuple(linhas)} x {tuple(colunas)} fora da grade reamostrada "
+                             f"({ny}, {nx}) com fator {fator}")
+
+    def ler_janela(self, nome, linhas, colunas, fator=1):
+        """
+        Janela [l0, l1) x [c0, c1), em índices da grade reamostrada por `fator`.
+
+        Monta a janela a partir dos tiles que a cobrem, de modo que janelas
+        sobrepostas (rodadas regionais ou aninhadas) reutilizam o cache. Janela
+        vazia ou fora da grade reamostrada levanta ValueError.
+        """
+        self._status = "COMPUTING_LER_JANELA"
+        self._validar_janela(linhas, colunas, fator)
+        try:
+            l0, l1 = linhas
+            c0, c1 = colunas
+            T = self.tamanho_tile
+            janela = np.empty((l1 - l0, c1 - c0))
+            for iy in range(l0 // T, (l1 - 1) // T + 1):
+                for ix in range(c0 // T, (c1 - 1) // T + 1):
+                    tile = self.ler_tile(nome, iy, ix, fator)
+                    a0, a1 = max(l0, iy * T), min(l1, iy * T + tile.shape[0])
+                    b0, b1 = max(c0, ix * T), min(c1, ix * T + tile.shape[1])
+                    janela[a0 - l0:a1 - l0, b0 - c0:b1 - c0] = tile[a0 - iy * T:a1 - iy * T, b0 - ix * T:b1 - ix * T]
+            return janela
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def carregar_dados_2d(self, dx=5.0, Lx=800.0, Ly=1500.0):
+        """
+        Grade em planta (y, x) com espaçamento `dx` (km).
+
+        Retorna x (nx,), y (ny,), leito (ny, nx) e superficie (ny, nx); com dx = 1 km
+        a grade padrão tem 1.2 milhão de células. Se a configuração traz
+        "rasters" (caminhos para abrir_rasters), os campos vêm dos arquivos:
+        "dx_raster" (km) define o fator de reamostragem round(dx / dx_raster) e
+        "janela" = ((l0, l1), (c0, c1)) restringe a leitura à região de interesse,
+        em índices da grade reamostrada.
+        """
+        self._status = "COMPUTING_CARREGAR_DADOS_2D"
+        # Fora do try: configuração de rasters ou janela inválida não vira retorno de segurança
+        if "rasters" in self._config:
+            if not self._rasters:
+                self.abrir_rasters(self._config["rasters"], self._config.get("forma"),
+                                   self._config.get("dtype"))
+            dx_raster = self._config.get("dx_raster", dx)
+            fator = max(1, int(round(dx / dx_raster)))
+            ny, nx = (-(-n // fator) for n in self.forma_raster)
+            linhas, colunas = self._config.get("janela", ((0, ny), (0, nx)))
+            self._validar_janela(linhas, colunas, fator)
+        try:
+            if "rasters" in self._config:
+                leito = self.ler_janela("leito", linhas, colunas, fator)
+                superficie = self.ler_janela("superficie", linhas, colunas, fator)
+                x = (colunas[0] + np.arange(leito.shape[1])) * dx_raster * fator
+                y = (linhas[0] + np.arange(leito.shape[0])) * dx_raster * fator
+                return x, y, leito, superficie
+
+            from GRESM.infraestrutura.parametros_reais import ParametrizacaoGroelandia
+            x = np.arange(0.0, Lx + 0.5 * dx, dx)
+            y = np.arange(0.0, Ly + 0.5 * dx, dx)
+            leito = ParametrizacaoGroelandia.obter_topografia_leito_2d(x, y, Lx, Ly)
+            H_inicial = ParametrizacaoGroelandia.obter_espessura_inicial_2d(x, y, Lx, Ly)
+            return x, y, leito, leito + H_inicial
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+
     # ==========================================================================
     # INTERFACE DE EXECUÇÃO
     # ==========================================================================
@@ -0,0 +1,185 @@
+"""
+Módulo: cache_cinematica.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Cinemática compartilhada de uma iteração não linear: gradientes de velocidade,
+tensor taxa de deformação, seu segundo invariante e a tensão desviadora são
+calculados uma vez por campo de velocidade e lidos por todos os consumidores
+(viscosidade, Jacobiano, adjunto, dano, fábrica, aquecimento por deformação).
+A cache se invalida sozinha quando a velocidade muda: `atualizar` compara o
+campo com a cópia da versão corrente (uma passada sobre os nós, mais barata que
+refazer os gradientes nos pontos de quadratura) e cada grandeza é recalculada
+sob demanda, na primeira leitura da nova versão.
+
+Duas geometrias:
+- "primeira_ordem": elementos Q1 do SolvedorOrdemSuperior em plano de fluxo
+  (x, z), gradientes nos pontos de Gauss a partir de Gx, Gz (E, Q, 4) e da
+  `conectividade`;
+- "planta": grade regular (..., ny, nx) com u e v e espaçamentos dx, dy
+  (diferenças centradas de operadores_grade.gradiente_em).
+"""
+
+import numpy as np
+
+from GRESM.dinamica_central.operadores_grade import gradiente_em
+from GRESM.dinamica_central.tensor_tensao import TensorTensao
+
+GEOMETRIAS = ("primeira_ordem", "planta")
+
+
+class CacheCinematica:
+    """
+    Grandezas cinemáticas da velocidade corrente, uma versão por campo.
+
+    Os arrays devolvidos pertencem à versão em que foram lidos: uma velocidade
+    nova gera arrays novos e não sobrescreve os anteriores (o Newton mantém os
+    do iterado aceito enquanto testa outro). `calculos` conta as grandezas
+    calculadas e `reaproveitamentos` as leituras servidas pela cache.
+    """
+
+    def __init__(self, geometria, **operadores):
+        if geometria not in GEOMETRIAS:
+            raise ValueError(f"Geometria desconhecida: '{geometria}' (use {GEOMETRIAS})")
+        self.geometria = geometria
+        self.operadores = operadores
+        self.tensor = TensorTensao()
+        self.versao = 0
+        self.calculos = 0
+        self.reaproveitamentos = 0
+        self.invalidar()
+
+    def definir_operadores(self, **operadores):
+        """Troca os operadores (p.ex. Gx, Gz de uma geometria nova) e invalida a cache."""
+        self.operadores.update(operadores)
+        self.invalidar()
+
+    def invalidar(self):
+        self._velocidade = None
+        self._valores = {}
+        self._viscosidade = None
+
+    # ==========================================================================
+    # VERSÕES
+    # ==========================================================================
+
+    def atualizar(self, *velocidade):
+        """
+        Registra a velocidade: u nodal em primeira ordem, (u, v) em planta.
+        Retorna True se o campo mudou (nova versão; nada é recalculado aqui).
+        """
+        if self._velocidade is not None and len(velocidade) == len(self._velocidade) and all(
+                np.shape(nova) == atual.shape and np.array_equal(nova, atual)
+                for nova, atual in zip(velocidade, self._velocidade)):
+            return False
+        self._velocidade = tuple(np.array(componente, dtype=np.float64) for componente in velocidade)
+        self._valores = {}
+        self._viscosidade = None
+        self.versao += 1
+        return True
+
+    def _obter(self, nome, calcular):
+        if self._velocidade is None:
+            raise ValueError("Cache cinemática sem velocidade: chame atualizar()")
+        if nome in self._valores:
+            self.reaproveitamentos += 1
+        else:
+            self._valores[nome] = calcular()
+            self.calculos += 1
+        return self._valores[nome]
+
+    # ==========================================================================
+    # GRANDEZAS
+    # ==========================================================================
+
+    def velocidade_elementos(self):
+        """u nos nós de cada elemento (E, 4), geometria "primeira_ordem"."""
+        return self._obter("velocidade_elementos",
+                           lambda: self._velocidade[0].ravel()[self.operadores["conectividade"]])
+
+    def gradientes(self):
+        """
+        Gradientes de velocidade: {"dudx", "dudz"} (E, Q) em primeira ordem ou
+        {"dudx", "dudy", "dvdx", "dvdy"} (forma da grade) em planta.
+        """
+        return self._obter("gradientes", self._calcular_gradientes)
+
+    def _calcular_gradientes(self):
+        op = self.operadores
+        if self.geometria == "primeira_ordem":
+            ue = self.velocidade_elementos()
+            return {"dudx": np.einsum("eqk,ek->eq", op["Gx"], ue),
+                    "dudz": np.einsum("eqk,ek->eq", op["Gz"], ue)}
+        gradientes = {}
+        for nome, campo in zip("uv", self._velocidade):
+            gradientes[f"d{nome}dx"] = gradiente_em(campo, op["dx"], np.empty_like(campo), eixo=-1)
+            gradientes[f"d{nome}dy"] = gradiente_em(campo, op["dy"], np.empty_like(campo), eixo=-2)
+        return gradientes
+
+    def taxa_deformacao(self):
+        """
+        Componentes e_ij do tensor taxa de deformação (dict "xx", "yy", "zz",
+        "xy", "xz", "yz"); e_zz = -(e_xx + e_yy) pela incompressibilidade e as
+        componentes nulas na geometria são o escalar 0.0.
+        """
+        def calcular():
+            g = self.gradientes()
+            if self.geometria == "primeira_ordem":
+                return {"xx": g["dudx"], "yy": 0.0, "zz": -g["dudx"],
+                        "xy": 0.0, "xz": 0.5 * g["dudz"], "yz": 0.0}
+            return {"xx": g["dudx"], "yy": g["dvdy"], "zz": -(g["dudx"] + g["dvdy"]),
+                    "xy": 0.5 * (g["dudy"] + g["dvdx"]), "xz": 0.0, "yz": 0.0}
+        return self._obter("taxa_deformacao", calcular)
+
+    def deformacao_quadrado(self):
+        """Segundo invariante e^2 = 1/2 e_ij e_ij (a^-2), base da viscosidade de Glen."""
+        def calcular():
+            g = self.gradientes()
+            if self.geometria == "primeira_ordem":
+                return self.tensor.deformacao_efetiva_quadrado(g["dudx"], g["dudz"])
+            return self.tensor.deformacao_efetiva_quadrado_planta(g["dudx"], g["dudy"], g["dvdx"], g["dvdy"])
+        return self._obter("deformacao_quadrado", calcular)
+
+    def tensor_gradiente(self):
+        """L_ij = du_i/dx_j (..., 3, 3), com dw/dz = -(du/dx + dv/dy), para a fábrica."""
+        def calcular():
+            g = self.gradientes()
+            L = np.zeros(np.shape(g["dudx"]) + (3, 3))
+            L[..., 0, 0] = g["dudx"]
+            if self.geometria == "primeira_ordem":
+                L[..., 0, 2] = g["dudz"]
+                L[..., 2, 2] = -g["dudx"]
+            else:
+                L[..., 0, 1] = g["dudy"]
+                L[..., 1, 0] = g["dvdx"]
+                L[..., 1, 1] = g["dvdy"]
+                L[..., 2, 2] = -(g["dudx"] + g["dvdy"])
+            return L
+        return self._obter("tensor_gradiente", calcular)
+
+    @property
+    def viscosidade(self):
+        """Viscosidade definida para a versão corrente (None antes de definir)."""
+        return self._viscosidade
+
+    def definir_viscosidade(self, viscosidade):
+        """Registra eta da versão corrente; a tensão desviadora passa a usá-la."""
+        self._viscosidade = viscosidade
+        self._valores.pop("tensao_desviadora", None)
+
+    def tensao_desviadora(self):
+        """
+        tau = 2 eta e com a viscosidade da versão corrente: (tau_xx, tau_xz) em
+        primeira ordem e (tau_xx, tau_yy, tau_xy) em planta, as mesmas tuplas de
+        TensorTensao.componentes_primeira_ordem/componentes_planta.
+        """
+        if self._viscosidade is None:
+            raise ValueError("Viscosidade não definida para a velocidade corrente")
+
+        def calcular():
+            g = self.gradientes()
+            if self.geometria == "primeira_ordem":
+                return self.tensor.componentes_primeira_ordem(self._viscosidade, g["dudx"], g["dudz"])
+            return self.tensor.componentes_planta(self._viscosidade, g["dudx"], g["dudy"], g["dvdx"], g["dvdy"])
+        return self._obter("tensao_desviadora", calcular)
@@ -0,0 +1,77 @@
+"""
+Módulo: montagem_esparsa.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Montagem de matrizes esparsas de elementos finitos com padrão fixo: a estrutura
+CSR e o mapa elemento -> posição em `data` são calculados uma vez por malha, e
+cada iteração não linear apenas reescreve os valores.
+"""
+
+import numpy as np
+import scipy.sparse
+
+
+class MontagemEsparsa:
+    """
+    Padrão CSR de uma malha descrita por `conectividade` (n_elementos, k).
+
+    A entrada local (a, b) do elemento e ocupa a posição e*k*k + a*k + b do vetor
+    COO; `mapa` leva cada uma delas à posição correspondente em `matriz.data`
+    (entradas repetidas entre elementos vizinhos são somadas por bincount).
+    """
+
+    def __init__(self, conectividade, n_nos):
+        self.conectividade = np.ascontiguousarray(conectividade, dtype=np.intp)
+        self.n_nos = int(n_nos)
+        k = self.conectividade.shape[1]
+        linhas = np.repeat(self.conectividade, k, axis=1).ravel().astype(np.int64)
+        colunas = np.tile(self.conectividade, (1, k)).ravel().astype(np.int64)
+
+        chaves, self.mapa = np.unique(linhas * self.n_nos + colunas, return_inverse=True)
+        self.mapa = self.mapa.ravel()
+        self.linha_entrada = chaves // self.n_nos
+        indices = (chaves % self.n_nos).astype(np.int32)
+        indptr = np.zeros(self.n_nos + 1, dtype=np.int32)
+        np.cumsum(np.bincount(self.linha_entrada, minlength=self.n_nos), out=indptr[1:])
+        self.matriz = scipy.sparse.csr_matrix((np.zeros(chaves.size), indices, indptr),
+                                              shape=(self.n_nos, self.n_nos))
+        self.matriz.has_sorted_indices = True
+        nos = np.arange(self.n_nos, dtype=np.int64)
+        self.posicao_diagonal = np.searchsorted(chaves, nos * self.n_nos + nos)
+
+    @property
+    def nnz(self):
+        return self.matriz.data.size
+
+    def montar(self, matrizes_elemento):
+        """Reescreve `matriz.data` com a soma das matrizes (n_elementos, k, k)."""
+        self.matriz.data[:] = np.bincount(self.mapa, weights=matrizes_elemento.ravel(),
+                                          minlength=self.nnz)
+        return self.matriz
+
+    def montar_vetor(self, vetores_elemento):
+        """Soma os vetores de elemento (n_elementos, k) nos nós."""
+        return np.bincount(self.conectividade.ravel(), weights=vetores_elemento.ravel(),
+                           minlength=self.n_nos)
+
+    def somar_diagonal(self, valores_nos):
+        """Adiciona `valores_nos` (n_nos,) à diagonal, p.ex. termos de contorno concentrados."""
+        self.matriz.data[self.posicao_diagonal] += valores_nos
+        return self.matriz
+
+    def aplicar_dirichlet(self, mascara_nos, rhs, valores=0.0):
+        """
+        Impõe u = `valores` nos nós de `mascara_nos` mantendo a simetria: linhas e
+        colunas desses nós são zeradas (a coluna é levada ao lado direito) e a
+        diagonal recebe 1.
+        """
+        valores_nos = np.where(mascara_nos, valores, 0.0)
+        if np.any(valores_nos):
+            rhs -= self.matriz @ valores_nos
+        data = self.matriz.data
+        data[mascara_nos[self.linha_entrada] | mascara_nos[self.matriz.indices]] = 0.0
+        data[self.posicao_diagonal[mascara_nos]] = 1.0
+        rhs[mascara_nos] = valores_nos[mascara_nos]
+        return self.matriz, rhs
@@ -0,0 +1,66 @@
+"""
+Módulo: operadores_grade.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Operadores de diferenças finitas em grade regular que escrevem em arrays
+pré-alocados (`out=`), para uso no passo de tempo sem alocação.
+"""
+
+import numpy as np
+
+
+def _fatia(ndim, eixo, fatia):
+    """Índice que aplica `fatia` ao eixo `eixo` e seleciona tudo nos demais."""
+    indice = [slice(None)] * ndim
+    indice[eixo] = fatia
+    return tuple(indice)
+
+
+def gradiente_em(campo, dx, out, eixo=-1):
+    """
+    Derivada de `campo` ao longo de `eixo` com espaçamento uniforme `dx`.
+
+    Mesmo esquema de np.gradient(campo, dx, axis=eixo) (centrado no interior,
+    primeira ordem nas bordas), porém sem temporários: o resultado vai para `out`.
+    """
+    nd = campo.ndim
+    interior = _fatia(nd, eixo, slice(1, -1))
+    np.subtract(campo[_fatia(nd, eixo, slice(2, None))], campo[_fatia(nd, eixo, slice(None, -2))],
+                out=out[interior])
+    out[interior] *= 0.5 / dx
+
+    borda = _fatia(nd, eixo, slice(0, 1))
+    np.subtract(campo[_fatia(nd, eixo, slice(1, 2))], campo[borda], out=out[borda])
+    out[borda] *= 1.0 / dx
+
+    borda = _fatia(nd, eixo, slice(-1, None))
+    np.subtract(campo[borda], campo[_fatia(nd, eixo, slice(-2, -1))], out=out[borda])
+    out[borda] *= 1.0 / dx
+    return out
+
+
+def thomas_colunas(inferior, diagonal, superior, rhs, out, trabalho):
+    """
+    Resolve um sistema tridiagonal por coluna, todas as colunas de uma vez.
+
+    Os coeficientes têm forma (n_niveis, n_colunas): a linha k de cada coluna é
+    inferior[k] x[k-1] + diagonal[k] x[k] + superior[k] x[k+1] = rhs[k]
+    (inferior[0] e superior[-1] são ignorados). O algoritmo de Thomas varre os
+    níveis com cada operação vetorizada sobre as colunas; `trabalho` (mesma
+    forma) recebe c' e `diagonal` é usado como rascunho. d' e depois a solução
+    vão para `out`, que pode ser o próprio `rhs`.
+    """
+    np.divide(superior[0], diagonal[0], out=trabalho[0])
+    np.divide(rhs[0], diagonal[0], out=out[0])
+    for k in range(1, rhs.shape[0]):
+        # m = b_k - a_k c'_{k-1};  c'_k = c_k / m;  d'_k = (d_k - a_k d'_{k-1}) / m
+        m = diagonal[k]
+        m -= inferior[k] * trabalho[k - 1]
+        np.divide(superior[k], m, out=trabalho[k])
+        np.subtract(rhs[k], inferior[k] * out[k - 1], out=out[k])
+        out[k] /= m
+    for k in range(rhs.shape[0] - 2, -1, -1):
+        out[k] -= trabalho[k] * out[k + 1]
+    return out
@@ -0,0 +1,467 @@
+"""
+Módulo: solvedor_ordem_superior.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Balanço de momento de primeira ordem (Blatter-Pattyn) em plano de fluxo (x, z):
+
+    d/dx(4 eta du/dx) + d/dz(eta du/dz) = rho g ds/dx
+
+com superfície livre de tensão, atrito basal tau_b = beta^2 u e u = 0 onde não
+há gelo. beta^2 é dado (escalar ou por coluna) ou vem de uma lei de deslizamento
+não linear (FriccaoBasal) avaliada na velocidade basal a cada iteração. Elementos bilineares (Q1) numa malha que acompanha o terreno (x, sigma),
+quadratura de Gauss 2x2. O padrão esparso e o mapa de espalhamento são montados
+uma vez por malha (MontagemEsparsa); a geometria é recalculada a cada passo de
+tempo e cada iteração não linear apenas reescreve os valores da matriz. Os
+gradientes de velocidade, e^2 e a viscosidade de cada iterado ficam na
+CacheCinematica `cinematica`, lida pelo resíduo, pelo Jacobiano, pelo adjunto e
+por quem usar a solução (tensões, dano, fábrica, aquecimento).
+
+Dois métodos não lineares:
+- "newton" (padrão): Jacobiano exato do resíduo, incluindo o termo de
+  d(eta)/du, com busca linear no resíduo. A fatoração LU do Jacobiano é
+  reaproveitada entre iterações e passos de tempo (Newton de corda) e só é
+  refeita quando a redução do resíduo fica lenta ou a busca linear falha.
+- "picard": viscosidade congelada a cada iteração, GMRES com precondicionador
+  ILU reaproveitado.
+
+`adjunto` dá as sensibilidades de um funcional da solução a beta^2 e à dureza
+com uma única solução linear (usado pela ControleInversao).
+"""
+
+import numpy as np
+import scipy.sparse.linalg
+
+from GRESM.dinamica_central.montagem_esparsa import MontagemEsparsa
+from GRESM.dinamica_central.cache_cinematica import CacheCinematica
+from GRESM.dinamica_central.tensor_tensao import TensorTensao
+from GRESM.dinamica_central.calculadora_viscosidade import CalculadoraViscosidade
+from GRESM.dinamica_central.mecanica_dano import MecanicaDano
+from GRESM.dinamica_central.tabela_arrhenius import TabelaArrhenius
+
+# Elemento de referência Q1: nós (-1,-1), (1,-1), (1,1), (-1,1) e pontos de Gauss 2x2
+_XI_NOS = np.array([-1.0, 1.0, 1.0, -1.0])
+_ZETA_NOS = np.array([-1.0, -1.0, 1.0, 1.0])
+_PONTOS_GAUSS = np.array([(xi, zeta) for zeta in (-1, 1) for xi in (-1, 1)]) / np.sqrt(3.0)
+
+
+def _funcoes_forma():
+    """Valores N (Q, 4) e derivadas dN/dxi, dN/dzeta (Q, 4) nos pontos de Gauss."""
+    xi, zeta = _PONTOS_GAUSS[:, 0:1], _PONTOS_GAUSS[:, 1:2]
+    N = 0.25 * (1 + _XI_NOS * xi) * (1 + _ZETA_NOS * zeta)
+    dN_dxi = 0.25 * _XI_NOS * (1 + _ZETA_NOS * zeta)
+    dN_dzeta = 0.25 * _ZETA_NOS * (1 + _XI_NOS * xi)
+    return N, dN_dxi, dN_dzeta
+
+
+class SolvedorOrdemSuperior:
+    """
+    Velocidade horizontal u(x, sigma) da aproximação de Blatter-Pattyn.
+
+    Os nós são numerados coluna a coluna (nó = i*(n_camadas+1) + k, k = 0 na
+    base), de modo que `u` tem forma (nx, n_camadas+1). Unidades SI com tempo
+    em anos: A em Pa^-n a^-1, beta2 em Pa a m^-1, velocidades em m/a.
+    """
+
+    def __init__(self, n_camadas=10, A=1e-16, n=3.0, rho_i=917.0, g=9.81, espessura_minima=1.0,
+                 regularizacao=1e-10, tol_relativa=1e-4, max_iter_picard=50, tol_linear=1e-8,
+                 fator_atualizacao_precondicionador=3.0, metodo="newton", max_iter_newton=30,
+                 razao_atualizacao_jacobiano=0.2, max_busca_linear=8):
+        self.n_camadas = int(n_camadas)
+        self.A, self.n = A, n
+        self.rho_g = rho_i * g
+        self.espessura_minima = espessura_minima
+        self.regularizacao = regularizacao
+        self.tol_relativa = tol_relativa
+        self.max_iter_picard = max_iter_picard
+        self.tol_linear = tol_linear
+        self.fator_atualizacao_precondicionador = fator_atualizacao_precondicionador
+        if metodo not in ("newton", "picard"):
+            raise ValueError(f"Método não linear desconhecido: '{metodo}'")
+        self.metodo = metodo
+        self.max_iter_newton = max_iter_newton
+        self.razao_atualizacao_jacobiano = razao_atualizacao_jacobiano
+        self.max_busca_linear = max_busca_linear
+
+        self.tensor = TensorTensao()
+        self.viscosidade = CalculadoraViscosidade()
+        self.dano = MecanicaDano()
+        self.cinematica = CacheCinematica("primeira_ordem")
+        self.sigma = np.linspace(0.0, 1.0, self.n_camadas + 1)
+        self._N, self._dN_dxi, self._dN_dzeta = _funcoes_forma()
+
+        self.montagem = None
+        self.u = None
+        self._precondicionador = None
+        self._iteracoes_apos_fatoracao = None
+        self._lu_jacobiano = None
+        self.zerar_estatisticas()
+
+    def zerar_estatisticas(self):
+        self.fatoracoes = 0
+        self.solucoes_lineares = 0
+        self.iteracoes_lineares = 0
+        self.iteracoes_picard = 0
+        self.iteracoes_newton = 0
+        self.avaliacoes_residuo = 0
+
+    # ==========================================================================
+    # MALHA E GEOMETRIA
+    # ==========================================================================
+
+    def _preparar_malha(self, nx):
+        """Conectividade e padrão esparso, uma vez por número de colunas."""
+        if self.montagem is not None and self.montagem.n_nos == nx * (self.n_camadas + 1):
+            return
+        nz = self.n_camadas
+        i, k = np.meshgrid(np.arange(nx - 1), np.arange(nz), indexing="ij")
+        no = (i * (nz + 1) + k).ravel()
+        # Ordem anti-horária: (i, k), (i+1, k), (i+1, k+1), (i, k+1)
+        conectividade = np.stack([no, no + nz + 1, no + nz + 2, no + 1], axis=1)
+        self.montagem = MontagemEsparsa(conectividade, nx * (nz + 1))
+        self.coluna_elemento = np.repeat(np.arange(nx - 1), nz)
+        self._precondicionador = None
+        self._lu_jacobiano = None
+        self.u = None
+
+    def _geometria(self, x, leito, espessura):
+        """
+        Termos geométricos do passo de tempo: M (E, Q, 4, 4) tal que a matriz do
+        elemento é sum_q eta_q M_q, gradientes Gx, Gz (E, Q, 4) e o vetor de
+        forçante por unidade de declividade (E, 4).
+        """
+        conectividade = self.montagem.conectividade
+        H = np.maximum(espessura, self.espessura_minima)
+        Z = (leito[:, None] + self.sigma[None, :] * H[:, None]).ravel()
+        X = np.repeat(x, self.n_camadas + 1)
+        Xe, Ze = X[conectividade], Z[conectividade]
+
+        # Jacobiano [[dx/dxi, dz/dxi], [dx/dzeta, dz/dzeta]] em cada ponto de Gauss
+        x_xi, z_xi = Xe @ self._dN_dxi.T, Ze @ self._dN_dxi.T
+        x_zeta, z_zeta = Xe @ self._dN_dzeta.T, Ze @ self._dN_dzeta.T
+        det = x_xi * z_zeta - z_xi * x_zeta
+        self.det = det
+        self.Gx = (z_zeta[..., None] * self._dN_dxi - z_xi[..., None] * self._dN_dzeta) / det[..., None]
+        self.Gz = (x_xi[..., None] * self._dN_dzeta - x_zeta[..., None] * self._dN_dxi) / det[..., None]
+
+        self.M = det[..., None, None] * (4.0 * self.Gx[..., :, None] * self.Gx[..., None, :] +
+                                         self.Gz[..., :, None] * self.Gz[..., None, :])
+        forca_unitaria = det @ self._N          # sum_q |J| N_q  (E, 4)
+
+        superficie = leito + espessura
+        declividade = np.diff(superficie) / np.diff(x)
+        self.forca = self.montagem.montar_vetor(
+            -self.rho_g * declividade[self.coluna_elemento, None] * forca_unitaria)
+
+        # Comprimento basal associado a cada nó da base (regra do trapézio)
+        dx = np.diff(x)
+        self.comprimento_base = np.zeros(x.size)
+        self.comprimento_base[:-1] += 0.5 * dx
+        self.comprimento_base[1:] += 0.5 * dx
+
+        sem_gelo = espessura < self.espessura_minima
+        self.mascara_dirichlet = np.repeat(sem_gelo, self.n_camadas + 1)
+        self.cinematica.definir_operadores(Gx=self.Gx, Gz=self.Gz, conectividade=conectividade)
+
+    # ==========================================================================
+    # SOLUÇÃO
+    # ==========================================================================
+
+    def _fatorar(self, matriz):
+        ilu = scipy.sparse.linalg.spilu(matriz.tocsc(), drop_tol=1e-5, fill_factor=20)
+        self._precondicionador = scipy.sparse.linalg.LinearOperator(matriz.shape, ilu.solve)
+        self._iteracoes_apos_fatoracao = None
+        self.fatoracoes += 1
+
+    def _resolver_linear(self, matriz, rhs, x0):
+        """
+        GMRES com o ILU reaproveitado; a fatoração só é refeita quando o número de
+        iterações passa de `fator_atualizacao_precondicionador` vezes o obtido logo
+        após a última fatoração, ou quando o GMRES falha.
+        """
+        if self._precondicionador is None:
+            self._fatorar(matriz)
+        for tentativa in range(2):
+            contador = [0]
+            def _contar(_):
+                contador[0] += 1
+            u, info = scipy.sparse.linalg.gmres(matriz, rhs, x0=x0, M=self._precondicionador,
+                                                rtol=self.tol_linear, restart=50, maxiter=20,
+                                                callback=_contar, callback_type="pr_norm")
+            self.iteracoes_lineares += contador[0]
+            self.solucoes_lineares += 1
+            if self._iteracoes_apos_fatoracao is None:
+                self._iteracoes_apos_fatoracao = max(contador[0], 5)
+            if info != 0:
+                # Falha: refatora com a matriz corrente e tenta de novo
+                self._fatorar(matriz)
+                continue
+            if contador[0] > self.fator_atualizacao_precondicionador * self._iteracoes_apos_fatoracao:
+                # Convergência lenta: a próxima solução usa uma fatoração nova
+                self._precondicionador = None
+            return u
+        return u
+
+    def _deformacoes(self, u):
+        """u por elemento (E, 4), du/dx, du/dz e e^2 nos pontos de Gauss (E, Q), da cache cinemática."""
+        cinematica = self.cinematica
+        cinematica.atualizar(u)
+        gradientes = cinematica.gradientes()
+        return (cinematica.velocidade_elementos(), gradientes["dudx"], gradientes["dudz"],
+                cinematica.deformacao_quadrado())
+
+    def _cinematica_viscosidade(self, u, A=None, dureza=None):
+        """
+        _deformacoes(u) e eta (E, Q); eta é calculado uma vez por versão e
+        registrado na cache (A e dureza são fixos dentro de `resolver`, e a
+        geometria nova de cada chamada invalida a cache).
+        """
+        ue, dudx, dudz, e2 = self._deformacoes(u)
+        eta = self.cinematica.viscosidade
+        if eta is None:
+            eta = self._viscosidade(e2, A, dureza)
+            self.cinematica.definir_viscosidade(eta)
+        return ue, dudx, dudz, e2, eta
+
+    def _viscosidade(self, e2, A=None, dureza=None):
+        if dureza is not None:
+            dureza = dureza[:, None] if np.ndim(dureza) == 1 else dureza
+            return self.viscosidade.viscosidade_glen(e2, None, self.n, self.regularizacao, dureza=dureza)
+        A = self.A if A is None else (A[:, None] if np.ndim(A) == 1 else A)
+        return self.viscosidade.viscosidade_glen(e2, A, self.n, self.regularizacao)
+
+    def viscosidade_elementos(self, u, A=None, dureza=None):
+        """eta nos pontos de Gauss (E, Q) a partir do campo nodal `u` (e^2 vem da cache)."""
+        return self._viscosidade(self._deformacoes(u)[3], A, dureza)
+
+    def _atrito_nos(self, beta2):
+        """beta^2 vezes o comprimento basal nos nós da base, zero nos demais (n_nos,)."""
+        atrito = np.zeros(self.montagem.n_nos)
+        atrito[::self.n_camadas + 1] = beta2 * self.comprimento_base
+        return atrito
+
+    def _atrito(self, u, beta2, lei):
+        """
+        Atrito nodal do resíduo e sua derivada d(tau_b)/du para o Jacobiano.
+        Com beta^2 fixo as duas coincidem; com a `lei` (friccao, N, C),
+        beta^2(u_b) e beta^2 + |u_b| d(beta^2)/d|u_b| na velocidade basal corrente.
+        """
+        if lei is None:
+            atrito = self._atrito_nos(beta2)
+            return atrito, atrito
+        u_base = u[::self.n_camadas + 1]
+        friccao, pressao_efetiva, coeficiente = lei
+        beta2, derivada = friccao.coeficiente_atrito(u_base, pressao_efetiva, coeficiente, derivada=True)
+        return self._atrito_nos(beta2), self._atrito_nos(beta2 + np.abs(u_base) * derivada)
+
+    def montar_sistema(self, eta, beta2):
+        """Matriz e lado direito (com Dirichlet) para a viscosidade `eta` congelada."""
+        self.montagem.montar(np.einsum("eq,eqij->eij", eta, self.M))
+        self.montagem.somar_diagonal(self._atrito_nos(beta2))
+        return self.montagem.aplicar_dirichlet(self.mascara_dirichlet, self.forca.copy())
+
+    def residuo(self, u, eta, ue, atrito):
+        """R(u) = K(eta(u)) u + beta^2 u_b - f; nos nós sem gelo R = u."""
+        self.avaliacoes_residuo += 1
+        r = self.montagem.montar_vetor(np.einsum("eq,eqij,ej->ei", eta, self.M, ue))
+        r += atrito * u
+        r -= self.forca
+        r[self.mascara_dirichlet] = u[self.mascara_dirichlet]
+        return r
+
+    def montar_jacobiano(self, eta, dudx, dudz, e2, atrito):
+        """
+        dR/du = sum_q eta_q M_q + sum_q 2|J| eta'_q w_q w_q^T + beta^2, com
+        w = de^2/du = 2 du/dx Gx + 1/2 du/dz Gz e eta' = d(eta)/d(e^2) < 0.
+        Simétrico; reaproveita o padrão esparso da MontagemEsparsa.
+        """
+        derivada = self.viscosidade.derivada_viscosidade_glen(e2, eta, self.n, self.regularizacao)
+        w = 2.0 * dudx[..., None] * self.Gx + 0.5 * dudz[..., None] * self.Gz
+        elementos = np.einsum("eq,eqij->eij", eta, self.M)
+        elementos += np.einsum("eq,eqi,eqj->eij", 2.0 * self.det * derivada, w, w)
+        self.montagem.montar(elementos)
+        self.montagem.somar_diagonal(atrito)
+        matriz, _ = self.montagem.aplicar_dirichlet(self.mascara_dirichlet, np.zeros(self.montagem.n_nos))
+        return matriz
+
+    def _fatorar_jacobiano(self, eta, dudx, dudz, e2, atrito):
+        jacobiano = self.montar_jacobiano(eta, dudx, dudz, e2, atrito)
+        self._lu_jacobiano = scipy.sparse.linalg.splu(jacobiano.tocsc())
+        self.fatoracoes += 1
+
+    def _beta2_congelado(self, u, beta2, lei):
+        if lei is None:
+            return beta2
+        friccao, pressao_efetiva, coeficiente = lei
+        return friccao.coeficiente_atrito(u[::self.n_camadas + 1], pressao_efetiva, coeficiente)
+
+    def _resolver_picard(self, u, beta2, A, dureza, lei=None):
+        for _ in range(self.max_iter_picard):
+            eta = self._cinematica_viscosidade(u, A, dureza)[4]
+            matriz, rhs = self.montar_sistema(eta, self._beta2_congelado(u, beta2, lei))
+            u_novo = self._resolver_linear(matriz, rhs, u)
+            self.iteracoes_picard += 1
+            variacao = np.linalg.norm(u_novo - u) / max(np.linalg.norm(u_novo), 1e-30)
+            u = u_novo
+            if variacao < self.tol_relativa:
+                self.convergiu = True
+                break
+        return u
+
+    def _resolver_newton(self, u, beta2, A, dureza, lei=None):
+        """
+        Newton com Jacobiano (fatoração LU) reaproveitado e busca linear por
+        retrocesso no resíduo (condição de Armijo). A fatoração é refeita quando
+        ||R|| cai menos que `razao_atualizacao_jacobiano` por iteração ou quando
+        a direção do Jacobiano antigo não reduz o resíduo.
+        """
+        escala = max(np.linalg.norm(self.forca), 1e-30)
+        u = u.copy()
+        u[self.mascara_dirichlet] = 0.0
+        atrito, tangente = self._atrito(u, beta2, lei)
+        ue, dudx, dudz, e2, eta = self._cinematica_viscosidade(u, A, dureza)
+        r = self.residuo(u, eta, ue, atrito)
+        norma = np.linalg.norm(r)
+        atualizar = self._lu_jacobiano is None
+
+        for _ in range(self.max_iter_newton):
+            # Resíduo já desprezível (p.ex. geometria igual à do passo anterior)
+            if norma <= 1e-2 * self.tol_relativa * escala:
+                self.convergiu = True
+                break
+            if atualizar:
+                self._fatorar_jacobiano(eta, dudx, dudz, e2, tangente)
+            delta = -self._lu_jacobiano.solve(r)
+            self.solucoes_lineares += 1
+            self.iteracoes_newton += 1
+
+            alfa = 1.0
+            for _ in range(self.max_busca_linear):
+                u_teste = u + alfa * delta
+                ue_t, dudx_t, dudz_t, e2_t, eta_t = self._cinematica_viscosidade(u_teste, A, dureza)
+                atrito_t, tangente_t = self._atrito(u_teste, beta2, lei)
+                r_teste = self.residuo(u_teste, eta_t, ue_t, atrito_t)
+                norma_teste = np.linalg.norm(r_teste)
+                if norma_teste <= (1.0 - 1e-4 * alfa) * norma:
+                    break
+                alfa *= 0.5
+            else:
+                if not atualizar:
+                    # Direção do Jacobiano antigo não desce: refatora e repete a iteração
+                    atualizar = True
+                    continue
+                break
+
+            variacao = alfa * np.linalg.norm(delta) / max(np.linalg.norm(u_teste), 1e-30)
+            atualizar = norma_teste > self.razao_atualizacao_jacobiano * norma or alfa < 1.0
+            u, ue, dudx, dudz, e2, eta = u_teste, ue_t, dudx_t, dudz_t, e2_t, eta_t
+            atrito, tangente = atrito_t, tangente_t
+            r, norma = r_teste, norma_teste
+            if variacao < self.tol_relativa:
+                self.convergiu = True
+                break
+        return u
+
+    def resolver(self, x, leito, espessura, beta2=1e6, A=None, u_inicial=None, temperatura=None,
+                 friccao=None, pressao_efetiva=None, coeficiente_atrito=None, dano=None):
+        """
+        Campo u (nx, n_camadas+1) em m/a pelo método não linear `metodo`.
+
+        `x`, `leito` e `espessura` em metros; `beta2` escalar ou por coluna; `A`
+        escalar ou por elemento (E,). Com `temperatura` (°C, por elemento ou por
+        ponto de Gauss) a dureza vem da tabela de Arrhenius, avaliada uma vez por
+        chamada e não a cada iteração. Com `friccao` (FriccaoBasal), beta^2 segue
+        a lei de deslizamento na velocidade basal, com `pressao_efetiva` (Pa, por
+        coluna) e `coeficiente_atrito` (C da lei; None usa o padrão) e `beta2` é
+        ignorado; o Jacobiano inclui a derivada analítica do atrito. Com `dano`
+        (D por elemento ou ponto de Gauss) a dureza vira (1 - D) B, pela
+        MecanicaDano.viscosidade_efetiva. Parte da solução
+        anterior quando a malha não mudou; sem ela, Newton parte de uma iteração
+        de Picard.
+        """
+        self._preparar_malha(x.size)
+        self._geometria(x, leito, espessura)
+        beta2 = np.broadcast_to(beta2, x.shape)
+        lei = None if friccao is None else (friccao, pressao_efetiva, coeficiente_atrito)
+        dureza = None
+        if temperatura is not None:
+            dureza = TabelaArrhenius.compartilhada(n=self.n).dureza(temperatura)
+        if dano is not None:
+            if dureza is None:
+                dureza = np.power(self.A if A is None else A, -1.0 / self.n)
+            dano = np.asarray(dano)
+            dureza = np.asarray(dureza)
+            if dano.ndim == 1 and dureza.ndim == 2:
+                dano = dano[:, None]
+            elif dano.ndim == 2 and dureza.ndim == 1:
+                dureza = dureza[:, None]
+            dureza = self.dano.viscosidade_efetiva(dureza, dano)
+
+        if u_inicial is not None:
+            u = np.array(u_inicial, dtype=np.float64).ravel()
+        elif self.u is not None:
+            u = self.u.ravel().copy()
+        else:
+            u = np.zeros(self.montagem.n_nos)
+            if self.metodo == "newton":
+                eta = self._cinematica_viscosidade(u, A, dureza)[4]
+                beta2_inicial = self._beta2_congelado(u, beta2, lei)
+                u = self._resolver_linear(*self.montar_sistema(eta, beta2_inicial), u)
+                self.iteracoes_picard += 1
+
+        self.convergiu = False
+        if self.metodo == "newton":
+            u = self._resolver_newton(u, beta2, A, dureza, lei)
+        else:
+            u = self._resolver_picard(u, beta2, A, dureza, lei)
+
+        self.u = u.reshape(x.size, self.n_camadas + 1)
+        # Cópias: beta2 é uma vista (broadcast_to) do array de quem chama, que pode
+        # mudar antes de `adjunto`
+        self._parametros_resolvidos = (np.array(beta2), None if A is None else np.array(A), dureza, lei)
+        # A cache fica na solução devolvida (sem custo se o último iterado avaliado foi o aceito)
+        self._cinematica_viscosidade(u, A, dureza)
+        return self.u
+
+    # ==========================================================================
+    # ADJUNTO
+    # ==========================================================================
+
+    def adjunto(self, derivada_custo):
+        """
+        Sensibilidades de um funcional J(u) da última solução de `resolver`.
+
+        Como R(u, p) = 0, dJ/dp = -lambda^T dR/dp com (dR/du)^T lambda = dJ/du;
+        o Jacobiano exato em u é simétrico e a solução adjunta custa uma
+        fatoração LU (uma iteração de Newton), qualquer que seja o número de
+        parâmetros. `derivada_custo` é dJ/du (nx, n_camadas+1). Retorna lambda
+        (nx, n_camadas+1), dJ/dbeta2 por coluna (nx,) (dR/dbeta2_i = L_i u_b,i
+        no nó da base) e dJ/d(ln B) por elemento (E,) (eta é proporcional à
+        dureza B, logo dR/d(ln B_e) é a parcela do elemento em K(eta) u). Só
+        para beta^2 imposto, sem lei de deslizamento.
+        """
+        beta2, A, dureza, lei = self._parametros_resolvidos
+        if lei is not None:
+            raise ValueError("Adjunto disponível só para beta2 imposto (sem friccao)")
+        u = self.u.ravel()
+        ue, dudx, dudz, e2, eta = self._cinematica_viscosidade(u, A, dureza)
+        jacobiano = self.montar_jacobiano(eta, dudx, dudz, e2, self._atrito_nos(beta2))
+        rhs = np.array(derivada_custo, dtype=np.float64).ravel()
+        rhs[self.mascara_dirichlet] = 0.0
+        lam = scipy.sparse.linalg.splu(jacobiano.tocsc()).solve(rhs)
+        self.fatoracoes += 1
+        self.solucoes_lineares += 1
+
+        base = slice(None, None, self.n_camadas + 1)
+        sensibilidade_atrito = -lam[base] * self.comprimento_base * u[base]
+        sensibilidade_dureza = -np.einsum("eq,eqij,ei,ej->e", eta, self.M,
+                                          lam[self.montagem.conectividade], ue)
+        return lam.reshape(self.u.shape), sensibilidade_atrito, sensibilidade_dureza
+
+    def velocidade_media(self, u=None):
+        """Média vertical de u em cada coluna (regra do trapézio em sigma)."""
+        u = self.u if u is None else u
+        pesos = np.full(self.n_camadas + 1, 1.0 / self.n_camadas)
+        pesos[[0, -1]] *= 0.5
+        return u @ pesos
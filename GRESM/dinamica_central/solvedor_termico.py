@@ -15,6 +15,8 @@ import math
 import random
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union
+from GRESM.dinamica_central.tabela_arrhenius import TabelaArrhenius, SEGUNDOS_POR_ANO
+from GRESM.dinamica_central.cache_cinematica import CacheCinematica
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +46,11 @@ class SolvedorTermico(SolvedorTermicoBase):
             "rho_i": 917.0,
             "rho_w": 1000.0,
             "L_f": 3.34e5,
-            "cp": 2097.0
+            "cp": 2097.0,
+            "k_gelo": 2.1,
+            "beta_clausius": 9.8e-8,
+            "espessura_minima": 10.0,
+            "colunas_por_bloco": 16384
         }
         
         self.inicializar()
@@ -101,6 +107,200 @@ class SolvedorTermico(SolvedorTermicoBase):
             return 0.0
         
 
+    def aquecimento_deformacao(self, deformacao_quadrado, temperatura, pressao=None, n=3.0,
+                               regularizacao=1e-10, out=None):
+        """
+        Aquecimento por deformação 2 eta e^2 = B(T*) (e^2 + e0^2)^((1+n)/(2n)) em
+        J m^-3 a^-1, com a dureza B da tabela de Arrhenius compartilhada (a mesma
+        da reologia e da viscosidade). `deformacao_quadrado` em a^-2 (ou a
+        CacheCinematica da iteração), `temperatura` em °C e `pressao` (Pa) opcional.
+        """
+        self._status = "COMPUTING_AQUECIMENTO_DEFORMACAO"
+        try:
+            if isinstance(deformacao_quadrado, CacheCinematica):
+                deformacao_quadrado = deformacao_quadrado.deformacao_quadrado()
+            out = np.add(deformacao_quadrado, regularizacao, out=out)
+            np.power(out, (1.0 + n) / (2.0 * n), out=out)
+            out *= TabelaArrhenius.compartilhada(n=n).dureza(temperatura, pressao)
+            return out
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def evoluir_colunas(self, temperatura, espessura, temp_superficie, fluxo_geotermico, dt,
+                        velocidade_vertical=None, aquecimento=None, sigma=None, out=None):
+        """
+        Passo implícito (Euler regressivo) de difusão e advecção vertical em todas
+        as colunas de gelo de uma vez.
+
+        `temperatura` (°C) tem forma (n_niveis, ...): o primeiro eixo são os níveis
+        sigma da base (0) à superfície (1) e os demais eixos as colunas, de modo
+        que cada nível é contíguo e o algoritmo de Thomas varre os níveis
+        vetorizado sobre as colunas. `espessura` (m), `temp_superficie` (°C) e
+        `fluxo_geotermico` (W m^-2) têm a forma das colunas ou são escalares;
+        `velocidade_vertical` (m/a, positiva para cima) e `aquecimento`
+        (J m^-3 a^-1, p.ex. de `aquecimento_deformacao`) têm a forma de
+        `temperatura`. Unidades de tempo em anos.
+
+        Contornos: superfície em min(T_s, 0); base com fluxo geotérmico
+        (Neumann) enquanto fria e no ponto de fusão sob pressão (Dirichlet)
+        enquanto temperada, com troca de regime coluna a coluna. Todo o perfil é
+        limitado ao ponto de fusão sob pressão. O derretimento basal (m/a de gelo)
+        das colunas temperadas fica em `self.derretimento_basal` e a máscara em
+        `self.base_temperada`.
+        """
+        self._status = "COMPUTING_EVOLUIR_COLUNAS"
+        try:
+            T_antiga = np.asarray(temperatura, dtype=np.float64)
+            n_niveis = T_antiga.shape[0]
+            forma_colunas = T_antiga.shape[1:]
+            T_antiga = T_antiga.reshape(n_niveis, -1)
+            if out is not None and np.shares_memory(out, T_antiga):
+                # Passo no lugar: o estado antigo ainda é lido ao revarrer colunas
+                T_antiga = T_antiga.copy()
+            n_colunas = T_antiga.shape[1]
+            sigma = np.linspace(0.0, 1.0, n_niveis) if sigma is None else np.asarray(sigma, dtype=np.float64)
+
+            def _colunas(campo):
+                return np.broadcast_to(np.asarray(campo, dtype=np.float64), forma_colunas).reshape(n_colunas)
+
+            def _niveis(campo):
+                return None if campo is None else np.asarray(campo, dtype=np.float64).reshape(n_niveis, n_colunas)
+
+            H = _colunas(espessura)
+            fino = H < self._params["espessura_minima"]
+            H_calc = np.maximum(H, self._params["espessura_minima"])
+            T_sup = np.minimum(_colunas(temp_superficie), 0.0)
+            G = _colunas(fluxo_geotermico)
+            w, fonte = _niveis(velocidade_vertical), _niveis(aquecimento)
+
+            # Ponto de fusão sob pressão em cada nível (°C)
+            p = self._params
+            T_fusao = -p["beta_clausius"] * p["rho_i"] * p["g"] * np.multiply.outer(1.0 - sigma, H_calc)
+
+            if out is None:
+                out = np.empty(T_antiga.shape)
+            T = out.reshape(n_niveis, n_colunas)
+            if not np.shares_memory(T, out):
+                raise ValueError("`out` precisa admitir a visão (n_niveis, n_colunas) sem cópia")
+
+            # Regime basal inicial: o do passo anterior
+            temperada = T_antiga[0] >= T_fusao[0] - 1e-6
+            self._varrer_colunas(T_antiga, H_calc, T_sup, G, T_fusao, w, fonte, sigma, dt, temperada, T)
+            derretimento = self._fluxo_basal_liquido(T, H_calc, G, sigma)
+
+            # Colunas que trocam de regime (fria acima da fusão / temperada recongelando)
+            troca = np.where((~temperada & (T[0] > T_fusao[0])) | (temperada & (derretimento < 0.0)))[0]
+            if troca.size:
+                temperada[troca] = ~temperada[troca]
+                sub = lambda campo: None if campo is None else campo[:, troca]
+                T_troca = np.empty((n_niveis, troca.size))
+                self._varrer_colunas(T_antiga[:, troca], H_calc[troca], T_sup[troca], G[troca],
+                                     T_fusao[:, troca], sub(w), sub(fonte), sigma, dt, temperada[troca], T_troca)
+                T[:, troca] = T_troca
+                derretimento[troca] = self._fluxo_basal_liquido(T_troca, H_calc[troca], G[troca], sigma)
+
+            np.minimum(T, T_fusao, out=T)
+            T[:, fino] = T_sup[fino]
+            temperada &= ~fino
+            derretimento[~temperada] = 0.0
+            self.derretimento_basal = np.maximum(derretimento, 0.0).reshape(forma_colunas)
+            self.base_temperada = temperada.reshape(forma_colunas)
+            return out
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def _varrer_colunas(self, T_antiga, H, T_sup, G, T_fusao, w, fonte, sigma, dt, temperada, T):
+        """Thomas em blocos de `colunas_por_bloco` colunas (T e c' do bloco cabem na cache)."""
+        tamanho = int(self._params["colunas_por_bloco"])
+        for a in range(0, T_antiga.shape[1], tamanho):
+            b = slice(a, a + tamanho)
+            sub = lambda campo: None if campo is None else campo[:, b]
+            self._varrer_bloco(T_antiga[:, b], H[b], T_sup[b], G[b], T_fusao[:, b], sub(w), sub(fonte),
+                               sigma, dt, temperada[b], T[:, b])
+        return T
+
+    def _varrer_bloco(self, T_antiga, H, T_sup, G, T_fusao, w, fonte, sigma, dt, temperada, T):
+        """
+        Thomas vetorizado sobre as colunas do bloco: os coeficientes de cada nível
+        são gerados durante a varredura em linhas de trabalho reaproveitadas, de
+        modo que só c' ocupa memória (n_niveis, n_colunas); d' vai para `T`.
+        """
+        p = self._params
+        rho_c = p["rho_i"] * p["cp"]
+        kappa = p["k_gelo"] / rho_c * SEGUNDOS_POR_ANO          # m^2/a
+        n_niveis, n_colunas = T_antiga.shape
+        chave = ("thomas_colunas", n_niveis, n_colunas)
+        if chave not in self._cache:
+            self._cache[chave] = (np.empty((n_niveis, n_colunas)),) + \
+                tuple(np.empty(n_colunas) for _ in range(5))
+        c_linha, inferior, superior, diagonal, d, auxiliar = self._cache[chave]
+        inv_H = 1.0 / H
+        inv_H2 = inv_H * inv_H
+        ds = np.diff(sigma)
+
+        # Base: Neumann com fluxo geotérmico (nó fantasma) ou Dirichlet em T_fusao
+        np.multiply(inv_H2, -2.0 * kappa * dt / (ds[0] * ds[0]), out=superior)
+        np.subtract(1.0, superior, out=diagonal)
+        np.multiply(G, inv_H, out=d)
+        d *= 2.0 * dt * SEGUNDOS_POR_ANO / (rho_c * ds[0])
+        d += T_antiga[0]
+        if fonte is not None:
+            d += (dt / rho_c) * fonte[0]
+        np.copyto(diagonal, 1.0, where=temperada)
+        np.copyto(superior, 0.0, where=temperada)
+        np.copyto(d, T_fusao[0], where=temperada)
+        np.divide(superior, diagonal, out=c_linha[0])
+        np.divide(d, diagonal, out=T[0])
+
+        for k in range(1, n_niveis - 1):
+            h_m, h_p = ds[k - 1], ds[k]
+            np.multiply(inv_H2, -2.0 * kappa * dt / (h_m * (h_m + h_p)), out=inferior)
+            np.multiply(inv_H2, -2.0 * kappa * dt / (h_p * (h_m + h_p)), out=superior)
+            np.add(inferior, superior, out=diagonal)
+            np.subtract(1.0, diagonal, out=diagonal)
+            if w is not None:
+                # Upwind implícito: w > 0 usa o nível de baixo, w < 0 o de cima
+                np.maximum(w[k], 0.0, out=auxiliar)
+                auxiliar *= inv_H
+                auxiliar *= dt / h_m
+                inferior -= auxiliar
+                diagonal += auxiliar
+                np.minimum(w[k], 0.0, out=auxiliar)
+                auxiliar *= inv_H
+                auxiliar *= dt / h_p
+                superior += auxiliar
+                diagonal -= auxiliar
+            np.copyto(d, T_antiga[k])
+            if fonte is not None:
+                np.multiply(fonte[k], dt / rho_c, out=auxiliar)
+                d += auxiliar
+            # m = diagonal - inferior c'_{k-1};  d' = (d - inferior d'_{k-1}) / m
+            np.multiply(inferior, c_linha[k - 1], out=auxiliar)
+            diagonal -= auxiliar
+            np.divide(superior, diagonal, out=c_linha[k])
+            np.multiply(inferior, T[k - 1], out=auxiliar)
+            d -= auxiliar
+            np.divide(d, diagonal, out=T[k])
+
+        # Superfície: Dirichlet; substituição regressiva
+        T[-1] = T_sup
+        for k in range(n_niveis - 2, -1, -1):
+            np.multiply(c_linha[k], T[k + 1], out=auxiliar)
+            T[k] -= auxiliar
+        return T
+
+    def _fluxo_basal_liquido(self, T, H, G, sigma):
+        """Taxa de derretimento basal (m/a de gelo) = (G + k dT/dz) / (rho_i L_f)."""
+        p = self._params
+        gradiente = (T[1] - T[0]) / ((sigma[1] - sigma[0]) * H)
+        return (G + p["k_gelo"] * gradiente) * SEGUNDOS_POR_ANO / (p["rho_i"] * p["L_f"])
+
     # ==========================================================================
     # INTERFACE DE EXECUÇÃO
     # ==========================================================================
@@ -0,0 +1,154 @@
+"""
+Módulo: tabela_arrhenius.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Fator de taxa de Glen A(T) = A0 exp(-Q / R T*) tabelado na temperatura
+homóloga T* = T + beta p, com os dois regimes de Cuffey & Paterson (2010):
+A = A* exp(-Q/R (1/T* - 1/T_troca)), Q = 60 kJ/mol abaixo de -10 °C e 115 kJ/mol
+acima, contínuo na troca. A tabela é uniforme em T*, com o nó da troca de regime
+sobre um ponto da grade, e a consulta é uma interpolação linear vetorizada (sem
+exp nem potência fracionária): monótona como A(T*) e com erro relativo limitado
+por construção. A mesma instância serve à reologia, à viscosidade e ao
+aquecimento por deformação (`TabelaArrhenius.compartilhada`).
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+R_GASES = 8.314
+SEGUNDOS_POR_ANO = 31556926.0
+T_FUSAO = 273.15
+
+
+class TabelaArrhenius:
+    """
+    Tabela de A(T*) em Pa^-n a^-1 e da dureza B = A^(-1/n) em Pa a^(1/n).
+
+    Temperaturas de entrada em °C; `pressao` (Pa) opcional desloca o ponto de
+    fusão (beta_clausius em K/Pa). T* é limitado a [t_min, 0 °C]: gelo temperado
+    usa o valor do ponto de fusão e gelo mais frio que `t_min` o valor de `t_min`.
+    O passo da tabela é escolhido para que o erro relativo da interpolação linear
+    fique abaixo de `tolerancia`; `erro_maximo` guarda o erro medido nos pontos
+    médios das células na construção. Os buffers de consulta são guardados para
+    as `formas_em_cache` formas de campo usadas mais recentemente (a instância é
+    compartilhada entre módulos e sobrevive a regradeamentos).
+    """
+
+    _instancias = {}
+
+    def __init__(self, n=3.0, t_min=-80.0, tolerancia=1e-6, beta_clausius=9.8e-8,
+                 A_troca=3.5e-25, Q_frio=60e3, Q_quente=115e3, t_troca=-10.0, formas_em_cache=4):
+        self.n = n
+        self.beta_clausius = beta_clausius
+        self.A_troca = A_troca * SEGUNDOS_POR_ANO
+        self.Q = (Q_frio, Q_quente)
+        self.T_troca = T_FUSAO + t_troca
+        self.tolerancia = tolerancia
+
+        # |A''/A| = |(Q/RT^2)^2 - 2Q/(RT^3)| é máximo no regime quente em 0 °C;
+        # interpolação linear: erro relativo <= h^2/8 |A''/A| (margem 2x para a
+        # variação de A dentro da célula)
+        Q_max = max(self.Q)
+        curvatura = (Q_max / (R_GASES * T_FUSAO**2))**2
+        h = np.sqrt(4.0 * tolerancia / curvatura)
+        # Passo submúltiplo dos dois trechos para que T_troca seja um nó
+        por_trecho = int(np.ceil((T_FUSAO - self.T_troca) / h))
+        self.passo = (T_FUSAO - self.T_troca) / por_trecho
+        n_frio = int(np.ceil((self.T_troca - (T_FUSAO + t_min)) / self.passo))
+        self.T_min = self.T_troca - n_frio * self.passo
+        self.temperaturas = self.T_min + self.passo * np.arange(n_frio + por_trecho + 1)
+
+        self.tabela_A = self.avaliar_direto(self.temperaturas - T_FUSAO)
+        self.tabela_B = self.tabela_A ** (-1.0 / n)
+        self._inclinacao_A = np.append(np.diff(self.tabela_A), 0.0)
+        self._inclinacao_B = np.append(np.diff(self.tabela_B), 0.0)
+        self.formas_em_cache = int(formas_em_cache)
+        self._trabalho = OrderedDict()
+
+        meio = self.temperaturas[:-1] + 0.5 * self.passo - T_FUSAO
+        exato = self.avaliar_direto(meio)
+        self.erro_maximo = float(np.max(np.abs(self.fator_taxa(meio) / exato - 1.0)))
+
+    @classmethod
+    def compartilhada(cls, **parametros):
+        """Instância única por conjunto de parâmetros, reaproveitada entre módulos."""
+        chave = tuple(sorted(parametros.items()))
+        if chave not in cls._instancias:
+            cls._instancias[chave] = cls(**parametros)
+        return cls._instancias[chave]
+
+    @property
+    def nbytes(self):
+        return self.tabela_A.nbytes + self.tabela_B.nbytes + \
+            self._inclinacao_A.nbytes + self._inclinacao_B.nbytes
+
+    def temperatura_homologa(self, temperatura, pressao=None):
+        """T* em K (temperatura em °C, pressão em Pa)."""
+        T = np.array(temperatura, dtype=np.float64)
+        T += T_FUSAO
+        if pressao is not None:
+            T += self.beta_clausius * np.asarray(pressao)
+        return T
+
+    def avaliar_direto(self, temperatura, pressao=None):
+        """A(T*) pela exponencial, sem tabela (referência de precisão)."""
+        T = np.minimum(self.temperatura_homologa(temperatura, pressao), T_FUSAO)
+        Q = np.where(T >= self.T_troca, self.Q[1], self.Q[0])
+        return self.A_troca * np.exp(-Q / R_GASES * (1.0 / T - 1.0 / self.T_troca))
+
+    def _buffers(self, forma):
+        """
+        Posição, índice e parcela de trabalho da forma de campo, em cache LRU: a
+        forma menos recentemente usada é descartada além de `formas_em_cache`.
+        """
+        buffers = self._trabalho.get(forma)
+        if buffers is not None:
+            self._trabalho.move_to_end(forma)
+            return buffers
+        buffers = (np.empty(forma), np.empty(forma, dtype=np.intp), np.empty(forma))
+        self._trabalho[forma] = buffers
+        while len(self._trabalho) > max(self.formas_em_cache, 1):
+            self._trabalho.popitem(last=False)
+        return buffers
+
+    def _consultar(self, tabela, inclinacao, temperatura, pressao, out):
+        temperatura = np.asarray(temperatura, dtype=np.float64)
+        posicao, indice, parcela = self._buffers(temperatura.shape)
+        # posição fracionária na tabela: (T + 273.15 + beta p - T_min) / passo
+        np.multiply(temperatura, 1.0 / self.passo, out=posicao)
+        posicao += (T_FUSAO - self.T_min) / self.passo
+        if pressao is not None:
+            np.multiply(pressao, self.beta_clausius / self.passo, out=parcela)
+            posicao += parcela
+        np.clip(posicao, 0.0, tabela.size - 1, out=posicao)
+        np.copyto(indice, posicao, casting="unsafe")
+        posicao -= indice
+        if out is None:
+            out = np.empty(temperatura.shape)
+        # índices já limitados ao intervalo: 'wrap' dispensa a verificação de limites
+        np.take(inclinacao, indice, out=out, mode="wrap")
+        out *= posicao
+        out += np.take(tabela, indice, out=parcela, mode="wrap")
+        return out if out.ndim else out[()]
+
+    def fator_taxa(self, temperatura, pressao=None, out=None):
+        """A(T*) interpolado (Pa^-n a^-1)."""
+        return self._consultar(self.tabela_A, self._inclinacao_A, temperatura, pressao, out)
+
+    def dureza(self, temperatura, pressao=None, out=None):
+        """B(T*) = A^(-1/n) interpolado (Pa a^(1/n)), sem potência fracionária por célula."""
+        return self._consultar(self.tabela_B, self._inclinacao_B, temperatura, pressao, out)
+
+    def relatorio_precisao(self, n_amostras=100000, semente=0):
+        """Erro relativo máximo e médio contra a exponencial em T aleatórias no domínio."""
+        gerador = np.random.default_rng(semente)
+        temperatura = gerador.uniform(self.T_min - T_FUSAO, 0.0, n_amostras)
+        erro_A = np.abs(self.fator_taxa(temperatura) / self.avaliar_direto(temperatura) - 1.0)
+        erro_B = np.abs(self.dureza(temperatura) / self.avaliar_direto(temperatura) ** (-1.0 / self.n) - 1.0)
+        return {'nos': self.temperaturas.size, 'passo_K': self.passo, 'bytes': self.nbytes,
+                'erro_A_max': erro_A.max(), 'erro_A_medio': erro_A.mean(),
+                'erro_B_max': erro_B.max(), 'erro_B_medio': erro_B.mean(),
+                'monotona': bool(np.all(np.diff(self.tabela_A) > 0))}
@@ -99,6 +99,85 @@ class TensorTensao(TensorTensaoBase):
             self._tratar_erro_execucao(e)
             # Retorno de segurança
             return 0.0
+
+    def deformacao_efetiva_quadrado(self, dudx, dudz):
+        """
+        Quadrado da taxa de deformação efetiva da aproximação de primeira ordem
+        em plano de fluxo (x, z): e^2 = (du/dx)^2 + (du/dz)^2 / 4.
+        """
+        self._status = "COMPUTING_DEFORMACAO_EFETIVA_QUADRADO"
+        try:
+            return dudx * dudx + 0.25 * dudz * dudz
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def deformacao_efetiva_quadrado_planta(self, dudx, dudy, dvdx, dvdy):
+        """
+        e^2 = 1/2 e_ij e_ij em planta com e_zz = -(e_xx + e_yy):
+        e_xx^2 + e_yy^2 + e_xx e_yy + e_xy^2.
+        """
+        self._status = "COMPUTING_DEFORMACAO_EFETIVA_QUADRADO_PLANTA"
+        try:
+            cisalhamento = 0.5 * (dudy + dvdx)
+            return dudx * dudx + dvdy * dvdy + dudx * dvdy + cisalhamento * cisalhamento
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def componentes_primeira_ordem(self, viscosidade, dudx, dudz):
+        """Tensões desviadoras (tau_xx, tau_xz) = (2 eta du/dx, eta du/dz) em plano de fluxo."""
+        self._status = "COMPUTING_COMPONENTES_PRIMEIRA_ORDEM"
+        try:
+            return 2 * viscosidade * dudx, viscosidade * dudz
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def componentes_planta(self, viscosidade, dudx, dudy, dvdx, dvdy):
+        """
+        Tensões desviadoras em planta (tau_xx, tau_yy, tau_xy) = (2 eta e_xx,
+        2 eta e_yy, eta (du/dy + dv/dx)) a partir dos gradientes de velocidade
+        (campos da grade); tau_zz = -(tau_xx + tau_yy) pela incompressibilidade.
+        """
+        self._status = "COMPUTING_COMPONENTES_PLANTA"
+        try:
+            return 2 * viscosidade * dudx, 2 * viscosidade * dvdy, viscosidade * (dudy + dvdx)
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def tensoes_principais(self, tensao_xx, tensao_yy, tensao_xy, direcao=False):
+        """
+        Autovalores (sigma_1 >= sigma_2) do tensor simétrico 2x2 em planta em
+        todas as células de uma vez, pela forma fechada
+        sigma_1,2 = (s_xx + s_yy)/2 +- sqrt(((s_xx - s_yy)/2)^2 + s_xy^2):
+        mesma decomposição de np.linalg.eigvalsh sem montar (n, 2, 2) nem
+        chamar o LAPACK por célula. Com `direcao`, devolve também o ângulo
+        (rad, a partir de x) do eixo de sigma_1.
+        """
+        self._status = "COMPUTING_TENSOES_PRINCIPAIS"
+        try:
+            media = 0.5 * (tensao_xx + tensao_yy)
+            semi_diferenca = 0.5 * (tensao_xx - tensao_yy)
+            raio = np.hypot(semi_diferenca, tensao_xy)
+            principais = (media + raio, media - raio)
+            if direcao:
+                return principais + (0.5 * np.arctan2(tensao_xy, semi_diferenca),)
+            return principais
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
         
 
     # ==========================================================================
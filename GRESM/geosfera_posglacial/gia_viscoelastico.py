@@ -85,15 +85,22 @@ class GiaViscoelastico(GiaViscoelasticoBase):
     # LÓGICA CORE (ESPECÍFICA DO MÓDULO)
     # ==========================================================================
 
-    def calcular_erguimento(self, tempo, carga):
-        """Implementação específica: calcular_erguimento"""
+    def calcular_erguimento(self, tempo, carga, out=None):
+        """
+        Implementação específica: calcular_erguimento
+
+        `carga` pode ser escalar (carga média) ou um campo em planta; com `out`
+        o campo de erguimento é escrito sem alocação.
+        """
         self._status = "COMPUTING_CALCULAR_ERGUIMENTO"
         try:
             # Validação
             # self._validar_entradas( tempo)
             
             # Kernel Físico/Lógico
-            return 1.0 * (1 - np.exp(-tempo/5000.0)) * (carga/1e15)
+            if out is None:
+                return 1.0 * (1 - np.exp(-tempo/5000.0)) * (carga/1e15)
+            return np.multiply(carga, 1.0 * (1 - np.exp(-tempo/5000.0)) / 1e15, out=out)
             
         except Exception as e:
             self._tratar_erro_execucao(e)
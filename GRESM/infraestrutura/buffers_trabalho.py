@@ -0,0 +1,72 @@
+"""
+Módulo: buffers_trabalho.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Memória de trabalho do passo de tempo fundido: todos os campos intermediários
+são alocados uma única vez com a forma da grade e reescritos a cada passo.
+"""
+
+import tracemalloc
+import numpy as np
+
+
+class BuffersTrabalho:
+    """
+    Conjunto de arrays de trabalho com a forma da grade.
+
+    Os nomes seguem as variáveis do laço de SimulacaoGRESM.rodar; `trabalho_pdd`
+    é o espaço de rascunho do motor de graus-dia e `auxiliar` serve de temporário
+    genérico para os kernels com `out=`.
+    """
+
+    CAMPOS = ('temp_local', 'derretimento', 'balanco', 'declividade',
+              'velocidade', 'fluxo', 'div_fluxo', 'auxiliar')
+    # Grade em planta (y, x): componentes vetoriais e campo de erguimento do GIA
+    CAMPOS_2D = ('declividade_y', 'velocidade_x', 'velocidade_y', 'fluxo_y', 'erguimento')
+
+    def __init__(self, forma, dtype=np.float64):
+        self.forma = (int(forma),) if np.isscalar(forma) else tuple(forma)
+        self.campos = self.CAMPOS + (self.CAMPOS_2D if len(self.forma) == 2 else ())
+        for nome in self.campos:
+            setattr(self, nome, np.zeros(self.forma, dtype=dtype))
+        self.trabalho_pdd = tuple(np.zeros(self.forma, dtype=dtype) for _ in range(4))
+
+    @property
+    def nbytes(self):
+        """Memória total reservada (bytes)."""
+        return sum(getattr(self, nome).nbytes for nome in self.campos) + \
+            sum(a.nbytes for a in self.trabalho_pdd)
+
+
+def medir_alocacao(funcao_passo, n_aquecimento=3, n_medidos=20):
+    """
+    Mede com tracemalloc a memória alocada por `funcao_passo()` em regime.
+
+    Após `n_aquecimento` chamadas (caches e buffers preguiçosos), executa
+    `n_medidos` passos e retorna o crescimento líquido da memória rastreada e o
+    maior pico transitório dentro de um passo, ambos em bytes.
+    """
+    ja_ativo = tracemalloc.is_tracing()
+    if not ja_ativo:
+        tracemalloc.start()
+    try:
+        # O aquecimento também é rastreado: objetos Python reciclados por listas
+        # livres do interpretador não aparecem como crescimento espúrio.
+        for _ in range(n_aquecimento):
+            funcao_passo()
+        inicial, _ = tracemalloc.get_traced_memory()
+        pico_passo = 0
+        for _ in range(n_medidos):
+            antes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            funcao_passo()
+            _, pico = tracemalloc.get_traced_memory()
+            pico_passo = max(pico_passo, pico - antes)
+        final, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not ja_ativo:
+            tracemalloc.stop()
+
+    return {'crescimento_bytes': final - inicial, 'pico_passo_bytes': pico_passo}
@@ -18,6 +18,44 @@ from typing import Dict, Any, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+
+class ComponenteAgendado:
+    """
+    Componente acoplado com intervalo próprio.
+
+    `funcao(t)` é avaliada nos instantes k * intervalo; entre avaliações o valor
+    é mantido ("manter") ou interpolado linearmente até a avaliação seguinte
+    ("interpolar", que avalia também t_k + intervalo e portanto só serve a
+    forçantes que dependem apenas do tempo e retornam objetos novos).
+    """
+
+    MODOS = ("manter", "interpolar")
+
+    def __init__(self, nome, funcao, intervalo, modo="manter"):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de acoplamento desconhecido: {modo}")
+        self.nome = nome
+        self.funcao = funcao
+        self.intervalo = float(intervalo)
+        self.modo = modo
+        self.t_atualizacao = None
+        self.valor = None
+        self.valor_seguinte = None
+        self.t_seguinte = None
+        self.avaliacoes = 0
+        self.segundos = 0.0
+
+    def avaliar(self, t):
+        inicio = time.perf_counter()
+        valor = self.funcao(t)
+        self.segundos += time.perf_counter() - inicio
+        self.avaliacoes += 1
+        return valor
+
+    def vencido(self, t):
+        return self.t_atualizacao is None or t >= self.t_atualizacao + self.intervalo - 1e-9
+
+
 class DriverPrincipalBase(ABC):
     """Classe base abstrata para DriverPrincipal."""
     @abstractmethod
@@ -46,6 +84,9 @@ class DriverPrincipal(DriverPrincipalBase):
             "L_f": 3.34e5,
             "cp": 2097.0
         }
+
+        # Componentes do agendador multitaxa, na ordem de registro
+        self._componentes = {}
         
         self.inicializar()
 
@@ -85,20 +126,114 @@ class DriverPrincipal(DriverPrincipalBase):
     # LÓGICA CORE (ESPECÍFICA DO MÓDULO)
     # ==========================================================================
 
-    def loop_principal(self, t_max):
-        """Implementação específica: loop_principal"""
+    def loop_principal(self, t_max, dt=1.0):
+        """
+        Instantes do laço principal: um por intervalo de forçantes `dt`.
+
+        Cada componente registrado é avaliado no seu próprio intervalo (ver
+        registrar_componente), não a cada instante deste laço.
+        """
         self._status = "COMPUTING_LOOP_PRINCIPAL"
         try:
-            # Validação
-            # self._validar_entradas( t_max)
-            
-            # Kernel Físico/Lógico
-            return [i for i in range(t_max)]
+            return np.arange(0.0, t_max, dt)
             
         except Exception as e:
             self._tratar_erro_execucao(e)
             # Retorno de segurança
             return 0.0
+
+    def registrar_componente(self, nome, funcao, intervalo, modo="manter"):
+        """
+        Registra `funcao(t)` como componente acoplado a cada `intervalo` anos.
+
+        Exemplos: GIA a cada 10-100 anos (manter), forçantes escalares anuais
+        (interpolar), SMB em subintervalos do passo da dinâmica (media_intervalo).
+        A dinâmica do gelo não é registrada: seu passo é adaptativo
+        (IntegradorTemporalDinamica.subciclar).
+        """
+        self._componentes[nome] = ComponenteAgendado(nome, funcao, intervalo, modo)
+
+    def obter(self, nome, t):
+        """
+        Valor do componente `nome` no instante `t`.
+
+        A função só é avaliada quando `t` alcança a próxima atualização
+        agendada (múltiplo do intervalo); caso contrário o valor anterior é
+        mantido ou interpolado.
+        """
+        self._status = "COMPUTING_OBTER"
+        try:
+            c = self._componentes[nome]
+            if c.vencido(t):
+                c.t_atualizacao = math.floor(t / c.intervalo + 1e-9) * c.intervalo
+                if c.modo == "interpolar":
+                    # A avaliação seguinte da janela anterior é reaproveitada
+                    reaproveitar = c.t_seguinte is not None and abs(c.t_seguinte - c.t_atualizacao) < 1e-9
+                    c.valor = c.valor_seguinte if reaproveitar else c.avaliar(c.t_atualizacao)
+                    c.valor_seguinte = c.avaliar(c.t_atualizacao + c.intervalo)
+                    c.t_seguinte = c.t_atualizacao + c.intervalo
+                else:
+                    c.valor = c.avaliar(c.t_atualizacao)
+            if c.modo == "interpolar":
+                fracao = (t - c.t_atualizacao) / c.intervalo
+                return c.valor + fracao * (c.valor_seguinte - c.valor)
+            return c.valor
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def media_intervalo(self, nome, t0, t1, out=None):
+        """
+        Média do componente `nome` sobre [t0, t1), p.ex. o SMB ao longo de um
+        passo longo da dinâmica.
+
+        Com intervalo menor que a janela, a função é avaliada nos instantes do
+        seu próprio agendamento dentro dela e os valores são promediados (em
+        `out`, se fornecido, sem alocar). Com intervalo maior, equivale a
+        obter(nome, t0): o valor é mantido entre atualizações.
+        """
+        self._status = "COMPUTING_MEDIA_INTERVALO"
+        try:
+            c = self._componentes[nome]
+            primeiro = math.ceil(t0 / c.intervalo - 1e-9)
+            instantes = np.arange(primeiro, math.ceil(t1 / c.intervalo - 1e-9)) * c.intervalo
+            if instantes.size <= 1 or c.modo == "interpolar":
+                valor = self.obter(nome, t0)
+                if out is None:
+                    return valor
+                out[...] = valor
+                return out
+
+            soma = out
+            for k, t in enumerate(instantes):
+                valor = c.avaliar(t)
+                if soma is None:
+                    soma = np.array(valor, dtype=np.float64)
+                elif k == 0:
+                    soma[...] = valor
+                else:
+                    soma += valor
+            soma /= instantes.size
+            c.t_atualizacao, c.valor = instantes[-1], soma
+            return soma
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def reiniciar_agendamento(self):
+        """Esquece valores e estatísticas dos componentes (início de uma rodada)."""
+        for c in self._componentes.values():
+            c.t_atualizacao = c.valor = c.valor_seguinte = c.t_seguinte = None
+            c.avaliacoes, c.segundos = 0, 0.0
+
+    def relatorio_componentes(self):
+        """{nome: {'intervalo', 'avaliacoes', 'segundos'}} acumulado desde o registro."""
+        return {nome: {'intervalo': c.intervalo, 'avaliacoes': c.avaliacoes, 'segundos': c.segundos}
+                for nome, c in self._componentes.items()}
         
 
     # ==========================================================================
@@ -0,0 +1,174 @@
+"""
+Módulo: estado_sigma.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Estado 3D em camadas sigma que acompanham o terreno (sigma = 0 na base, 1 na
+superfície). Cada campo é exposto sempre com índices lógicos (nível, y, x), mas o
+armazenamento tem ordem de memória configurável:
+
+- "camadas": (nível, y, x) contíguo; cada camada é um bloco contínuo. É a ordem
+  dos estênceis em planta e também dos solvedores de coluna em lote
+  (SolvedorTermico/SolvedorEntalpia.evoluir_colunas varrem os níveis com cada
+  operação vetorizada sobre as colunas, lendo uma camada por vez).
+- "colunas": (y, x, nível) contíguo; cada coluna é um bloco contínuo, para
+  kernels que percorrem uma coluna de cada vez (perfis, idade, fábrica).
+
+Todas as visões são sem cópia; a troca de ordem (`reordenar`) é a única cópia e
+reaproveita um buffer alternativo alocado uma vez por campo.
+"""
+
+import numpy as np
+
+ORDENS = ("camadas", "colunas")
+
+
+class EstadoSigma:
+    """
+    Campos (n_niveis, ny, nx) sobre os níveis `sigma`.
+
+    `forma_planta` é (ny, nx) (ou (nx,) em transecto); `sigma` são os níveis em
+    [0, 1] ou um inteiro com o número de camadas (níveis uniformes). O contador
+    `transposicoes` registra as cópias feitas por `reordenar`.
+    """
+
+    def __init__(self, forma_planta, sigma=10, campos=(), ordem="camadas", dtype=np.float64):
+        if ordem not in ORDENS:
+            raise ValueError(f"Ordem de memória desconhecida: '{ordem}' (use {ORDENS})")
+        self.forma_planta = (int(forma_planta),) if np.isscalar(forma_planta) else tuple(forma_planta)
+        self.sigma = np.linspace(0.0, 1.0, int(sigma) + 1) if np.isscalar(sigma) else \
+            np.asarray(sigma, dtype=np.float64)
+        if self.sigma[0] != 0.0 or self.sigma[-1] != 1.0 or np.any(np.diff(self.sigma) <= 0):
+            raise ValueError("Níveis sigma devem crescer de 0 (base) a 1 (superfície)")
+        self.dtype = np.dtype(dtype)
+        self.ordem = ordem
+        self.transposicoes = 0
+        self._dados = {}
+        self._alternativos = {}
+        for nome in campos:
+            self.adicionar_campo(nome)
+
+    @property
+    def n_niveis(self):
+        return self.sigma.size
+
+    @property
+    def forma(self):
+        """Forma lógica dos campos: (n_niveis, *forma_planta)."""
+        return (self.n_niveis,) + self.forma_planta
+
+    @property
+    def nomes(self):
+        return list(self._dados)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in self._dados.values())
+
+    # ==========================================================================
+    # ARMAZENAMENTO
+    # ==========================================================================
+
+    def _forma_armazenada(self, ordem):
+        return self.forma if ordem == "camadas" else self.forma_planta + (self.n_niveis,)
+
+    def _logica(self, armazenado, ordem):
+        """Visão (nível, y, x) do array armazenado na `ordem` dada."""
+        if ordem == "camadas":
+            return armazenado
+        return np.moveaxis(armazenado, -1, 0)
+
+    def adicionar_campo(self, nome, valor=0.0):
+        """Aloca o campo `nome` na ordem corrente, preenchido com `valor` (escalar ou (n_niveis, ...))."""
+        if nome in self._dados:
+            raise ValueError(f"Campo '{nome}' já existe")
+        self._dados[nome] = np.empty(self._forma_armazenada(self.ordem), dtype=self.dtype)
+        self.campo(nome)[...] = valor
+        return self.campo(nome)
+
+    def campo(self, nome):
+        """Visão lógica (n_niveis, ...) sem cópia; escrever nela altera o estado."""
+        return self._logica(self._dados[nome], self.ordem)
+
+    __getitem__ = campo
+
+    def __setitem__(self, nome, valor):
+        self.campo(nome)[...] = valor
+
+    def armazenado(self, nome):
+        """O array contíguo subjacente, na forma da ordem corrente."""
+        return self._dados[nome]
+
+    def reordenar(self, ordem):
+        """
+        Passa todos os campos para a `ordem` dada (uma cópia por campo, no buffer
+        alternativo reaproveitado). As visões obtidas antes continuam apontando
+        para o armazenamento antigo: obtenha-as de novo após reordenar.
+        """
+        if ordem not in ORDENS:
+            raise ValueError(f"Ordem de memória desconhecida: '{ordem}' (use {ORDENS})")
+        if ordem == self.ordem:
+            return
+        forma = self._forma_armazenada(ordem)
+        for nome, atual in self._dados.items():
+            destino = self._alternativos.get(nome)
+            if destino is None or destino.shape != forma:
+                destino = np.empty(forma, dtype=self.dtype)
+            np.copyto(self._logica(destino, ordem), self._logica(atual, self.ordem))
+            self._alternativos[nome] = atual
+            self._dados[nome] = destino
+            self.transposicoes += 1
+        self.ordem = ordem
+
+    # ==========================================================================
+    # VISÕES
+    # ==========================================================================
+
+    def camada(self, nome, k):
+        """Camada k (forma_planta), contígua na ordem "camadas"."""
+        return self.campo(nome)[k]
+
+    def coluna(self, nome, *indice_planta):
+        """Perfil vertical (n_niveis,) na posição em planta dada, contíguo na ordem "colunas"."""
+        return self.campo(nome)[(slice(None),) + tuple(indice_planta)]
+
+    def niveis_colunas(self, nome):
+        """
+        Visão (n_niveis, n_colunas) para os solvedores de coluna em lote; sem
+        cópia nas duas ordens (em "colunas" com passo n_niveis entre colunas).
+        """
+        return self.campo(nome).reshape(self.n_niveis, -1)
+
+    def colunas_niveis(self, nome):
+        """Visão (n_colunas, n_niveis): uma coluna por linha, contígua na ordem "colunas"."""
+        return self.niveis_colunas(nome).T
+
+    def e_contiguo(self, acesso):
+        """Se o `acesso` ("camada" ou "coluna") lê memória contínua na ordem corrente."""
+        if acesso not in ("camada", "coluna"):
+            raise ValueError(f"Acesso desconhecido: '{acesso}'")
+        return (acesso == "camada") == (self.ordem == "camadas")
+
+    # ==========================================================================
+    # GEOMETRIA SIGMA
+    # ==========================================================================
+
+    def elevacao_niveis(self, leito, espessura):
+        """Elevação z (n_niveis, ...) de cada nível: leito + sigma H."""
+        return np.asarray(leito) + np.multiply.outer(self.sigma, np.asarray(espessura))
+
+    def pesos_verticais(self):
+        """Pesos da regra do trapézio em sigma (somam 1)."""
+        ds = np.diff(self.sigma)
+        pesos = np.zeros(self.n_niveis)
+        pesos[:-1] += 0.5 * ds
+        pesos[1:] += 0.5 * ds
+        return pesos
+
+    def media_vertical(self, nome):
+        """Média na vertical (forma_planta) pela regra do trapézio, sem cópia do campo."""
+        pesos = self.pesos_verticais()
+        if self.ordem == "camadas":
+            return np.tensordot(pesos, self._dados[nome], axes=(0, 0))
+        return self._dados[nome] @ pesos
@@ -27,6 +27,41 @@ class ParametrizacaoGroelandia:
                   
         return forma_bacia + fiordes
 
+    @staticmethod
+    def _fiordes(coord, L):
+        """Fiordes de alta frequência que decaem a partir das duas bordas do eixo."""
+        return 200 * np.sin(coord * 2 * np.pi / 50.0) * np.exp(-coord/100) + \
+               200 * np.sin(coord * 2 * np.pi / 50.0) * np.exp(-(L-coord)/100)
+
+    @staticmethod
+    def obter_topografia_leito_2d(x_grid, y_grid, Lx=800.0, Ly=1500.0):
+        """
+        Leito rochoso em planta (y, x), extensão do modelo "Bowl" 1D.
+
+        y (km, 0 a Ly) é o eixo N-S do transecto 1D e x (km, 0 a Lx) o eixo L-O.
+        A bacia é elíptica, 800 r^2 - 300 com r^2 = ((x-Lx/2)/(Lx/2))^2 + ((y-Ly/2)/(Ly/2))^2,
+        e os fiordes acompanham as quatro bordas. `x_grid` e `y_grid` podem ser
+        vetores (nx,) e (ny,) ou campos completos; o resultado tem forma (ny, nx).
+        """
+        x = np.asarray(x_grid)
+        y = np.asarray(y_grid)
+        if x.ndim == 1 and y.ndim == 1:
+            x, y = x[None, :], y[:, None]
+        r2 = ((x - Lx/2) / (Lx/2))**2 + ((y - Ly/2) / (Ly/2))**2
+        forma_bacia = 800 * r2 - 300
+        return forma_bacia + ParametrizacaoGroelandia._fiordes(y, Ly) + \
+            ParametrizacaoGroelandia._fiordes(x, Lx)
+
+    @staticmethod
+    def obter_espessura_inicial_2d(x_grid, y_grid, Lx=800.0, Ly=1500.0):
+        """Domo elíptico de 3000 m (igual ao perfil 1D ao longo de x = Lx/2)."""
+        x = np.asarray(x_grid)
+        y = np.asarray(y_grid)
+        if x.ndim == 1 and y.ndim == 1:
+            x, y = x[None, :], y[:, None]
+        r2 = ((x - Lx/2) / (Lx/2))**2 + ((y - Ly/2) / (Ly/2))**2
+        return np.maximum(3000 * (1 - r2), 0.0)
+
     @staticmethod
     def obter_clima_referencia(x_grid, anos):
         """
@@ -0,0 +1,167 @@
+"""
+Módulo: registro_historico.py
+Projeto: GRESM - Greenland Regional Earth System Model
+Autor: Luiz Tiago Wilcke
+Role: Arquiteto de Software Sênior
+
+Histórico colunar das séries temporais da simulação: uma coluna NumPy tipada por
+diagnóstico, pré-alocada pelo número de passos conhecido ou crescendo em blocos
+em rodadas de duração aberta, com descarga opcional dos blocos cheios em disco.
+"""
+
+import os
+import json
+import numpy as np
+
+
+class RegistroHistorico:
+    """
+    Registro de diagnósticos escalares por passo de tempo.
+
+    Cada diagnóstico é uma função `funcao(contexto) -> escalar` registrada uma vez;
+    `gravar(contexto)` avalia todas e escreve na linha corrente, sem que o laço
+    do driver precise conhecer as variáveis registradas.
+
+    - `n_linhas` conhecido (ex.: len(anos)) e sem `diretorio`: as colunas são
+      alocadas uma única vez com esse tamanho.
+    - `n_linhas=None`: as colunas crescem em blocos de `tamanho_bloco` linhas.
+    - com `diretorio`: a memória guarda apenas um bloco; cada bloco cheio é
+      anexado a `<diretorio>/<nome>.bin` e o manifesto `historico.json` descreve
+      nomes, tipos e número de linhas (ver `carregar`).
+    """
+
+    ARQUIVO_MANIFESTO = "historico.json"
+
+    def __init__(self, n_linhas=None, tamanho_bloco=4096, diretorio=None):
+        self._n_linhas = n_linhas
+        self._tamanho_bloco = int(tamanho_bloco)
+        self._diretorio = diretorio
+        self._diagnosticos = {}
+        self._tipos = {}
+        self._colunas = {}
+        self._linha = 0          # próxima linha livre no bloco em memória
+        self._linhas_disco = 0   # linhas já descarregadas em disco
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+
+    # ==========================================================================
+    # REGISTRO
+    # ==========================================================================
+
+    def registrar_diagnostico(self, nome, funcao, dtype=np.float64):
+        """Registra `funcao(contexto)` como a coluna `nome` (antes do primeiro `gravar`)."""
+        if len(self) > 0:
+            raise ValueError(f"Diagnóstico '{nome}' registrado após o início da gravação")
+        self._diagnosticos[nome] = funcao
+        self._tipos[nome] = np.dtype(dtype)
+
+    @property
+    def nomes(self):
+        return list(self._diagnosticos)
+
+    def __len__(self):
+        return self._linhas_disco + self._linha
+
+    # ==========================================================================
+    # GRAVAÇÃO
+    # ==========================================================================
+
+    def _capacidade_inicial(self):
+        if self._n_linhas is not None and self._diretorio is None:
+            return int(self._n_linhas)
+        if self._n_linhas is not None:
+            return max(1, min(int(self._n_linhas), self._tamanho_bloco))
+        return self._tamanho_bloco
+
+    def _alocar(self):
+        capacidade = self._capacidade_inicial()
+        self._colunas = {nome: np.empty(capacidade, dtype=tipo) for nome, tipo in self._tipos.items()}
+
+    def _bloco_cheio(self):
+        if self._diretorio is not None:
+            self.descarregar()
+            return
+        # Rodada de duração aberta: cresce um bloco por vez
+        for nome, coluna in self._colunas.items():
+            nova = np.empty(coluna.size + self._tamanho_bloco, dtype=coluna.dtype)
+            nova[:coluna.size] = coluna
+            self._colunas[nome] = nova
+
+    def gravar(self, contexto):
+        """Avalia todos os diagnósticos registrados e grava uma linha."""
+        if not self._colunas:
+            self._alocar()
+        elif self._linha == next(iter(self._colunas.values())).size:
+            self._bloco_cheio()
+
+        i = self._linha
+        for nome, funcao in self._diagnosticos.items():
+            self._colunas[nome][i] = funcao(contexto)
+        self._linha += 1
+
+    def descarregar(self):
+        """Anexa as linhas em memória aos arquivos de coluna e esvazia o bloco."""
+        if self._diretorio is None or self._linha == 0:
+            return
+        # O primeiro bloco recria os arquivos, descartando rodadas anteriores
+        modo = "ab" if self._linhas_disco else "wb"
+        for nome, coluna in self._colunas.items():
+            with open(os.path.join(self._diretorio, f"{nome}.bin"), modo) as arquivo:
+                coluna[:self._linha].tofile(arquivo)
+        self._linhas_disco += self._linha
+        self._linha = 0
+        self._escrever_manifesto()
+
+    def _escrever_manifesto(self):
+        manifesto = {
+            "n_linhas": self._linhas_disco,
+            "colunas": {nome: tipo.str for nome, tipo in self._tipos.items()}
+        }
+        with open(os.path.join(self._diretorio, self.ARQUIVO_MANIFESTO), "w") as arquivo:
+            json.dump(manifesto, arquivo)
+
+    def finalizar(self):
+        """Descarrega o bloco parcial (modo em disco)."""
+        self.descarregar()
+
+    # ==========================================================================
+    # LEITURA
+    # ==========================================================================
+
+    def __getitem__(self, nome):
+        """Série completa da coluna `nome` (disco + memória)."""
+        em_memoria = self._colunas[nome][:self._linha] if self._colunas else \
+            np.empty(0, dtype=self._tipos[nome])
+        if self._linhas_disco == 0:
+            return em_memoria
+        caminho = os.path.join(self._diretorio, f"{nome}.bin")
+        em_disco = np.fromfile(caminho, dtype=self._tipos[nome], count=self._linhas_disco)
+        return np.concatenate([em_disco, em_memoria])
+
+    def ultimo(self, nome):
+        """Valor mais recente da coluna `nome`."""
+        if self._linha == 0:
+            tipo = self._tipos[nome]
+            caminho = os.path.join(self._diretorio, f"{nome}.bin")
+            return np.fromfile(caminho, dtype=tipo, count=1,
+                               offset=(self._linhas_disco - 1) * tipo.itemsize)[0]
+        return self._colunas[nome][self._linha - 1]
+
+    def como_dicionario(self, prefixo=""):
+        """Colunas como dicionário de arrays, p.ex. para np.savez(**...)."""
+        return {prefixo + nome: self[nome] for nome in self._diagnosticos}
+
+    @classmethod
+    def carregar(cls, diretorio, mmap=True):
+        """Lê um histórico descarregado em disco (memmap por padrão, sem cópia)."""
+        with open(os.path.join(diretorio, cls.ARQUIVO_MANIFESTO)) as arquivo:
+            manifesto = json.load(arquivo)
+        n = manifesto["n_linhas"]
+        colunas = {}
+        for nome, tipo in manifesto["colunas"].items():
+            caminho = os.path.join(diretorio, f"{nome}.bin")
+            if mmap and n > 0:
+                colunas[nome] = np.memmap(caminho, dtype=np.dtype(tipo), mode="r", shape=(n,))
+            else:
+                colunas[nome] = np.fromfile(caminho, dtype=np.dtype(tipo), count=n)
+        return colunas
@@ -3,6 +3,22 @@ Módulo: hidrologia_englacial.py
 Projeto: GRESM - Greenland Regional Earth System Model
 Autor: Luiz Tiago Wilcke
 Role: Arquiteto de Software Sênior
+
+Transporte englacial da água de superfície até o leito. Os caminhos vêm da
+tensão na superfície: há fendas onde a maior tensão principal (forma fechada de
+TensorTensao.tensoes_principais) passa de `tensao_fenda`, com a profundidade de
+Nye d = 2 sigma_1 / (rho_i g); uma fenda vira moulin (caminho até o leito) quando
+já corta toda a espessura ou quando recebe água bastante para a hidrofratura
+(`vazao_hidrofratura`). O atraso entre a entrada e a chegada ao leito é uma
+cascata de Nash de `n_reservatorios` reservatórios lineares por célula (tempo
+médio `tempo_moulin` ou `tempo_fenda`), aplicada como filtro recursivo
+V <- a V + (1 - a) tau I, a = exp(-dt/tau). A atualização é exata para entrada
+constante no passo só no primeiro reservatório: os seguintes recebem a vazão
+média do anterior no passo, não a sua evolução dentro dele, e o atraso fica
+aproximado em O(dt/tau). O custo é O(células) por passo e o estado são os
+volumes dos reservatórios, sem guardar o histórico da entrada; a água entregue
+é a entrada menos a variação do volume armazenado, então a massa se conserva
+exatamente.
 """
 
 import numpy as np
@@ -16,6 +32,9 @@ import random
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union
 
+from GRESM.dinamica_central.tensor_tensao import TensorTensao
+from GRESM.dinamica_central.cache_cinematica import CacheCinematica
+
 logger = logging.getLogger(__name__)
 
 class HidrologiaEnglacialBase(ABC):
@@ -44,8 +63,17 @@ class HidrologiaEnglacial(HidrologiaEnglacialBase):
             "rho_i": 917.0,
             "rho_w": 1000.0,
             "L_f": 3.34e5,
-            "cp": 2097.0
+            "cp": 2097.0,
+            "tensao_fenda": 1.5e5,
+            "vazao_hidrofratura": 1e6,
+            "tempo_moulin": 1.0 / 365.25,
+            "tempo_fenda": 10.0 / 365.25,
+            "n_reservatorios": 2
         }
+        self._params.update({k: v for k, v in self._config.items() if k in self._params})
+        self.tensor = TensorTensao()
+        # Volumes da cascata (n_reservatorios, *forma), em unidades da entrada x anos
+        self.reservatorios = None
         
         self.inicializar()
 
@@ -85,21 +113,94 @@ class HidrologiaEnglacial(HidrologiaEnglacialBase):
     # LÓGICA CORE (ESPECÍFICA DO MÓDULO)
     # ==========================================================================
 
-    def transporte_vertical(self, input_agua, fendas):
-        """Implementação específica: transporte_vertical"""
+    def campos_drenagem(self, tensao, espessura, entrada, dx, dy=None):
+        """
+        Fendas e moulins a partir da tensão na superfície. `tensao` são as
+        componentes em planta (s_xx, s_yy, s_xy) (Pa) ou a CacheCinematica em
+        planta; `entrada` é a água de superfície (m/a) e dx, dy (m) dão a área
+        da célula para o critério de hidrofratura (m^3/a). Retorna dict com
+        tensao_principal, profundidade_fendas (m, limitada a H), fendas e
+        moulins (booleanos).
+        """
+        self._status = "COMPUTING_CAMPOS_DRENAGEM"
+        try:
+            p = self._params
+            if isinstance(tensao, CacheCinematica):
+                tensao = tensao.tensao_desviadora()
+            s_1, _ = self.tensor.tensoes_principais(*tensao[:3])
+            espessura = np.asarray(espessura, dtype=np.float64)
+            fendas = (s_1 > p["tensao_fenda"]) & (espessura > 0.0)
+            profundidade = np.where(fendas, np.minimum(2.0 * s_1 / (p["rho_i"] * p["g"]), espessura), 0.0)
+            area = dx * (dx if dy is None else dy)
+            moulins = fendas & ((profundidade >= espessura) | (entrada * area >= p["vazao_hidrofratura"]))
+            return {"tensao_principal": s_1, "profundidade_fendas": profundidade,
+                    "fendas": fendas, "moulins": moulins}
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return {}
+
+    def transporte_vertical(self, input_agua, fendas, dt, moulins=None, out=None):
+        """
+        Água entregue ao leito no passo `dt` (a), nas unidades de `input_agua`
+        (p.ex. m/a). `fendas` é a fração da entrada captada (campo booleano de
+        campos_drenagem, fração ou escalar) e `moulins` os caminhos rápidos, que
+        captam toda a entrada; o resto fica na superfície. A entrada captada
+        passa pela cascata de reservatórios (estado em `reservatorios`).
+        """
         self._status = "COMPUTING_TRANSPORTE_VERTICAL"
         try:
-            # Validação
-            # self._validar_entradas( input_agua)
-            
-            # Kernel Físico/Lógico
-            return input_agua * fendas # % que desce
-            
+            p = self._params
+            input_agua = np.asarray(input_agua, dtype=np.float64)
+            captada = input_agua * fendas
+            tempo = p["tempo_fenda"]
+            if moulins is not None:
+                captada = np.where(moulins, input_agua, captada)
+                tempo = np.where(moulins, p["tempo_moulin"], p["tempo_fenda"])
+            n = int(p["n_reservatorios"])
+            if self.reservatorios is None or self.reservatorios.shape[1:] != captada.shape:
+                self.reservatorios = np.zeros((n,) + captada.shape)
+
+            tau = np.divide(tempo, n)
+            a = np.exp(-dt / tau)
+            fluxo = captada
+            for volume in self.reservatorios:
+                novo = a * volume + (1.0 - a) * tau * fluxo
+                # Saída média no passo: entrada - variação do volume (conservativo)
+                fluxo = fluxo - (novo - volume) / dt
+                volume[...] = novo
+            if out is None:
+                return fluxo
+            out[...] = fluxo
+            return out
+
         except Exception as e:
             self._tratar_erro_execucao(e)
             # Retorno de segurança
             return 0.0
-        
+
+    @property
+    def armazenamento(self):
+        """Água em trânsito no sistema englacial (unidades da entrada x anos) por célula."""
+        return 0.0 if self.reservatorios is None else self.reservatorios.sum(axis=0)
+
+    def drenar_para_leito(self, escoamento, tensao, espessura, dt, dx, dy=None, out=None):
+        """
+        Passo completo: fendas e moulins da tensão corrente e entrega ao leito
+        (m/a) do `escoamento` de superfície (m/a), pronta para a `fonte` de
+        HidrologiaSubCanal.evoluir_rede. Retorna (entrega, campos); se
+        campos_drenagem falha, a entrega é nula e `campos` vem vazio.
+        """
+        campos = self.campos_drenagem(tensao, espessura, escoamento, dx, dy)
+        if not campos:
+            # Erro já registrado em campos_drenagem: nada chega ao leito neste passo
+            if out is None:
+                return 0.0, campos
+            out[...] = 0.0
+            return out, campos
+        entrega = self.transporte_vertical(escoamento, campos["fendas"], dt, campos["moulins"], out=out)
+        return entrega, campos
 
     # ==========================================================================
     # INTERFACE DE EXECUÇÃO
@@ -3,9 +3,27 @@ Módulo: hidrologia_sub_canal.py
 Projeto: GRESM - Greenland Regional Earth System Model
 Autor: Luiz Tiago Wilcke
 Role: Arquiteto de Software Sênior
+
+Rede de drenagem subglacial acoplada, distribuída e canalizada (Werder et al.
+2013, GlaDS) sobre a grade em planta: o potencial hidráulico phi e a lâmina de
+cavidades (HidrologiaSubCavidade) vivem nos nós, os canais (seção S) nas arestas
+entre nós vizinhos. A descarga entre nós é K_e (phi_a - phi_b), com K_e a soma
+das condutâncias da lâmina e do canal; o balanço de massa nos nós é então um
+laplaciano de grafo D^T diag(K) D mais o armazenamento englacial, a variação das
+cavidades e dos canais e as fontes. O passo é Euler implícito em phi, com h e S
+dados em forma fechada por seus próprios passos implícitos sob N(phi): Newton
+com o Jacobiano das condutâncias em phi, h e S, e busca linear na norma do
+resíduo; a dissipação que abre os canais usa o phi corrente e a seção do início
+do passo. O padrão esparso (MontagemEsparsa das arestas) e a ordenação da
+fatoração são construídos uma vez por grade, de modo que passos de dias a
+semanas custam poucas fatorações em vez de milhares de subpassos explícitos de
+segundos.
+Nós fora da máscara de gelo são exutórios com phi = phi_m (pressão atmosférica).
 """
 
 import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
 import sys
 import os
 import time
@@ -16,6 +34,11 @@ import random
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union
 
+from GRESM.dinamica_central.montagem_esparsa import MontagemEsparsa
+from GRESM.dinamica_central.tabela_arrhenius import SEGUNDOS_POR_ANO
+from GRESM.processos_superficie.hidrologia_sub_cavidade import (
+    HidrologiaSubCavidade, atualizar_implicito, fechamento_fluencia)
+
 logger = logging.getLogger(__name__)
 
 class HidrologiaSubCanalBase(ABC):
@@ -44,8 +67,20 @@ class HidrologiaSubCanal(HidrologiaSubCanalBase):
             "rho_i": 917.0,
             "rho_w": 1000.0,
             "L_f": 3.34e5,
-            "cp": 2097.0
+            "cp": 2097.0,
+            "A_fluencia": 2.5e-25,
+            "n_glen": 3.0,
+            "k_canal": 0.1,
+            "alfa_canal": 1.25,
+            "beta_canal": 1.5,
+            "l_c": 2.0,
+            "e_v": 1e-3,
+            "gradiente_minimo": 1e-2,
+            "max_iter_rede": 30,
+            "tol_rede": 1e-6
         }
+        self._params.update({k: v for k, v in self._config.items() if k in self._params})
+        self.cavidade = HidrologiaSubCavidade(self._config)
         
         self.inicializar()
 
@@ -85,21 +120,240 @@ class HidrologiaSubCanal(HidrologiaSubCanalBase):
     # LÓGICA CORE (ESPECÍFICA DO MÓDULO)
     # ==========================================================================
 
-    def evoluir_secao(self, S, pressao, melt_parede):
-        """Implementação específica: evoluir_secao"""
+    def _secao_implicita(self, S, abertura, pressao, dt):
+        """Núcleo SI (abertura em m^2/s, dt em s): S após dt e dS/dN."""
+        p = self._params
+        c, dc = fechamento_fluencia(pressao, p["A_fluencia"], p["n_glen"])
+        return atualizar_implicito(S, abertura, 0.0, c, dc, dt)
+
+    def evoluir_secao(self, S, pressao, melt_parede, dt):
+        """
+        Seção dos canais (m^2) após `dt` (a): abertura pelo derretimento das
+        paredes `melt_parede` (m^2/a, dissipação / rho_i L_f) e fechamento por
+        fluência sob a pressão efetiva `pressao` (Pa); Euler implícito.
+        """
         self._status = "COMPUTING_EVOLUIR_SECAO"
         try:
-            # Validação
-            # self._validar_entradas( S)
-            
-            # Kernel Físico/Lógico
-            return S + (melt_parede - S*pressao*1e-5)
-            
+            S_novo, _ = self._secao_implicita(np.asarray(S, dtype=np.float64),
+                                              np.asarray(melt_parede) / SEGUNDOS_POR_ANO,
+                                              pressao, dt * SEGUNDOS_POR_ANO)
+            return S_novo
+
         except Exception as e:
             self._tratar_erro_execucao(e)
             # Retorno de segurança
             return 0.0
-        
+
+    def construir_rede(self, forma, dx, dy=None, mascara=None):
+        """
+        Grafo da grade `forma` (ny, nx) (ou (nx,) em transecto): arestas entre
+        vizinhos em x (comprimento dx, largura dy) e depois em y, o padrão CSR
+        do laplaciano (nós renumerados pela ordenação da fatoração) e a máscara.
+        Refeito apenas quando a forma, o espaçamento ou a máscara mudam.
+        """
+        forma = (1, int(forma)) if np.isscalar(forma) else tuple(forma)
+        if len(forma) == 1:
+            forma = (1,) + forma
+        dy = dx if dy is None else dy
+        gelo = np.ones(forma, dtype=bool) if mascara is None else np.asarray(mascara, dtype=bool).reshape(forma)
+        c = self._cache
+        if c.get("forma") == forma and c.get("espacamento") == (dx, dy) and np.array_equal(c["gelo"], gelo.ravel()):
+            return c
+
+        ny, nx = forma
+        indices = np.arange(ny * nx).reshape(forma)
+        arestas = np.vstack([np.column_stack([indices[:, :-1].ravel(), indices[:, 1:].ravel()]),
+                             np.column_stack([indices[:-1].ravel(), indices[1:].ravel()])])
+        n_x = ny * (nx - 1)
+        em_x = np.arange(arestas.shape[0]) < n_x
+        # Ordenação de pouco preenchimento calculada uma vez, sobre o padrão do
+        # laplaciano, e embutida na numeração da montagem: as fatorações seguintes
+        # usam a ordem natural em vez de refazer a ordenação a cada iteração
+        n_nos = ny * nx
+        padrao = MontagemEsparsa(arestas, n_nos)
+        padrao.montar(np.broadcast_to([[1.0, -1.0], [-1.0, 1.0]], (arestas.shape[0], 2, 2)))
+        padrao.somar_diagonal(np.ones(n_nos))
+        ordem = np.argsort(scipy.sparse.linalg.splu(padrao.matriz.tocsc(), permc_spec="COLAMD").perm_c)
+        posicao = np.argsort(ordem)
+        c.clear()
+        c.update({
+            "forma": forma, "espacamento": (dx, dy), "arestas": arestas,
+            "n_arestas_x": n_x, "comprimento": np.where(em_x, dx, dy).astype(np.float64),
+            "largura": np.where(em_x, dy, dx).astype(np.float64),
+            "area": dx * dy, "gelo": gelo.ravel(), "contorno": ~gelo.ravel(),
+            "ativas": gelo.ravel()[arestas].any(axis=1),
+            "montagem": MontagemEsparsa(posicao[arestas], n_nos),
+            "ordem": ordem, "posicao": posicao, "fatoracoes": 0
+        })
+        return c
+
+    def dividir_arestas(self, valores):
+        """Valores por aresta -> (arestas em x (ny, nx-1), arestas em y (ny-1, nx))."""
+        ny, nx = self._cache["forma"]
+        n_x = self._cache["n_arestas_x"]
+        return valores[:n_x].reshape(ny, nx - 1), valores[n_x:].reshape(ny - 1, nx)
+
+    def _condutancia_canal(self, S, gradiente):
+        """k_c S^alfa_c |grad phi|^(beta_c-2) (m^4 Pa^-1 s^-1), nula nas arestas inativas."""
+        p = self._params
+        modulo = np.maximum(np.abs(gradiente), p["gradiente_minimo"])
+        return (p["k_canal"] * np.maximum(S, 0.0) ** p["alfa_canal"]
+                * modulo ** (p["beta_canal"] - 2.0) * self._cache["ativas"])
+
+    def condutancias(self, potencial, espessura_lamina, secao_canal):
+        """
+        Por aresta: gradiente de phi ao longo da aresta (Pa/m), condutância da
+        lâmina e do canal K (m^3 Pa^-1 s^-1, descarga K (phi_a - phi_b)), fluxo
+        da lâmina q (m^2/s), vazão do canal Q (m^3/s) e dissipação
+        Xi = |Q dphi/ds| + l_c |q dphi/ds| (W/m). Requer construir_rede.
+        """
+        c = self._cache
+        a, b = c["arestas"].T
+        phi = np.asarray(potencial, dtype=np.float64).ravel()
+        h = np.asarray(espessura_lamina, dtype=np.float64).ravel()
+        gradiente = (phi[b] - phi[a]) / c["comprimento"]
+        lamina = self.cavidade.condutancia_lamina(0.5 * (h[a] + h[b]), gradiente) * c["ativas"]
+        canal = self._condutancia_canal(secao_canal, gradiente)
+        q = -lamina * gradiente
+        Q = -canal * gradiente
+        dissipacao = np.abs(Q * gradiente) + self._params["l_c"] * np.abs(q * gradiente)
+        return {"gradiente": gradiente,
+                "K_lamina": lamina * c["largura"] / c["comprimento"],
+                "K_canal": canal / c["comprimento"],
+                "fluxo_lamina": q, "vazao_canal": Q, "dissipacao": dissipacao}
+
+    def evoluir_rede(self, potencial, espessura_lamina, secao_canal, leito, espessura,
+                     velocidade_deslizamento, fonte, dt, dx, dy=None, mascara=None):
+        """
+        Um passo implícito de `dt` (a) da rede acoplada lâmina-canais.
+
+        Nós (forma da grade): `potencial` phi (Pa), `espessura_lamina` h (m),
+        `leito` e `espessura` do gelo (m), `velocidade_deslizamento` (m/a) e
+        `fonte` (m/a de água: derretimento basal + entrada de moulins / área).
+        Arestas: `secao_canal` S (m^2, vetor de construir_rede; None = sem
+        canais). Retorna dict com potencial, espessura_lamina, secao_canal,
+        pressao_efetiva, vazao_canal (m^3/s), fluxo_lamina (m^2/s),
+        descarga_contorno (m^3/s saindo pelos exutórios), iteracoes e
+        convergiu (False, com aviso no log, se `max_iter_rede` se esgota antes
+        de `tol_rede`; o estado devolvido é o último iterado).
+        """
+        self._status = "COMPUTING_EVOLUIR_REDE"
+        try:
+            p = self._params
+            forma = np.shape(potencial)
+            c = self.construir_rede(forma, dx, dy, mascara)
+            a, b = c["arestas"].T
+            ativas, contorno, area, meio = c["ativas"], c["contorno"], c["area"], 0.5 * c["comprimento"]
+            montagem = c["montagem"]
+            n_nos = montagem.n_nos
+            dt_s = dt * SEGUNDOS_POR_ANO
+
+            phi_m = p["rho_w"] * p["g"] * np.asarray(leito, dtype=np.float64).ravel()
+            phi_0 = phi_m + p["rho_i"] * p["g"] * np.asarray(espessura, dtype=np.float64).ravel()
+            u_b = np.broadcast_to(velocidade_deslizamento, forma).ravel() / SEGUNDOS_POR_ANO
+            m = np.broadcast_to(fonte, forma).ravel() / SEGUNDOS_POR_ANO
+            h_ant = np.asarray(espessura_lamina, dtype=np.float64).ravel()
+            S_ant = np.zeros(a.size) if secao_canal is None else np.asarray(secao_canal, dtype=np.float64)
+            phi_ant = np.asarray(potencial, dtype=np.float64).ravel()
+            phi = np.where(contorno, phi_m, phi_ant)
+            armazenamento = area * p["e_v"] / (p["rho_w"] * p["g"] * dt_s)
+            livres = ~contorno
+
+            def balanco(phi):
+                """
+                Resíduo nodal (m^3/s) com h(phi) e S(phi) implícitos; a dissipação
+                usa o phi corrente e a seção do início do passo.
+                """
+                N = phi_0 - phi
+                h, dh_dN = self.cavidade._abertura_implicita(h_ant, u_b, N, dt_s)
+                h[contorno], dh_dN[contorno] = h_ant[contorno], 0.0
+                rede = self.condutancias(phi, h, S_ant)
+                S, dS_dN = self._secao_implicita(S_ant, rede["dissipacao"] / (p["rho_i"] * p["L_f"]),
+                                                 0.5 * (N[a] + N[b]), dt_s)
+                S[~ativas], dS_dN[~ativas] = S_ant[~ativas], 0.0
+                K_canal = self._condutancia_canal(S, rede["gradiente"]) / c["comprimento"]
+                diferenca = phi[a] - phi[b]
+                vazao = (rede["K_lamina"] + K_canal) * diferenca
+                canal = meio * ((S - S_ant) / dt_s - rede["dissipacao"] / (p["rho_w"] * p["L_f"]))
+                residuo = (armazenamento * (phi - phi_ant) + area * ((h - h_ant) / dt_s - m)
+                           + np.bincount(a, weights=vazao + canal, minlength=n_nos)
+                           + np.bincount(b, weights=canal - vazao, minlength=n_nos))
+                return {"residuo": residuo, "norma": np.linalg.norm(residuo[livres]), "rede": rede,
+                        "h": h, "dh_dN": dh_dN, "S": S, "dS_dN": dS_dN, "K_canal": K_canal,
+                        "diferenca": diferenca}
+
+            def jacobiano(estado):
+                """
+                d(resíduo)/d(phi): fluxo K(h, S, |grad phi|) (phi_a - phi_b) derivado
+                em phi, em h e S (via N) e em |grad phi| (fator beta - 1), mais a
+                fluência e o armazenamento. Não simétrico; padrão da montagem.
+                """
+                rede, diferenca = estado["rede"], estado["diferenca"]
+                K_lamina, K_canal = rede["K_lamina"], estado["K_canal"]
+                acima = np.abs(rede["gradiente"]) > p["gradiente_minimo"]
+                d_gradiente = (K_lamina * np.where(acima, self.cavidade._params["beta_lamina"] - 1.0, 1.0)
+                               + K_canal * np.where(acima, p["beta_canal"] - 1.0, 1.0))
+                h, S = estado["h"], estado["S"]
+                h_aresta = 0.5 * (h[a] + h[b])
+                dK_dh = np.divide(self.cavidade._params["alfa_lamina"] * K_lamina, h_aresta,
+                                  out=np.zeros_like(h_aresta), where=h_aresta > 0.0)
+                dK_dS = np.divide(p["alfa_canal"] * K_canal, S, out=np.zeros_like(S), where=S > 0.0)
+                dh_dphi, dS_dphi = -estado["dh_dN"], -0.5 * estado["dS_dN"]
+                d_a = d_gradiente + diferenca * (0.5 * dK_dh * dh_dphi[a] + dK_dS * dS_dphi)
+                d_b = -d_gradiente + diferenca * (0.5 * dK_dh * dh_dphi[b] + dK_dS * dS_dphi)
+                volume_canal = meio * dS_dphi / dt_s
+                elementos = np.empty((a.size, 2, 2))
+                elementos[:, 0, 0] = d_a + volume_canal
+                elementos[:, 0, 1] = d_b + volume_canal
+                elementos[:, 1, 0] = volume_canal - d_a
+                elementos[:, 1, 1] = volume_canal - d_b
+                montagem.montar(elementos)
+                return montagem.somar_diagonal((armazenamento + area * dh_dphi / dt_s)[c["ordem"]])
+
+            estado = balanco(phi)
+            convergiu, buscas_esgotadas = False, 0
+            for iteracao in range(1, int(p["max_iter_rede"]) + 1):
+                jacobiano(estado)
+                ordem = c["ordem"]
+                matriz, rhs = montagem.aplicar_dirichlet(contorno[ordem], -estado["residuo"][ordem])
+                # O CSR de A é o CSC de A^T: fatora A^T e resolve com trans="T"
+                lu = scipy.sparse.linalg.splu(matriz.T, permc_spec="NATURAL",
+                                              options={"SymmetricMode": True})
+                c["fatoracoes"] += 1
+                delta = lu.solve(rhs, trans="T")[c["posicao"]]
+
+                # Busca linear por retrocesso na norma do resíduo
+                passo = 1.0
+                tentativa = balanco(phi + delta)
+                while tentativa["norma"] > estado["norma"] and passo > 1.0 / 64.0:
+                    passo *= 0.5
+                    tentativa = balanco(phi + passo * delta)
+                # Busca esgotada: o menor passo é aceito mesmo com resíduo maior
+                buscas_esgotadas += int(tentativa["norma"] > estado["norma"])
+                phi = phi + passo * delta
+                estado = tentativa
+                if passo * np.max(np.abs(delta)) <= p["tol_rede"] * max(np.max(np.abs(phi)), 1.0):
+                    convergiu = True
+                    break
+            if not convergiu:
+                logger.warning(f"Rede subglacial não convergiu em {iteracao} iterações de Newton "
+                               f"(resíduo {estado['norma']:.2e} m^3/s, {buscas_esgotadas} busca(s) "
+                               f"linear(es) esgotada(s) com resíduo crescente)")
+
+            h, S = estado["h"], estado["S"]
+            rede = self.condutancias(phi, h, S)
+            vazao = (rede["K_lamina"] + rede["K_canal"]) * (phi[a] - phi[b])
+            descarga = np.sum(vazao[contorno[b] & ~contorno[a]]) - np.sum(vazao[contorno[a] & ~contorno[b]])
+            return {"potencial": phi.reshape(forma), "espessura_lamina": h.reshape(forma),
+                    "secao_canal": S, "pressao_efetiva": (phi_0 - phi).reshape(forma),
+                    "vazao_canal": rede["vazao_canal"], "fluxo_lamina": rede["fluxo_lamina"],
+                    "descarga_contorno": descarga, "iteracoes": iteracao,
+                    "convergiu": convergiu}
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return {}
 
     # ==========================================================================
     # INTERFACE DE EXECUÇÃO
@@ -3,6 +3,15 @@ Módulo: hidrologia_sub_cavidade.py
 Projeto: GRESM - Greenland Regional Earth System Model
 Autor: Luiz Tiago Wilcke
 Role: Arquiteto de Software Sênior
+
+Sistema distribuído de cavidades (lâmina de água) da hidrologia subglacial, no
+modelo de Werder et al. (2013): as cavidades abrem pelo deslizamento sobre
+ressaltos do leito (altura h_r, comprimento l_r) e fecham por fluência do gelo
+sob a pressão efetiva N = phi_0 - phi; a lâmina conduz água com fluxo turbulento
+q = -k_s h^alfa |grad phi|^(beta-2) grad phi. A atualização de h é Euler implícito
+(linear em h, estável para passos de dias a semanas); o acoplamento com os
+canais e o potencial hidráulico fica em HidrologiaSubCanal.evoluir_rede.
+Unidades: velocidade em m/a e dt em anos na interface, SI (s) nos núcleos.
 """
 
 import numpy as np
@@ -16,8 +25,35 @@ import random
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union
 
+from GRESM.dinamica_central.tabela_arrhenius import SEGUNDOS_POR_ANO
+
 logger = logging.getLogger(__name__)
 
+
+def fechamento_fluencia(pressao, A, n):
+    """
+    Taxa de fechamento por fluência c = A |N|^(n-1) N (s^-1) e dc/dN, comum às
+    cavidades (dh/dt = -c h) e aos canais (dS/dt = -c S). N < 0 (sobrepressão)
+    dá c < 0: a fluência abre.
+    """
+    N = np.asarray(pressao, dtype=np.float64)
+    potencia = np.abs(N) ** (n - 1.0)
+    return A * potencia * N, n * A * potencia
+
+
+def atualizar_implicito(valor, abertura, relaxacao, fechamento, derivada_fechamento, dt):
+    """
+    Euler implícito de dX/dt = abertura - relaxacao X - c X, linear em X. A parte
+    negativa de c (sobrepressão) fica explícita para o denominador não se anular.
+    Retorna X novo e dX/dc * dc/dN (a sensibilidade usada no Newton do potencial).
+    """
+    c_mais = np.maximum(fechamento, 0.0)
+    denominador = 1.0 + dt * (relaxacao + c_mais)
+    novo = (valor * (1.0 - dt * np.minimum(fechamento, 0.0)) + dt * abertura) / denominador
+    sensibilidade = -dt * np.where(fechamento > 0.0, novo, valor) / denominador * derivada_fechamento
+    return novo, sensibilidade
+
+
 class HidrologiaSubCavidadeBase(ABC):
     """Classe base abstrata para HidrologiaSubCavidade."""
     @abstractmethod
@@ -44,8 +80,17 @@ class HidrologiaSubCavidade(HidrologiaSubCavidadeBase):
             "rho_i": 917.0,
             "rho_w": 1000.0,
             "L_f": 3.34e5,
-            "cp": 2097.0
+            "cp": 2097.0,
+            "h_r": 0.1,
+            "l_r": 2.0,
+            "A_fluencia": 2.5e-25,
+            "n_glen": 3.0,
+            "k_lamina": 5e-3,
+            "alfa_lamina": 1.25,
+            "beta_lamina": 1.5,
+            "gradiente_minimo": 1e-2
         }
+        self._params.update({k: v for k, v in self._config.items() if k in self._params})
         
         self.inicializar()
 
@@ -85,21 +130,57 @@ class HidrologiaSubCavidade(HidrologiaSubCavidadeBase):
     # LÓGICA CORE (ESPECÍFICA DO MÓDULO)
     # ==========================================================================
 
-    def evoluir_abertura(self, h_cav, velocidade, pressao):
-        """Implementação específica: evoluir_abertura"""
+    def _abertura_implicita(self, h_cav, velocidade, pressao, dt):
+        """
+        Núcleo SI (velocidade em m/s, dt em s): h após dt e dh/dN. A abertura
+        u_b (h_r - h)/l_r só atua enquanto h < h_r no início do passo.
+        """
+        p = self._params
+        c, dc = fechamento_fluencia(pressao, p["A_fluencia"], p["n_glen"])
+        relaxacao = np.where(h_cav < p["h_r"], velocidade / p["l_r"], 0.0)
+        return atualizar_implicito(h_cav, relaxacao * p["h_r"], relaxacao, c, dc, dt)
+
+    def taxa_abertura(self, h_cav, velocidade, pressao):
+        """dh/dt (m/a) = abertura pelo deslizamento `velocidade` (m/a) - fechamento sob N = `pressao` (Pa)."""
+        self._status = "COMPUTING_TAXA_ABERTURA"
+        try:
+            p = self._params
+            h_cav = np.asarray(h_cav, dtype=np.float64)
+            c, _ = fechamento_fluencia(pressao, p["A_fluencia"], p["n_glen"])
+            abertura = np.where(h_cav < p["h_r"], np.asarray(velocidade) * (p["h_r"] - h_cav) / p["l_r"], 0.0)
+            return abertura - c * h_cav * SEGUNDOS_POR_ANO
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def evoluir_abertura(self, h_cav, velocidade, pressao, dt):
+        """
+        Altura das cavidades (m) após `dt` (a), com deslizamento `velocidade`
+        (m/a) e pressão efetiva `pressao` (Pa); Euler implícito, vetorizado.
+        """
         self._status = "COMPUTING_EVOLUIR_ABERTURA"
         try:
-            # Validação
-            # self._validar_entradas( h_cav)
-            
-            # Kernel Físico/Lógico
-            return h_cav + (velocidade * 0.5 - h_cav * pressao * 1e-4)
-            
+            h_novo, _ = self._abertura_implicita(np.asarray(h_cav, dtype=np.float64),
+                                                 np.asarray(velocidade) / SEGUNDOS_POR_ANO,
+                                                 pressao, dt * SEGUNDOS_POR_ANO)
+            return h_novo
+
         except Exception as e:
             self._tratar_erro_execucao(e)
             # Retorno de segurança
             return 0.0
-        
+
+    def condutancia_lamina(self, h_cav, gradiente):
+        """
+        k_s h^alfa |grad phi|^(beta-2) (m^2 Pa^-1 s^-1): fluxo da lâmina por
+        unidade de largura e de gradiente; |grad phi| é limitado por baixo por
+        `gradiente_minimo` (Pa/m) porque beta < 2 torna o expoente negativo.
+        """
+        p = self._params
+        modulo = np.maximum(np.abs(gradiente), p["gradiente_minimo"])
+        return p["k_lamina"] * np.maximum(h_cav, 0.0) ** p["alfa_lamina"] * modulo ** (p["beta_lamina"] - 2.0)
 
     # ==========================================================================
     # INTERFACE DE EXECUÇÃO
@@ -3,9 +3,24 @@ Módulo: hidrologia_supraglacial.py
 Projeto: GRESM - Greenland Regional Earth System Model
 Autor: Luiz Tiago Wilcke
 Role: Arquiteto de Software Sênior
+
+Roteamento da água de degelo sobre a superfície do gelo. As direções de fluxo
+vêm da superfície por D8 (todo o fluxo para o vizinho de maior declive) ou D-inf
+(Tarboton 1997: direção contínua de maior declive em 8 facetas triangulares,
+dividida entre os dois vizinhos da faceta). Como todo receptor é mais baixo que
+o doador, a ordem decrescente de elevação é uma ordem topológica (montante ->
+jusante): nessa ordem a matriz I - P^T (P_ij = fração que vai de i para j) é
+triangular inferior unitária e sua fatoração LU não tem preenchimento. A rede,
+a ordem e a fatoração são construídas uma vez; cada acumulação é uma única
+solução triangular esparsa, e a rede só é refeita quando a superfície muda mais
+que `tolerancia_superficie` (ou muda a máscara de gelo). Células sem vizinho
+mais baixo são sumidouros (lagos, moulins) e células fora da máscara são
+exutórios: recebem água e não a passam adiante.
 """
 
 import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
 import sys
 import os
 import time
@@ -44,8 +59,11 @@ class HidrologiaSupraglacial(HidrologiaSupraglacialBase):
             "rho_i": 917.0,
             "rho_w": 1000.0,
             "L_f": 3.34e5,
-            "cp": 2097.0
+            "cp": 2097.0,
+            "metodo_roteamento": "dinf",
+            "tolerancia_superficie": 0.5
         }
+        self._params.update({k: v for k, v in self._config.items() if k in self._params})
         
         self.inicializar()
 
@@ -85,21 +103,181 @@ class HidrologiaSupraglacial(HidrologiaSupraglacialBase):
     # LÓGICA CORE (ESPECÍFICA DO MÓDULO)
     # ==========================================================================
 
-    def rotear_agua_superficie(self, melt, declividade):
-        """Implementação específica: rotear_agua_superficie"""
+    # Vizinhos (di, dj) e facetas D-inf (cardinal, diagonal) no sentido anti-horário a partir de leste
+    _VIZINHOS = ((0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1), (1, 0), (1, 1))
+    _FACETAS = (((0, 1), (-1, 1)), ((-1, 0), (-1, 1)), ((-1, 0), (-1, -1)), ((0, -1), (-1, -1)),
+                ((0, -1), (1, -1)), ((1, 0), (1, -1)), ((1, 0), (1, 1)), ((0, 1), (1, 1)))
+
+    @staticmethod
+    def _deslocado(campo_pad, di, dj, forma):
+        """Vizinho (di, dj) de cada célula, a partir do campo com borda de 1 célula."""
+        ny, nx = forma
+        return campo_pad[1 + di:1 + di + ny, 1 + dj:1 + dj + nx]
+
+    def _direcoes_d8(self, superficie, indices_pad, dx, dy):
+        """Receptor único (índice plano, -1 se nenhum) e fração 1 por célula."""
+        forma = superficie.shape
+        elevacao_pad = np.pad(superficie, 1, constant_values=np.inf)
+        maior = np.zeros(forma)
+        receptor = np.full(forma, -1, dtype=np.intp)
+        for di, dj in self._VIZINHOS:
+            declive = (superficie - self._deslocado(elevacao_pad, di, dj, forma)) / np.hypot(di * dy, dj * dx)
+            melhor = declive > maior
+            maior[melhor] = declive[melhor]
+            receptor[melhor] = self._deslocado(indices_pad, di, dj, forma)[melhor]
+        return (receptor,), (np.where(receptor >= 0, 1.0, 0.0),)
+
+    def _direcoes_dinf(self, superficie, indices_pad, dx, dy):
+        """
+        Dois receptores (cardinal e diagonal da faceta de maior declive) e as
+        frações 1 - r/alfa e r/alfa, com r o ângulo do fluxo dentro da faceta.
+        """
+        forma = superficie.shape
+        elevacao_pad = np.pad(superficie, 1, constant_values=np.nan)
+        maior = np.zeros(forma)
+        receptores = (np.full(forma, -1, dtype=np.intp), np.full(forma, -1, dtype=np.intp))
+        fracao_diagonal = np.zeros(forma)
+        with np.errstate(invalid="ignore"):
+            for (ci, cj), (gi, gj) in self._FACETAS:
+                # d1: até o vizinho cardinal; d2: do cardinal ao diagonal
+                d1, d2 = (dx, dy) if ci == 0 else (dy, dx)
+                alfa = np.arctan2(d2, d1)
+                cardinal = self._deslocado(elevacao_pad, ci, cj, forma)
+                diagonal = self._deslocado(elevacao_pad, gi, gj, forma)
+                s1 = (superficie - cardinal) / d1
+                s2 = np.nan_to_num((cardinal - diagonal) / d2, nan=-np.inf)
+                r = np.clip(np.arctan2(s2, s1), 0.0, alfa)
+                declive = np.where(r <= 0.0, s1,
+                                   np.where(r >= alfa, (superficie - diagonal) / np.hypot(d1, d2), np.hypot(s1, s2)))
+                # Cardinal fora da grade: faceta inválida (hypot(nan, inf) daria inf)
+                melhor = np.where(np.isnan(s1), -np.inf, np.nan_to_num(declive, nan=-np.inf)) > maior
+                maior[melhor] = declive[melhor]
+                receptores[0][melhor] = self._deslocado(indices_pad, ci, cj, forma)[melhor]
+                receptores[1][melhor] = self._deslocado(indices_pad, gi, gj, forma)[melhor]
+                fracao_diagonal[melhor] = r[melhor] / alfa
+        fracoes = (np.where(receptores[0] >= 0, 1.0 - fracao_diagonal, 0.0),
+                   np.where(receptores[1] >= 0, fracao_diagonal, 0.0))
+        return receptores, fracoes
+
+    def construir_roteamento(self, superficie, dx, dy=None, mascara=None):
+        """
+        Direções de fluxo, ordem topológica e fatoração de I - P^T para a
+        `superficie` (ny, nx) em m, com espaçamentos dx, dy (m) e `mascara` de
+        gelo opcional (fora dela: exutórios). Retorna o número de sumidouros.
+        """
+        self._status = "COMPUTING_CONSTRUIR_ROTEAMENTO"
+        try:
+            superficie = np.array(superficie, dtype=np.float64)
+            dy = dx if dy is None else dy
+            forma = superficie.shape
+            n = superficie.size
+            indices_pad = np.pad(np.arange(n).reshape(forma), 1, constant_values=-1)
+            metodo = self._params["metodo_roteamento"]
+            if metodo == "d8":
+                receptores, fracoes = self._direcoes_d8(superficie, indices_pad, dx, dy)
+            elif metodo == "dinf":
+                receptores, fracoes = self._direcoes_dinf(superficie, indices_pad, dx, dy)
+            else:
+                raise ValueError(f"Método de roteamento desconhecido: '{metodo}' (use 'd8' ou 'dinf')")
+            ativa = np.ones(n, dtype=bool) if mascara is None else np.asarray(mascara, dtype=bool).ravel()
+
+            # Ordem topológica: elevação decrescente (receptores sempre mais baixos)
+            ordem = np.argsort(-superficie, axis=None, kind="stable")
+            posicao = np.empty(n, dtype=np.intp)
+            posicao[ordem] = np.arange(n)
+            doadores, linhas, valores = [], [], []
+            for receptor, fracao in zip(receptores, fracoes):
+                receptor, fracao = receptor.ravel(), fracao.ravel()
+                liga = (receptor >= 0) & (fracao > 0.0) & ativa
+                doadores.append(posicao[liga])
+                linhas.append(posicao[receptor[liga]])
+                valores.append(-fracao[liga])
+            sumidouro = ativa & (np.sum([(r.ravel() >= 0) & (f.ravel() > 0.0) for r, f in zip(receptores, fracoes)],
+                                        axis=0) == 0)
+            linhas = np.concatenate([np.arange(n)] + linhas)
+            colunas = np.concatenate([np.arange(n)] + doadores)
+            valores = np.concatenate([np.ones(n)] + valores)
+            # I - P^T na ordem topológica: triangular inferior unitária, LU sem preenchimento nem pivoteamento
+            matriz = scipy.sparse.csc_matrix((valores, (linhas, colunas)), shape=(n, n))
+            lu = scipy.sparse.linalg.splu(matriz, permc_spec="NATURAL", diag_pivot_thresh=0.0,
+                                          options={"SymmetricMode": True})
+            c = self._cache
+            c.update(forma=forma, ordem=ordem, lu=lu, receptores=receptores, fracoes=fracoes,
+                     sumidouros=np.flatnonzero(sumidouro), mascara=ativa, area_celula=dx * dy,
+                     superficie_referencia=superficie, reconstrucoes=c.get("reconstrucoes", 0) + 1)
+            return int(sumidouro.sum())
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def atualizar_roteamento(self, superficie, dx, dy=None, mascara=None):
+        """
+        Refaz a rede só se não há rede para esta grade, se a superfície mudou
+        mais que `tolerancia_superficie` (m) em alguma célula desde a última
+        construção ou se a máscara mudou. Retorna True se reconstruiu.
+        """
+        c = self._cache
+        referencia = c.get("superficie_referencia")
+        if referencia is not None and referencia.shape == np.shape(superficie) and \
+                c["area_celula"] == dx * (dx if dy is None else dy):
+            mascara_igual = c["mascara"].all() if mascara is None else \
+                np.array_equal(c["mascara"], np.ravel(mascara).astype(bool))
+            if mascara_igual and np.max(np.abs(superficie - referencia)) <= self._params["tolerancia_superficie"]:
+                return False
+        self.construir_roteamento(superficie, dx, dy, mascara)
+        return True
+
+    def acumular(self, fonte, out=None):
+        """
+        Vazão acumulada (m^3/a) em cada célula: a própria fonte (m/a de água
+        vezes a área da célula) mais tudo o que chega de montante, por uma
+        solução triangular na ordem topológica da rede construída.
+        """
+        self._status = "COMPUTING_ACUMULAR"
+        try:
+            c = self._cache
+            fonte = np.broadcast_to(fonte, c["forma"]).ravel()
+            entrada = np.where(c["mascara"], fonte, 0.0)[c["ordem"]]
+            entrada *= c["area_celula"]
+            if out is None:
+                out = np.empty(c["forma"])
+            out.reshape(-1)[c["ordem"]] = c["lu"].solve(entrada)
+            c["acumulacoes"] = c.get("acumulacoes", 0) + 1
+            return out
+
+        except Exception as e:
+            self._tratar_erro_execucao(e)
+            # Retorno de segurança
+            return 0.0
+
+    def sumidouros(self):
+        """Índices planos das células de gelo sem vizinho mais baixo (lagos e moulins)."""
+        return self._cache["sumidouros"]
+
+    def rotear_agua_superficie(self, melt, superficie, dx, dy=None, mascara=None, out=None):
+        """
+        Vazão supraglacial acumulada (m^3/a) do degelo `melt` (m/a de água por
+        célula): atualiza a rede se a superfície mudou além da tolerância e
+        acumula com a ordem topológica em cache.
+        """
         self._status = "COMPUTING_ROTEAR_AGUA_SUPERFICIE"
         try:
-            # Validação
-            # self._validar_entradas( melt)
-            
-            # Kernel Físico/Lógico
-            return melt * np.sin(declividade) * 10.0
-            
+            self.atualizar_roteamento(superficie, dx, dy, mascara)
+            return self.acumular(melt, out)
+
         except Exception as e:
             self._tratar_erro_execucao(e)
             # Retorno de segurança
             return 0.0
-        
+
+    @property
+    def estatisticas(self):
+        c = self._cache
+        return {'reconstrucoes': c.get("reconstrucoes", 0), 'acumulacoes': c.get("acumulacoes", 0),
+                'sumidouros': int(c["sumidouros"].size) if "sumidouros" in c else 0}
+
 
     # ==========================================================================
     # INTERFACE DE EXECUÇÃO
@@ -0,0 +1,1187 @@
+import sys
+import os
+import time
+import math
+import numpy as np
+
+# Adicionar diretorio atual ao path
+sys.path.append(os.getcwd())
+
+from GRESM.processos_superficie.smb_ablacao import SmbAblacao
+from GRESM.condicoes_contorno.leitor_topografia import LeitorTopografia
+from GRESM.dinamica_central.solvedor_stokes import SolvedorStokes
+from GRESM.dinamica_central.conservacao_massa import ConservacaoMassa
+from main_simulacao import SimulacaoGRESM
+
+
+def cronometrar(funcao, repeticoes=3):
+    """Menor tempo de parede (s) entre algumas repetições."""
+    melhor = np.inf
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor
+
+
+# ==============================================================================
+# 1. MOTOR PDD VETORIZADO (SmbAblacao)
+# ==============================================================================
+def benchmark_pdd(n_nos=200, n_anos=200):
+    print(f"\n[PDD] grade={n_nos} nós x {n_anos} anos")
+    smb = SmbAblacao()
+    p = smb._params
+    superficie = np.linspace(0.0, 3000.0, n_nos)
+    temp_ar = -20.0 + 0.05 * np.arange(n_anos) + 2.0
+    temp_bloco = temp_ar[:, None] - 0.0065 * superficie[None, :]
+
+    # Laço atual de SimulacaoGRESM.rodar: uma chamada por nó, um ano por vez
+    def laco_por_no():
+        for temp_local in temp_bloco:
+            np.array([smb.calcular_derretimento(tmp) for tmp in temp_local])
+
+    # Mesma física do motor novo, escalar nó a nó (referência de precisão)
+    def pdd_escalar(temp_media):
+        n = p["subpassos_ano"]; sigma = p["sigma_temp"]; total = 0.0
+        for k in range(n):
+            t = temp_media + p["amplitude_sazonal"] * math.cos(2 * math.pi * (k + 0.5) / n)
+            total += (sigma / math.sqrt(2 * math.pi) * math.exp(-t * t / (2 * sigma * sigma))
+                      + 0.5 * t * math.erfc(-t / (math.sqrt(2) * sigma))) * 365.0 / n
+        return p["ddf_gelo"] * total
+
+    def laco_escalar_analitico():
+        return np.array([[pdd_escalar(t) for t in linha] for linha in temp_bloco])
+
+    def bloco_vetorizado():
+        return smb.calcular_derretimento_pdd(temp_bloco)
+
+    t_laco = cronometrar(laco_por_no)
+    t_escalar = cronometrar(laco_escalar_analitico, repeticoes=1)
+    t_vet = cronometrar(bloco_vetorizado)
+    erro = np.max(np.abs(bloco_vetorizado() - laco_escalar_analitico()))
+    print(f"  laço por nó (grau-dia simples)  : {t_laco*1e3:9.2f} ms")
+    print(f"  laço por nó (PDD analítico)     : {t_escalar*1e3:9.2f} ms")
+    print(f"  bloco vetorizado (PDD analítico): {t_vet*1e3:9.2f} ms")
+    print(f"  ganho vs laço atual = {t_laco/t_vet:.1f}x | vs analítico escalar = {t_escalar/t_vet:.1f}x")
+    print(f"  erro máximo vs referência escalar = {erro:.2e} m/ano")
+
+
+# ==============================================================================
+# 2. PASSO DE TEMPO FUNDIDO SEM ALOCAÇÃO (SimulacaoGRESM)
+# ==============================================================================
+def simulacao_refinada(n_nos, modo_passo):
+    """SimulacaoGRESM com o transecto reamostrado para `n_nos` nós."""
+    sim = SimulacaoGRESM(modo_passo=modo_passo, dinamica="legado")
+    sim.regradear(np.linspace(sim.x[0], sim.x[-1], n_nos))
+    return sim
+
+
+def benchmark_passo_fundido(n_nos=100000, n_passos=50):
+    print(f"\n[PASSO] grade={n_nos} nós, {n_passos} passos")
+    for modo in ("classico", "fundido"):
+        sim = simulacao_refinada(n_nos, modo)
+        passo = sim._passo_fundido if modo == "fundido" else sim._passo_classico
+        with np.errstate(all='ignore'):
+            t = cronometrar(lambda: [passo(ano) for ano in range(n_passos)], repeticoes=1)
+        medida = sim.medir_alocacao_passo()
+        print(f"  {modo:9s}: {t / n_passos * 1e3:7.2f} ms/passo | "
+              f"pico/passo = {medida['pico_passo_bytes'] / 1024:9.1f} kB | "
+              f"crescimento = {medida['crescimento_bytes'] / 1024:7.1f} kB | "
+              f"campo = {medida['bytes_campo'] / 1024:.0f} kB | sem alocação: {medida['sem_alocacao']}")
+
+
+# ==============================================================================
+# 3. GRADE EM PLANTA (y, x) NA RESOLUÇÃO DE 1 km
+# ==============================================================================
+def benchmark_grade_2d(dx_km=1.0, n_passos=5):
+    sim = SimulacaoGRESM(modo_passo="fundido", grade="2d", dx_2d=dx_km, dinamica="legado")
+    print(f"\n[GRADE 2D] dx={dx_km} km, {sim.leito.shape[0]} x {sim.leito.shape[1]} = {sim.leito.size} células")
+    with np.errstate(all='ignore'):
+        t = cronometrar(lambda: [sim._passo_fundido(float(ano)) for ano in range(n_passos)], repeticoes=1)
+    medida = sim.medir_alocacao_passo(n_passos=3)
+    print(f"  {t / n_passos:.3f} s/passo | {t / n_passos / sim.leito.size * 1e9:.0f} ns/célula | "
+          f"buffers = {sim.buffers.nbytes / 2**20:.0f} MiB | pico/passo = {medida['pico_passo_bytes'] / 1024:.0f} kB")
+
+
+# ==============================================================================
+# 4. SIA SEMI-IMPLÍCITA vs. EXPLÍCITA (tempo de parede por milênio simulado)
+# ==============================================================================
+def geometria_sia(grade, dx_km):
+    """Leito, espessura inicial e espaçamentos (m) da geometria padrão em `dx_km`."""
+    topo = LeitorTopografia()
+    if grade == "2d":
+        _, _, leito, superficie = topo.carregar_dados_2d(dx=dx_km)
+        return leito, superficie - leito, dx_km * 1e3, dx_km * 1e3
+    x, leito, superficie = topo.carregar_dados()
+    x_novo = np.arange(x[0], x[-1] + 1e-9, dx_km)
+    leito_novo = np.interp(x_novo, x, leito)
+    return leito_novo, np.interp(x_novo, x, superficie) - leito_novo, dx_km * 1e3, None
+
+
+def benchmark_sia_semi_implicito(casos=(("1d", 7.5), ("1d", 2.5), ("2d", 10.0)), anos=1000.0,
+                                 passos_dt=(1.0, 5.0, 10.0, 25.0), smb=0.3, dt_referencia=0.5):
+    """
+    Tempo de parede por milênio e erro final de H de cada esquema contra uma
+    referência semi-implícita com dt pequeno e Picard convergido a 1e-8.
+    """
+    stokes, massa = SolvedorStokes(), ConservacaoMassa()
+    for grade, dx_km in casos:
+        leito, H0, dx, dy = geometria_sia(grade, dx_km)
+        difusividade = lambda H, s: stokes.calcular_difusividade_sia(H, s, dx, dy)
+        print(f"\n[SIA] grade {grade} dx={dx_km} km ({H0.size} células), {anos:.0f} anos, smb={smb} m/a")
+
+        def explicito():
+            H, t, n = H0.copy(), 0.0, 0
+            while t < anos - 1e-9:
+                dt = min(massa.passo_estavel_explicito(difusividade(H, leito + H), dx, dy), anos - t)
+                H = massa.evoluir_espessura_sia_explicito(H, leito, smb, dt, dx, difusividade, dy)
+                t, n = t + dt, n + 1
+            return H, n
+
+        def semi_implicito(dt, **opcoes):
+            H, picard, convergidos = H0.copy(), 0, 0
+            n = int(round(anos / dt))
+            for _ in range(n):
+                H = massa.evoluir_espessura_semi_implicito(H, leito, smb, dt, dx, difusividade, dy, **opcoes)
+                picard += massa.iteracoes_picard
+                convergidos += massa.convergiu_picard
+            return H, picard / n, convergidos / n
+
+        H_ref, _, _ = semi_implicito(dt_referencia, n_picard=50, tol_relativa=1e-8)
+
+        t0 = time.perf_counter()
+        H_exp, n_exp = explicito()
+        t_exp = time.perf_counter() - t0
+        erro = np.abs(H_exp - H_ref)
+        print(f"  explícito (dt estável ~{anos / n_exp:.3g} a){'':9s}: {t_exp:7.2f} s/milênio | "
+              f"{'':37s} |dH| máx {erro.max():7.2f} m, médio {erro.mean():6.2f} m")
+
+        for dt in passos_dt:
+            t0 = time.perf_counter()
+            H, picard, convergidos = semi_implicito(dt)
+            t_semi = time.perf_counter() - t0
+            erro = np.abs(H - H_ref)
+            print(f"  semi-implícito dt={dt:4.1f} a ({dt * n_exp / anos:4.0f}x): {t_semi:7.2f} s/milênio | "
+                  f"ganho {t_exp / t_semi:5.1f}x | Picard/passo {picard:3.1f} ({convergidos:4.0%} conv.) | "
+                  f"|dH| máx {erro.max():7.2f} m, médio {erro.mean():6.2f} m")
+
+
+# ==============================================================================
+# 5. AGENDADOR MULTITAXA (DriverPrincipal)
+# ==============================================================================
+def benchmark_multitaxa(dx_km=5.0, dt=10.0, n_intervalos=10):
+    """Custo por componente com todos os componentes anuais vs. intervalos próprios."""
+    configuracoes = {
+        "todos anuais": {"temp_ar": 1.0, "nivel_mar": 1.0, "smb": 1.0, "gia": 1.0},
+        "multitaxa": {"temp_ar": 1.0, "nivel_mar": 10.0, "smb": 5.0, "gia": 50.0},
+    }
+    print(f"\n[MULTITAXA] planta dx={dx_km} km, SIA semi-implícita, "
+          f"{n_intervalos} intervalos de forçantes de {dt:g} anos")
+    for rotulo, intervalos in configuracoes.items():
+        sim = SimulacaoGRESM(grade="2d", dx_2d=dx_km, dinamica="sia_semi_implicito", dt=dt,
+                             intervalos_acoplamento=intervalos)
+        t0 = time.perf_counter()
+        for t in sim.anos[:n_intervalos]:
+            sim._passo_fundido(t)
+        total = time.perf_counter() - t0
+        componentes = sim.driver.relatorio_componentes()
+        acoplamento = sum(r['segundos'] for r in componentes.values())
+        detalhes = ", ".join(f"{nome} {r['avaliacoes']}x/{r['segundos']:.2f} s" for nome, r in componentes.items())
+        print(f"  {rotulo:12s}: {total:6.2f} s | componentes {acoplamento:5.2f} s ({acoplamento / total:4.0%}) | "
+              f"dinâmica {total - acoplamento:5.2f} s | {detalhes}")
+
+
+# ==============================================================================
+# 6. VELOCIDADE DE ORDEM SUPERIOR (SolvedorOrdemSuperior): MONTAGEM, PICARD x NEWTON
+# ==============================================================================
+def benchmark_ordem_superior(n_colunas=(200, 800), n_camadas=10, n_passos=5):
+    from GRESM.dinamica_central.solvedor_ordem_superior import SolvedorOrdemSuperior
+    import scipy.sparse
+
+    print(f"\n[ORDEM SUPERIOR] Blatter-Pattyn no transecto, {n_camadas} camadas, {n_passos} passos de tempo")
+    for nx in n_colunas:
+        x = np.linspace(0.0, 400e3, nx)
+        leito = 200.0 * np.sin(x / 20e3)
+        espessura = np.maximum(3000.0 * np.sqrt(np.clip(1.0 - (x / 350e3) ** 2, 0.0, None)), 0.0)
+        solvedor = SolvedorOrdemSuperior(n_camadas=n_camadas)
+
+        # Montagem: mapa de espalhamento em cache x coo_matrix(...).tocsr() a cada iteração
+        solvedor.resolver(x, leito, espessura)
+        eta = solvedor.viscosidade_elementos(solvedor.u)
+        elementos = np.einsum("eq,eqij->eij", eta, solvedor.M)
+        conectividade = solvedor.montagem.conectividade
+        k = conectividade.shape[1]
+        linhas = np.repeat(conectividade, k, axis=1).ravel()
+        colunas = np.tile(conectividade, (1, k)).ravel()
+        n_nos = solvedor.montagem.n_nos
+
+        def montagem_ingenua():
+            return scipy.sparse.coo_matrix((elementos.ravel(), (linhas, colunas)),
+                                           shape=(n_nos, n_nos)).tocsr()
+
+        def montagem_em_cache():
+            return solvedor.montagem.montar(elementos)
+
+        erro = abs(montagem_ingenua() - montagem_em_cache()).max()
+        t_ingenua = cronometrar(montagem_ingenua, repeticoes=10)
+        t_cache = cronometrar(montagem_em_cache, repeticoes=10)
+
+        # Passos de tempo com geometria variando: iterações, soluções lineares e
+        # fatorações de Picard e de Newton, erro contra Picard convergido a 1e-10
+        geometrias = [espessura * (1.0 + 0.002 * (passo + 1)) for passo in range(n_passos)]
+        referencia = SolvedorOrdemSuperior(n_camadas=n_camadas, metodo="picard", tol_relativa=1e-10,
+                                           max_iter_picard=1000)
+        referencia.resolver(x, leito, geometrias[-1])
+        print(f"  nx={nx:4d} ({n_nos} nós, nnz={solvedor.montagem.nnz}): montagem ingênua "
+              f"{t_ingenua * 1e3:7.3f} ms | em cache {t_cache * 1e3:7.3f} ms ({t_ingenua / t_cache:4.1f}x, "
+              f"dif. máx. {erro:.1e})")
+        for metodo in ("picard", "newton"):
+            solvedor = SolvedorOrdemSuperior(n_camadas=n_camadas, metodo=metodo)
+            solvedor.resolver(x, leito, espessura)
+            solvedor.zerar_estatisticas()
+            t0 = time.perf_counter()
+            for H in geometrias:
+                solvedor.resolver(x, leito, H)
+            t_passos = time.perf_counter() - t0
+            erro_u = np.abs(solvedor.u - referencia.u).max() / np.abs(referencia.u).max()
+            iteracoes = solvedor.iteracoes_picard + solvedor.iteracoes_newton
+            print(f"    {metodo:6s} {n_passos} passos: {t_passos:5.2f} s | iterações {iteracoes:3d} | "
+                  f"soluções lineares {solvedor.solucoes_lineares:3d} (GMRES {solvedor.iteracoes_lineares:3d} it) | "
+                  f"fatorações {solvedor.fatoracoes} | erro relativo de u {erro_u:.1e}")
+
+# ==============================================================================
+# 7. FATOR DE TAXA DE ARRHENIUS TABELADO (TabelaArrhenius)
+# ==============================================================================
+def benchmark_arrhenius(tamanhos=(100000, 1000000)):
+    from GRESM.dinamica_central.tabela_arrhenius import TabelaArrhenius
+
+    tabela = TabelaArrhenius.compartilhada(n=3.0)
+    r = tabela.relatorio_precisao()
+    print(f"\n[ARRHENIUS] tabela com {r['nos']} nós (passo {r['passo_K'] * 1e3:.1f} mK, "
+          f"{r['bytes'] / 1024:.0f} kB), monótona: {r['monotona']}")
+    print(f"  erro relativo A: máx {r['erro_A_max']:.2e}, médio {r['erro_A_medio']:.2e} | "
+          f"B = A^(-1/n): máx {r['erro_B_max']:.2e}, médio {r['erro_B_medio']:.2e} "
+          f"(tolerância {tabela.tolerancia:.0e})")
+
+    gerador = np.random.default_rng(0)
+    for n_celulas in tamanhos:
+        temperatura = gerador.uniform(-40.0, 0.0, n_celulas)
+        pressao = gerador.uniform(0.0, 3e7, n_celulas)
+        saida = np.empty(n_celulas)
+        casos = {
+            "A direto (exp)": lambda: tabela.avaliar_direto(temperatura, pressao),
+            "A tabelado": lambda: tabela.fator_taxa(temperatura, pressao, out=saida),
+            "B direto (exp + pow)": lambda: tabela.avaliar_direto(temperatura, pressao) ** (-1.0 / 3.0),
+            "B tabelado": lambda: tabela.dureza(temperatura, pressao, out=saida),
+        }
+        tempos = {nome: cronometrar(funcao, repeticoes=5) for nome, funcao in casos.items()}
+        print(f"  {n_celulas:8d} células: " + " | ".join(
+            f"{nome} {t * 1e3:6.2f} ms" for nome, t in tempos.items()) +
+            f" | ganho A {tempos['A direto (exp)'] / tempos['A tabelado']:.1f}x, "
+            f"B {tempos['B direto (exp + pow)'] / tempos['B tabelado']:.1f}x")
+
+    # Viscosidade por iteração não linear: exp + pow de A por célula vs. B tabelado uma vez
+    from GRESM.dinamica_central.calculadora_viscosidade import CalculadoraViscosidade
+    viscosidade = CalculadoraViscosidade()
+    deformacao_quadrado = gerador.uniform(1e-6, 1e-2, temperatura.size)
+    dureza = tabela.dureza(temperatura, pressao)
+
+    def por_iteracao_direto():
+        return viscosidade.viscosidade_glen(deformacao_quadrado, tabela.avaliar_direto(temperatura, pressao),
+                                            out=saida)
+
+    def por_iteracao_tabelado():
+        return viscosidade.viscosidade_glen(deformacao_quadrado, None, out=saida, dureza=dureza)
+
+    t_direto, t_tabela = cronometrar(por_iteracao_direto, 5), cronometrar(por_iteracao_tabelado, 5)
+    print(f"  viscosidade por iteração ({temperatura.size} pontos): A(T) a cada iteração {t_direto * 1e3:6.2f} ms | "
+          f"B da tabela, avaliado por passo {t_tabela * 1e3:6.2f} ms ({t_direto / t_tabela:.1f}x)")
+
+# ==============================================================================
+# 8. SOLVEDOR TÉRMICO IMPLÍCITO EM COLUNAS (SolvedorTermico)
+# ==============================================================================
+def benchmark_termico(tamanhos=(100000, 1000000), n_niveis=21, dt=1.0):
+    from GRESM.dinamica_central.solvedor_termico import SolvedorTermico
+    from scipy.linalg import solve_banded
+
+    termico = SolvedorTermico()
+    p = termico._params
+    print(f"\n[TÉRMICO] colunas implícitas com {n_niveis} níveis, dt={dt:g} a")
+
+    # Precisão: estado estacionário sem advecção (perfil linear fria / temperada com derretimento)
+    H = np.array([500.0, 1000.0, 2000.0, 3000.0])
+    T_s, G = -20.0, 0.05
+    T = np.full((n_niveis, H.size), T_s)
+    for _ in range(3000):
+        T = termico.evoluir_colunas(T, H, T_s, G, 1000.0)
+    sigma = np.linspace(0.0, 1.0, n_niveis)[:, None]
+    T_base = -p["beta_clausius"] * p["rho_i"] * p["g"] * H
+    linear = T_s + G / p["k_gelo"] * H * (1.0 - sigma)
+    temperada = linear[0] > T_base
+    analitico = np.where(temperada, T_s + (T_base - T_s) * (1.0 - sigma), linear)
+    derretimento = np.where(temperada, (G - p["k_gelo"] * (T_base - T_s) / H) * 31556926.0 /
+                            (p["rho_i"] * p["L_f"]), 0.0)
+    print(f"  estacionário vs. analítico: |dT| máx {np.abs(T - analitico).max():.1e} K | "
+          f"base temperada {termico.base_temperada.tolist()} | "
+          f"|d derretimento| máx {np.abs(termico.derretimento_basal - derretimento).max():.1e} m/a")
+
+    gerador = np.random.default_rng(0)
+    for n_colunas in tamanhos:
+        H = gerador.uniform(100.0, 3200.0, n_colunas)
+        T0 = np.linspace(-5.0, -30.0, n_niveis)[:, None] + np.zeros(n_colunas)
+        w = -0.3 * np.linspace(0.0, 1.0, n_niveis)[:, None] * np.ones(n_colunas)
+        aquecimento = 50.0 * np.linspace(1.0, 0.0, n_niveis)[:, None] * np.ones(n_colunas)
+        saida = np.empty_like(T0)
+        passo = lambda: termico.evoluir_colunas(T0, H, -25.0, 0.06, dt, w, aquecimento, out=saida)
+        t = cronometrar(passo)
+        print(f"  {n_colunas:8d} colunas: {t * 1e3:7.1f} ms/passo | {t / T0.size * 1e9:5.1f} ns/célula | "
+              f"{termico.base_temperada.mean():4.0%} com base temperada")
+
+    # Referência: um solve_banded por coluna (mesmo sistema, sem troca de regime basal)
+    n_ref = 2000
+    Href, Tref = H[:n_ref], T0[:, :n_ref]
+    kappa = p["k_gelo"] / (p["rho_i"] * p["cp"]) * 31556926.0
+    def por_coluna():
+        for j in range(n_ref):
+            h = Href[j] / (n_niveis - 1)
+            r = kappa * dt / h**2
+            banda = np.zeros((3, n_niveis))
+            banda[0, 1:] = -r; banda[1] = 1 + 2 * r; banda[2, :-1] = -r
+            banda[0, 1] = -2 * r; banda[1, -1] = 1; banda[2, -2] = 0
+            solve_banded((1, 1), banda, Tref[:, j])
+    t_ref = cronometrar(por_coluna, repeticoes=1)
+    print(f"  solve_banded coluna a coluna ({n_ref} colunas): {t_ref / (n_ref * n_niveis) * 1e9:6.0f} ns/célula")
+
+    # O esquema explícito antigo exige dt <= h^2 / (2 kappa) na coluna mais fina
+    h_min = 100.0 / (n_niveis - 1)
+    print(f"  passo explícito estável na coluna de 100 m: {h_min**2 / (2 * kappa):.3f} a "
+          f"({int(np.ceil(dt * 2 * kappa / h_min**2))} subpassos por passo implícito)")
+
+
+# ==============================================================================
+# 9. ENTALPIA POLITÉRMICA EM COLUNAS (SolvedorEntalpia)
+# ==============================================================================
+def benchmark_entalpia(tamanhos=(100000, 1000000), n_niveis=21, dt=1.0, n_varreduras=3):
+    from GRESM.dinamica_central.solvedor_termico import SolvedorTermico
+    from GRESM.dinamica_central.solvedor_entalpia import SolvedorEntalpia
+
+    termico, entalpia = SolvedorTermico(), SolvedorEntalpia()
+    p = entalpia._params
+    print(f"\n[ENTALPIA] colunas politérmicas com {n_niveis} níveis, dt={dt:g} a, {n_varreduras} varreduras")
+
+    # Gelo frio: deve coincidir com o solvedor de temperatura
+    gerador = np.random.default_rng(0)
+    H = gerador.uniform(300.0, 3000.0, 500)
+    T = np.linspace(-15.0, -30.0, n_niveis)[:, None] + np.zeros(H.size)
+    w = -0.2 * np.linspace(0.0, 1.0, n_niveis)[:, None] + np.zeros(H.size)
+    E = p["cp"] * T
+    for _ in range(50):
+        T = termico.evoluir_colunas(T, H, -30.0, 0.04, 10.0, w)
+        E = entalpia.evoluir_colunas(E, H, -30.0, 0.04, 10.0, w)
+    print(f"  gelo frio vs. SolvedorTermico: |dT| máx {np.abs(E / p['cp'] - T).max():.1e} K")
+
+    # Aquecimento por deformação concentrado perto da base: camada temperada e drenagem
+    H = np.full(3, 2000.0)
+    E = np.full((n_niveis, 3), -10.0 * p["cp"])
+    fonte = np.zeros((n_niveis, 3))
+    fonte[:6] = np.array([0.0, 2e5, 1e6])
+    for _ in range(200):
+        E = entalpia.evoluir_colunas(E, H, -25.0, 0.06, 10.0, None, fonte)
+    _, agua = entalpia.temperatura_e_agua(E, H)
+    print(f"  aquecimento basal 0 / 2e5 / 1e6 J m^-3 a^-1: camada temperada "
+          f"{entalpia.espessura_temperada.round().tolist()} m | água máx {agua.max(axis=0).round(4).tolist()} | "
+          f"drenagem {entalpia.agua_drenada.round(3).tolist()} m/a | derretimento basal "
+          f"{entalpia.derretimento_basal.round(3).tolist()} m/a")
+
+    for n_colunas in tamanhos:
+        H = gerador.uniform(100.0, 3200.0, n_colunas)
+        T0 = np.linspace(-1.0, -30.0, n_niveis)[:, None] + np.zeros(n_colunas)
+        E0 = p["cp"] * T0
+        w = -0.3 * np.linspace(0.0, 1.0, n_niveis)[:, None] * np.ones(n_colunas)
+        aquecimento = 50.0 * np.linspace(1.0, 0.0, n_niveis)[:, None] * np.ones(n_colunas)
+        saida = np.empty_like(T0)
+        # Regime basal já estabelecido, como em produção (a troca de regime é rara)
+        for _ in range(5):
+            entalpia.evoluir_colunas(E0, H, -25.0, 0.06, dt, w, aquecimento, n_varreduras=n_varreduras, out=E0)
+        t_termico = cronometrar(lambda: termico.evoluir_colunas(T0, H, -25.0, 0.06, dt, w, aquecimento, out=saida))
+        t_entalpia = cronometrar(lambda: entalpia.evoluir_colunas(E0, H, -25.0, 0.06, dt, w, aquecimento,
+                                                                  n_varreduras=n_varreduras, out=saida))
+        print(f"  {n_colunas:8d} colunas: entalpia {t_entalpia * 1e3:7.1f} ms/passo "
+              f"({t_entalpia / T0.size * 1e9:4.1f} ns/célula) | temperatura {t_termico * 1e3:7.1f} ms | "
+              f"razão {t_entalpia / t_termico:3.1f}x | colunas revarridas "
+              f"{entalpia.colunas_revarridas / n_colunas:5.1%} | base temperada {entalpia.base_temperada.mean():4.0%}")
+
+# ==============================================================================
+# 10. ESTADO 3D EM CAMADAS SIGMA (EstadoSigma): ORDEM DE MEMÓRIA
+# ==============================================================================
+def benchmark_estado_sigma(forma=(300, 300), n_camadas=20, passo_colunas=7):
+    from GRESM.infraestrutura.estado_sigma import EstadoSigma
+    from GRESM.dinamica_central.solvedor_termico import SolvedorTermico
+
+    print(f"\n[estado sigma] {forma[0]}x{forma[1]} colunas, {n_camadas + 1} níveis: "
+          "ordem 'camadas' (nível, y, x) vs. 'colunas' (y, x, nível)")
+    espessura = np.full(forma[0] * forma[1], 2000.0)
+    amostra = [(j, i) for j in range(0, forma[0], passo_colunas) for i in range(0, forma[1], passo_colunas)]
+    for ordem in ("camadas", "colunas"):
+        estado = EstadoSigma(forma, n_camadas, ("temperatura",), ordem=ordem)
+        estado["temperatura"] = np.linspace(-2.0, -30.0, estado.n_niveis)[:, None, None]
+        T = estado.niveis_colunas("temperatura")
+        termico = SolvedorTermico()
+        laplaciano = np.empty((estado.n_niveis, forma[0] - 2, forma[1] - 2))
+
+        def passo_termico():
+            termico.evoluir_colunas(T, espessura, -30.0, 0.05, 1.0, out=T)
+
+        def estencil_camadas(campo=estado["temperatura"], lap=laplaciano):
+            np.add(campo[:, 2:, 1:-1], campo[:, :-2, 1:-1], out=lap)
+            lap += campo[:, 1:-1, 2:]
+            lap += campo[:, 1:-1, :-2]
+            lap -= 4.0 * campo[:, 1:-1, 1:-1]
+
+        def perfis_colunas():
+            for j, i in amostra:
+                np.cumsum(estado.coluna("temperatura", j, i))
+
+        t_termico = cronometrar(passo_termico)
+        t_estencil = cronometrar(estencil_camadas)
+        t_perfis = cronometrar(perfis_colunas)
+        t_media = cronometrar(lambda: estado.media_vertical("temperatura"))
+        print(f"  {ordem:8s}: térmico em lote {t_termico * 1e3:6.1f} ms | laplaciano por camada "
+              f"{t_estencil * 1e3:6.1f} ms | {len(amostra)} perfis {t_perfis * 1e3:5.1f} ms | "
+              f"média vertical {t_media * 1e3:5.1f} ms")
+
+    # Troca entre componentes: cópia/transposição a cada entrega vs. visões sem cópia
+    estado = EstadoSigma(forma, n_camadas, ("temperatura", "idade"), ordem="camadas")
+    n_trocas = 10
+
+    def entregas_ingenuas():
+        copiados = 0
+        for _ in range(n_trocas):
+            for nome in estado.nomes:
+                por_coluna = np.ascontiguousarray(np.moveaxis(estado[nome], 0, -1))
+                estado[nome] = np.moveaxis(por_coluna, -1, 0)
+                copiados += 2 * por_coluna.nbytes
+        return copiados
+
+    def entregas_visoes():
+        for _ in range(n_trocas):
+            for nome in estado.nomes:
+                estado.niveis_colunas(nome)
+                estado.campo(nome)
+        return 0
+
+    def ida_e_volta():
+        estado.reordenar("colunas")
+        estado.reordenar("camadas")
+
+    t_ingenuo = cronometrar(entregas_ingenuas)
+    copiados = entregas_ingenuas()
+    t_visoes = cronometrar(entregas_visoes)
+    t_reordenar = cronometrar(ida_e_volta)
+    print(f"  {n_trocas} trocas de {len(estado.nomes)} campos: cópias ingênuas {t_ingenuo * 1e3:6.1f} ms "
+          f"({copiados / 2**20:5.0f} MiB copiados) | visões {t_visoes * 1e3:5.2f} ms (0 bytes) | "
+          f"reordenar ida e volta (uma vez, quando a ordem muda) {t_reordenar * 1e3:5.1f} ms, "
+          f"{estado.transposicoes} transposições no total")
+
+
+# ==============================================================================
+# 11. LEIS DE DESLIZAMENTO BASAL (FriccaoBasal): GRADE INTEIRA E NEWTON
+# ==============================================================================
+def benchmark_deslizamento(n_celulas=1000000, nx=200, n_camadas=10):
+    from GRESM.dinamica_central.friccao_basal import FriccaoBasal
+    from GRESM.dinamica_central.solvedor_ordem_superior import SolvedorOrdemSuperior
+
+    print(f"\n[DESLIZAMENTO] leis de atrito em {n_celulas} células e no Blatter-Pattyn ({nx} colunas)")
+    gerador = np.random.default_rng(0)
+    u = gerador.uniform(-2000.0, 2000.0, n_celulas)
+    N = gerador.uniform(1e4, 5e6, n_celulas)
+    C = gerador.uniform(0.5, 1.5, n_celulas)
+    x = np.linspace(0.0, 400e3, nx)
+    leito = 200.0 * np.sin(x / 20e3)
+    espessura = np.maximum(3000.0 * np.sqrt(np.clip(1.0 - (x / 350e3) ** 2, 0.0, None)), 0.0)
+
+    for lei in FriccaoBasal.LEIS:
+        friccao = FriccaoBasal({"lei": lei})
+        coeficiente = C * friccao._params["C_" + lei]
+        t_lei = cronometrar(lambda: friccao.coeficiente_atrito(u, N, coeficiente, derivada=True))
+        _, derivada = friccao.coeficiente_atrito(u, N, coeficiente, derivada=True)
+        h = 1e-3
+        numerica = (friccao.coeficiente_atrito(np.abs(u) + h, N, coeficiente) -
+                    friccao.coeficiente_atrito(np.abs(u) - h, N, coeficiente)) / (2 * h)
+        erro_derivada = np.max(np.abs(derivada - numerica) / np.abs(numerica))
+        rapidez = friccao.velocidade_deslizamento(friccao.calcular_tau_basal(u, N, coeficiente), N, coeficiente)
+        rapida = (np.abs(u) > 100.0) & (rapidez < friccao._params["velocidade_maxima"])
+        erro_inversao = np.max(np.abs(rapidez[rapida] / np.abs(u[rapida]) - 1.0))
+
+        N_transecto = friccao.pressao_efetiva(espessura, leito)
+        linha = []
+        for metodo in ("picard", "newton"):
+            solvedor = SolvedorOrdemSuperior(n_camadas=n_camadas, metodo=metodo)
+            t0 = time.perf_counter()
+            solvedor.resolver(x, leito, espessura, friccao=friccao, pressao_efetiva=N_transecto)
+            linha.append(f"{metodo} {time.perf_counter() - t0:5.2f} s, "
+                         f"{solvedor.iteracoes_picard + solvedor.iteracoes_newton:2d} it"
+                         f"{'' if solvedor.convergiu else ' (sem convergir)'}")
+        print(f"  {lei:8s}: beta^2 e derivada {t_lei / n_celulas * 1e9:5.1f} ns/célula | erro da derivada "
+              f"{erro_derivada:.1e} | inversão tau->u {erro_inversao:.1e} | " + " | ".join(linha))
+
+
+# ==============================================================================
+# 12. LINHA DE ATERRAMENTO EM BANDA ESTREITA (LinhaBase)
+# ==============================================================================
+def benchmark_linha_base(tamanhos=(400, 1600), n_passos=20):
+    from GRESM.dinamica_central.linha_base import LinhaBase
+
+    print(f"\n[LINHA DE ATERRAMENTO] banda estreita vs. máscara no domínio inteiro, {n_passos} passos")
+    # Planta 400 km x 400 km com linha circular avançando 100 m por passo
+    for n in tamanhos:
+        coordenadas = np.arange(n) * (400e3 / n)
+        raio = np.hypot(coordenadas[None, :] - 200e3, coordenadas[:, None] - 200e3)
+        espessura = np.full(raio.shape, 600.0)
+        leitos = [-600.0 * 917.0 / 1028.0 - 0.01 * (raio - 100e3 - 100.0 * passo) for passo in range(n_passos + 1)]
+        rastreador = LinhaBase()
+        rastreador.iniciar_rastreamento(espessura, leitos[0])
+        t_banda = t_completa = 0.0
+        for leito in leitos[1:]:
+            t0 = time.perf_counter()
+            rastreador.atualizar(espessura, leito)
+            t_banda += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            mascara = rastreador.encontrar_posicao(espessura, 0.0, leito)
+            t_completa += time.perf_counter() - t0
+        iguais = np.array_equal(mascara.astype(bool), rastreador.flutuante)
+        pontos = rastreador.posicao_subgrade(coordenadas, coordenadas)
+        erro_posicao = np.abs(np.hypot(pontos[:, 0] - 200e3, pontos[:, 1] - 200e3) - 100e3 - 100.0 * n_passos).max()
+        area_exata = np.pi * (100e3 + 100.0 * n_passos) ** 2 / (400e3 / n) ** 2
+        e = rastreador.estatisticas
+        print(f"  {n}x{n}: banda {t_banda / n_passos * 1e3:6.2f} ms/passo ({e['celulas_avaliadas']} células, "
+              f"{e['reconstrucoes_banda']} reconstruções, {e['recalculos_completos']} recálculos) | domínio inteiro "
+              f"{t_completa / n_passos * 1e3:6.2f} ms ({raio.size} células) | máscaras iguais: {iguais} | "
+              f"erro da posição {erro_posicao:5.1f} m | área aterrada: fração {rastreador.fracao_aterrada.sum() / area_exata - 1:+.1e}, "
+              f"binária {(~rastreador.flutuante).sum() / area_exata - 1:+.1e}")
+
+    # Transecto com leito curvo: posição da linha pela máscara binária e sub-grade
+    for dx in (4e3, 1e3, 250.0):
+        x = np.arange(0.0, 300e3 + dx / 2, dx)
+        leito = 600.0 - 0.012 * x + 1.5e-8 * x ** 2
+        espessura = 800.0 - 1e-3 * x
+        rastreador = LinhaBase()
+        rastreador.iniciar_rastreamento(espessura, leito)
+        fino = np.linspace(0.0, 300e3, 3000001)
+        phi_fino = rastreador.funcao_flutuacao(800.0 - 1e-3 * fino, 600.0 - 0.012 * fino + 1.5e-8 * fino ** 2)
+        x_exato = fino[np.argmax(phi_fino <= 0.0)]
+        binaria = x[~rastreador.flutuante].max() + 0.5 * dx
+        print(f"  transecto dx={dx / 1e3:5.2f} km: erro da posição binária {abs(binaria - x_exato):7.1f} m | "
+              f"sub-grade {abs(rastreador.posicao_subgrade(x)[0] - x_exato):7.2f} m")
+
+
+# ==============================================================================
+# 13. FRENTES DE CALVING POR CONJUNTO DE NÍVEL (LeiCalving)
+# ==============================================================================
+def benchmark_calving(n=1000, dx=1e3, n_frentes=(17, 17), n_passos=20, velocidade=(300.0, -150.0), recuo=150.0):
+    from GRESM.dinamica_central.lei_calving import LeiCalving
+
+    print(f"\n[CALVING] {n_frentes[0] * n_frentes[1]} frentes em conjunto de nível numa grade {n}x{n} "
+          f"({dx / 1e3:g} km), {n_passos} passos anuais")
+    gerador = np.random.default_rng(0)
+    coordenadas = np.arange(n) * dx
+    centros_y, centros_x = (a.ravel() + gerador.uniform(-0.1, 0.1, a.size) * n * dx / n_frentes[0]
+                            for a in np.meshgrid(*[(np.arange(k) + 0.5) * n * dx / k for k in n_frentes],
+                                                 indexing="ij"))
+    raios = gerador.uniform(8e3, 14e3, centros_x.size)
+
+    def distancia_exata(t):
+        """Discos transladados com u t e raios reduzidos pelo recuo (m)."""
+        distancia = np.full((n, n), np.inf)
+        for cx, cy, r in zip(centros_x + velocidade[0] * t, centros_y + velocidade[1] * t, raios - recuo * t):
+            j0, j1 = np.searchsorted(coordenadas, [cy - r - 8 * dx, cy + r + 8 * dx])
+            i0, i1 = np.searchsorted(coordenadas, [cx - r - 8 * dx, cx + r + 8 * dx])
+            janela = np.hypot(coordenadas[None, i0:i1] - cx, coordenadas[j0:j1, None] - cy) - r
+            np.minimum(distancia[j0:j1, i0:i1], janela, out=distancia[j0:j1, i0:i1])
+        return np.minimum(distancia, 50 * dx)
+
+    calving = LeiCalving()
+    t0 = time.perf_counter()
+    calving.iniciar_frente(distancia_exata(0.0), dx)
+    t_inicio = time.perf_counter() - t0
+    t_adveccao, t_reinicializacao, n_adveccao, n_reinicializacao = 0.0, 0.0, 0, 0
+    for _ in range(n_passos):
+        antes = calving.estatisticas["reinicializacoes"]
+        t0 = time.perf_counter()
+        calving.avancar_frente(velocidade[0], velocidade[1], recuo, 1.0)
+        decorrido = time.perf_counter() - t0
+        if calving.estatisticas["reinicializacoes"] > antes:
+            t_reinicializacao += decorrido
+            n_reinicializacao += 1
+        else:
+            t_adveccao += decorrido
+            n_adveccao += 1
+
+    exata = distancia_exata(float(n_passos)).ravel()
+    banda = calving.banda
+    perto = np.abs(exata[banda]) < dx
+    erro = calving.phi.ravel()[banda][perto] - exata[banda][perto]
+    area = calving.mascara_gelo.sum() / (exata < 0.0).sum() - 1.0
+
+    # Referência: o mesmo passo ENO2/RK2 aplicado a todas as células da grade
+    phi = calving.phi.ravel().copy()
+    j, i = np.divmod(np.arange(n * n), n)
+    deslocamentos = np.array([-2, -1, 1, 2])[:, None]
+    em_x = j * n + np.clip(i + deslocamentos, 0, n - 1)
+    em_y = np.clip(j + deslocamentos, 0, n - 1) * n + i
+
+    def passo_grade_inteira():
+        tendencia = calving._tendencia(phi, phi[em_x], phi[em_y], velocidade[0], velocidade[1], recuo, dx, dx)
+        intermediario = phi + 0.5 * tendencia
+        return calving._tendencia(intermediario, intermediario[em_x], intermediario[em_y],
+                                  velocidade[0], velocidade[1], recuo, dx, dx)
+
+    t_grade = cronometrar(passo_grade_inteira) * calving.estatisticas["subpassos"]
+    por_passo = (t_adveccao + t_reinicializacao) / n_passos
+    print(f"  banda: {banda.size} células ({banda.size / n**2:.1%} da grade) | início {t_inicio:5.2f} s | "
+          f"advecção {t_adveccao / max(n_adveccao, 1) * 1e3:6.1f} ms/passo | reinicialização por marcha rápida "
+          f"{t_reinicializacao / max(n_reinicializacao, 1) * 1e3:6.1f} ms ({n_reinicializacao}x) | média "
+          f"{por_passo * 1e3:6.1f} ms/passo vs. {t_grade * 1e3:6.1f} ms para a grade inteira")
+    print(f"  erro da frente após {n_passos} anos: médio {erro.mean():+6.1f} m, máximo {np.abs(erro).max():6.1f} m | "
+          f"área de gelo {area:+.2%}")
+
+
+# ==============================================================================
+# 14. DANO ADVECTADO COM TENSÕES PRINCIPAIS VETORIZADAS (MecanicaDano)
+# ==============================================================================
+def benchmark_dano(n=1000, dx=1e3, n_passos=10):
+    from GRESM.dinamica_central.mecanica_dano import MecanicaDano
+
+    print(f"\n[DANO] fonte + transporte upwind conservativo numa grade {n}x{n}, {n_passos} passos anuais")
+    gerador = np.random.default_rng(0)
+    tensao = tuple(gerador.normal(0.0, 2e5, (n, n)) for _ in range(3))
+    dano_mecanica = MecanicaDano()
+
+    # Tensões principais: forma fechada vs. eigvalsh em (n, n, 2, 2)
+    s_xx, s_yy, s_xy = tensao
+    tensores = np.stack([np.stack([s_xx, s_xy], -1), np.stack([s_xy, s_yy], -1)], -2)
+    t_fechada = cronometrar(lambda: dano_mecanica.tensor.tensoes_principais(s_xx, s_yy, s_xy))
+    t_lapack = cronometrar(lambda: np.linalg.eigvalsh(tensores), repeticoes=1)
+    maior, _ = dano_mecanica.tensor.tensoes_principais(s_xx, s_yy, s_xy)
+    diferenca = np.abs(maior - np.linalg.eigvalsh(tensores)[..., 1]).max()
+    print(f"  tensões principais: forma fechada {t_fechada / n**2 * 1e9:5.1f} ns/célula vs. eigvalsh "
+          f"{t_lapack / n**2 * 1e9:6.1f} ns/célula ({t_lapack / t_fechada:4.1f}x) | diferença {diferenca:.1e} Pa")
+
+    # Passo completo: campo de velocidade em rotação, dano nasce onde chi passa do limiar
+    coordenadas = (np.arange(n) - n / 2) * dx
+    u = -0.5e-3 * coordenadas[:, None] * np.ones((1, n))
+    v = 0.5e-3 * coordenadas[None, :] * np.ones((n, 1))
+    dano = np.zeros((n, n))
+    t0 = time.perf_counter()
+    for _ in range(n_passos):
+        dano = dano_mecanica.evoluir_dano(dano, tensao, 1.0, u, v, dx)
+    por_passo = (time.perf_counter() - t0) / n_passos
+    subpassos = dano_mecanica._cache["subpassos_transporte"]
+    print(f"  passo: {por_passo * 1e3:6.1f} ms ({por_passo / n**2 * 1e9:5.1f} ns/célula, {subpassos} subpasso(s) "
+          f"de transporte) | D médio {dano.mean():.3f}, máximo {dano.max():.3f}")
+
+    # Conservação: só transporte, sem fluxo pelas bordas
+    mancha = 0.5 * np.exp(-(coordenadas[None, :]**2 + (coordenadas[:, None] - 0.2 * n * dx)**2) / (20 * dx)**2)
+    transportada = dano_mecanica.transportar_dano(mancha, u, 20.0, dx, v)
+    print(f"  conservação em 20 anos de rotação: erro relativo da soma "
+          f"{abs(transportada.sum() / mancha.sum() - 1.0):.1e}, mínimo {transportada.min():.1e}")
+
+
+# ==============================================================================
+# 15. FÁBRICA a2 EM LOTE (EvolucaoAnisotropia)
+# ==============================================================================
+def benchmark_anisotropia(n_colunas=100000, n_niveis=11, dt=1.0):
+    from GRESM.dinamica_central.evolucao_anisotropia import EvolucaoAnisotropia
+    from GRESM.dinamica_central.solvedor_termico import SolvedorTermico
+
+    print(f"\n[FÁBRICA] tensor de orientação a2 em {n_niveis} níveis x {n_colunas} colunas, dt={dt:g} a")
+    fabrica = EvolucaoAnisotropia()
+
+    # Validação: compressão uniaxial vertical -> máximo único em z; realce em cisalhamento simples
+    compressao = np.diag([0.5e-2, 0.5e-2, -1e-2])[None]
+    a2 = np.eye(3)[None] / 3.0
+    for _ in range(10):
+        fabrica.atualizar_tecido(a2, compressao, 20.0, out=a2)
+    cisalhamento = np.zeros((1, 3, 3))
+    cisalhamento[0, 0, 2] = 1e-2
+    print(f"  compressão uniaxial, 200 a: autovalores {np.round(np.linalg.eigvalsh(a2[0]), 3).tolist()} | "
+          f"realce no cisalhamento simples {fabrica.fator_realce(a2, cisalhamento)[0]:.2f} "
+          f"(isotrópico {fabrica.fator_realce(np.eye(3)[None] / 3.0, cisalhamento)[0]:.2f}), "
+          f"na compressão {fabrica.fator_realce(a2, compressao)[0]:.2f}")
+
+    gerador = np.random.default_rng(0)
+    gradiente = gerador.normal(0.0, 1e-3, (n_niveis, n_colunas, 3, 3))
+    gradiente -= np.eye(3) * (np.trace(gradiente, axis1=2, axis2=3)[..., None, None] / 3.0)
+    tecido = np.broadcast_to(np.eye(3) / 3.0, gradiente.shape).copy()
+    realce = np.empty((n_niveis, n_colunas))
+    t_tecido = cronometrar(lambda: fabrica.atualizar_tecido(tecido, gradiente, dt, out=tecido))
+    t_realce = cronometrar(lambda: fabrica.fator_realce(tecido, gradiente, out=realce))
+    t_fundido = cronometrar(lambda: fabrica.atualizar_tecido(tecido, gradiente, dt, out=tecido,
+                                                             realce=realce))
+
+    # Mesma evolução com matmul em (N, 3, 3), sem blocos (referência)
+    def matmul_direto():
+        a = tecido.reshape(-1, 3, 3)
+        L = gradiente.reshape(-1, 3, 3)
+        D = 0.5 * (L + L.transpose(0, 2, 1))
+        W = L - D
+        aD = np.einsum("nij,nij->n", a, D)
+        f = np.clip(1.0 - 27.0 * np.linalg.det(a), 0.0, 1.0)[:, None, None]
+        P = a @ D
+        a4D = (1.0 - f) * (2.0 / 7.0 * (P + P.transpose(0, 2, 1)) - 2.0 / 35.0 * D +
+                           aD[:, None, None] / 7.0 * np.eye(3)) + f * aD[:, None, None] * a
+        Q = W @ a
+        return a + dt * (Q + Q.transpose(0, 2, 1) - (P + P.transpose(0, 2, 1) - 2.0 * a4D))
+    t_direto = cronometrar(matmul_direto, repeticoes=1)
+
+    termico = SolvedorTermico()
+    T = np.linspace(-5.0, -30.0, n_niveis)[:, None] + np.zeros(n_colunas)
+    H = gerador.uniform(100.0, 3200.0, n_colunas)
+    saida = np.empty_like(T)
+    t_termico = cronometrar(lambda: termico.evoluir_colunas(T, H, -25.0, 0.06, dt, out=saida))
+
+    pontos = n_niveis * n_colunas
+    print(f"  a2: {t_tecido * 1e3:6.1f} ms/passo ({t_tecido / pontos * 1e9:5.1f} ns/ponto, "
+          f"{fabrica._cache['subpassos']} subpasso(s)) vs. matmul direto {t_direto / pontos * 1e9:5.1f} ns/ponto "
+          f"({t_direto / t_tecido:3.1f}x) | realce {t_realce / pontos * 1e9:5.1f} ns/ponto, junto com a2 "
+          f"+{(t_fundido - t_tecido) / pontos * 1e9:5.1f} ns/ponto")
+    print(f"  colunas térmicas no mesmo estado: {t_termico / pontos * 1e9:5.1f} ns/célula -> fábrica + realce "
+          f"anuais = {t_fundido / t_termico:4.1f}x o passo térmico")
+    # A fábrica muda em séculos: com intervalo próprio no agendador o custo se dilui; os pontos
+    # são agrupados pelo número de subpassos, e só os mais rápidos pagam os subpassos extras
+    for intervalo in (10.0, 50.0):
+        t_longo = cronometrar(lambda: fabrica.atualizar_tecido(tecido, gradiente, intervalo, out=tecido,
+                                                               realce=realce))
+        print(f"    a cada {intervalo:3g} a (até {fabrica._cache['subpassos']:2d} subpassos): "
+              f"{t_longo / pontos * 1e9:6.1f} ns/ponto por atualização = "
+              f"{t_longo / intervalo / t_termico:4.2f}x o passo térmico por ano")
+
+    # Campo heterogêneo: 2% das colunas (correntes de gelo) deformam 30x mais rápido
+    corrente = gerador.random(n_colunas) < 0.02
+    gradiente[:, corrente] *= 30.0
+    print(f"  com {corrente.mean():.0%} das colunas 30x mais rápidas, a cada 10 a:")
+    for rotulo, agrupar in (("pontos agrupados por subpassos", True), ("subpassos do ponto mais rápido", False)):
+        if not agrupar:
+            fabrica._ordem_por_subpassos = lambda L, dt: None
+        t_rapido = cronometrar(lambda: fabrica.atualizar_tecido(tecido, gradiente, 10.0, out=tecido,
+                                                                realce=realce), repeticoes=1)
+        print(f"    {rotulo}: {t_rapido / pontos * 1e9:6.1f} ns/ponto por atualização "
+              f"(até {fabrica._cache['subpassos']} subpassos) = {t_rapido / 10.0 / t_termico:4.2f}x "
+              f"o passo térmico por ano")
+
+
+# ==============================================================================
+# 16. MALHA MÓVEL ALE COM MÉTRICAS EM CACHE (MalhaMovel)
+# ==============================================================================
+def benchmark_malha(nx=2000, ny=500, n_passos=200, fracao_movel=0.1, velocidade=50.0):
+    from GRESM.dinamica_central.malha_movel import MalhaMovel
+
+    print(f"\n[MALHA ALE] transecto de {nx} nós ({ny} linhas em planta), frente avançando "
+          f"{velocidade:g} m/a nos últimos {fracao_movel:.0%} dos nós, {n_passos} passos")
+    x0 = np.linspace(0.0, 200e3, nx)
+    # Só a região da frente se move: velocidade da malha cresce até a última célula
+    w = np.zeros(nx)
+    inicio = int(nx * (1.0 - fracao_movel))
+    w[inicio:] = np.linspace(0.0, velocidade, nx - inicio)
+    campo = np.cos(x0 / 7e3)[None, :] + np.linspace(1.0, 2.0, ny)[:, None]
+
+    def passos_cacheados(f):
+        malha = MalhaMovel()
+        malha.iniciar_malha(x0)
+        declividade, div_fluxo = np.empty_like(f), np.empty_like(f)
+        for _ in range(n_passos):
+            malha.atualizar_nos(None, w, 1.0)
+            malha.gradiente(f, out=declividade)
+            malha.gradiente(declividade, out=div_fluxo)
+        return malha, div_fluxo
+
+    def passos_np_gradient(f):
+        x = x0.copy()
+        for _ in range(n_passos):
+            x += w
+            declividade = np.gradient(f, x, axis=-1)
+            div_fluxo = np.gradient(declividade, x, axis=-1)
+        return x, div_fluxo
+
+    # Por passo, como em _passo_classico: mover os nós e dois gradientes (declividade, divergência)
+    for rotulo, f in (("transecto", campo[0]), (f"planta {ny}x{nx}", campo)):
+        t_cache = cronometrar(lambda: passos_cacheados(f), repeticoes=1)
+        t_numpy = cronometrar(lambda: passos_np_gradient(f), repeticoes=1)
+        malha, declividade = passos_cacheados(f)
+        x, referencia = passos_np_gradient(f)
+        est = malha.estatisticas
+        print(f"  {rotulo}, mover + 2 gradientes: cache {t_cache / n_passos * 1e6:7.1f} us/passo vs. "
+              f"np.gradient(f, x) {t_numpy / n_passos * 1e6:7.1f} us/passo ({t_numpy / t_cache:3.1f}x) | "
+              f"diferença {np.abs(declividade - referencia).max():.1e} | {est['atualizacoes_parciais']} "
+              f"atualizações parciais, {est['recalculos']} recálculo(s)")
+
+    # Malha parada: só o gradiente com coeficientes em cache
+    f = campo[0]
+    declividade = np.empty_like(f)
+    t_cache = cronometrar(lambda: malha.gradiente(f, out=declividade))
+    t_numpy = cronometrar(lambda: np.gradient(f, malha.x))
+    print(f"  transecto, malha parada: gradiente em cache {t_cache * 1e6:6.1f} us vs. np.gradient(f, x) "
+          f"{t_numpy * 1e6:6.1f} us ({t_numpy / t_cache:3.1f}x)")
+
+    # Métricas: atualização local vs. recálculo completo da malha
+    t_parcial = cronometrar(lambda: malha._atualizar_metricas(inicio, nx))
+    t_completo = cronometrar(lambda: malha._atualizar_metricas())
+    print(f"  métricas: parcial ({nx - inicio} nós) {t_parcial * 1e6:6.1f} us vs. completa "
+          f"{t_completo * 1e6:6.1f} us ({t_completo / t_parcial:3.1f}x)")
+
+    # Frente avançando até esticar as células: remapeamento conservativo dos campos
+    malha = MalhaMovel({"razao_estiramento_maxima": 1.5})
+    malha.iniciar_malha(x0)
+    espessura = campo.copy()
+    erro_maximo = 0.0
+    for _ in range(n_passos):
+        malha.atualizar_nos(None, w * 10.0, 1.0)
+        if malha.estiramento() > 1.5:
+            integral = espessura @ malha.volumes
+            malha.remapear({"espessura": espessura})
+            erro_maximo = max(erro_maximo, np.abs(espessura @ malha.volumes / integral - 1.0).max())
+    est = malha.estatisticas
+    print(f"  {n_passos} passos de {velocidade * 10:g} m/a: {est['remapeamentos']} remapeamento(s), "
+          f"estiramento final {est['estiramento']:.2f} | erro relativo da integral no remapeamento {erro_maximo:.1e}")
+
+
+# ==============================================================================
+# 17. INVERSÃO DO ATRITO BASAL PELO ADJUNTO (ControleInversao)
+# ==============================================================================
+def benchmark_inversao(nx=200, n_camadas=6, max_iter=100):
+    from GRESM.dinamica_central.solvedor_ordem_superior import SolvedorOrdemSuperior
+    from GRESM.dinamica_central.controle_inversao import ControleInversao
+
+    print(f"\n[INVERSÃO] beta^2 no transecto Blatter-Pattyn, {nx} colunas x {n_camadas} camadas "
+          f"(experimento gêmeo, L-BFGS-B até {max_iter} iterações)")
+    x = np.linspace(0.0, 400e3, nx)
+    leito = 200.0 * np.sin(x / 20e3)
+    espessura = np.maximum(3000.0 * np.sqrt(np.clip(1.0 - (x / 350e3) ** 2, 0.0, None)), 0.0)
+    beta2_real = 1e3 * np.exp(1.5 * np.sin(x / 40e3))
+    direto = SolvedorOrdemSuperior(n_camadas=n_camadas, tol_relativa=1e-8)
+    observada = direto.resolver(x, leito, espessura, beta2_real)[:, -1].copy()
+    observada[espessura < direto.espessura_minima] = np.nan
+
+    # Gradiente adjunto vs. diferenças finitas em ln beta^2
+    controle = ControleInversao({"regularizacao_atrito": 0.0})
+    log_beta2 = np.full(nx, np.log(1e3))
+    custo, gradiente, _ = controle.custo_e_gradiente(direto, x, leito, espessura, observada, log_beta2)
+    erros = []
+    for i in (nx // 8, nx // 3, nx // 2):
+        perturbado = [log_beta2.copy(), log_beta2.copy()]
+        perturbado[0][i] += 1e-4
+        perturbado[1][i] -= 1e-4
+        custos = [controle.custo_e_gradiente(direto, x, leito, espessura, observada, c)[0] for c in perturbado]
+        erros.append(abs((custos[0] - custos[1]) / 2e-4 / gradiente[i] - 1.0))
+    # Os dois partem da solução anterior perturbada em 1% (como entre iterações do L-BFGS)
+    def solucao_direta():
+        direto.resolver(x, leito, espessura, np.exp(log_beta2), u_inicial=direto.u * 0.99)
+
+    def custo_e_gradiente():
+        direto.u *= 0.99
+        controle.custo_e_gradiente(direto, x, leito, espessura, observada, log_beta2)
+
+    t_direto = cronometrar(solucao_direta)
+    t_gradiente = cronometrar(custo_e_gradiente)
+    print(f"  gradiente adjunto vs. diferenças finitas: erro relativo máx. {max(erros):.1e} | custo de um gradiente "
+          f"{t_gradiente * 1e3:6.1f} ms (direta + adjunta) = {t_gradiente / t_direto:3.1f}x uma solução direta "
+          f"({t_direto * 1e3:6.1f} ms); diferenças finitas: {nx} soluções ({nx * t_direto:5.1f} s)")
+
+    controle = ControleInversao({"max_iter_lbfgs": max_iter})
+    t0 = time.perf_counter()
+    resultado = controle.inverter(SolvedorOrdemSuperior(n_camadas=n_camadas, tol_relativa=1e-8),
+                                  x, leito, espessura, observada, beta2_inicial=1e3)
+    t_inversao = time.perf_counter() - t0
+    gelo = espessura >= direto.espessura_minima
+    erro_beta2 = np.sqrt(np.mean(np.log(resultado["beta2"][gelo] / beta2_real[gelo]) ** 2))
+    print(f"  inversão: {t_inversao:5.1f} s, {resultado['iteracoes']} iterações, {resultado['solucoes_diretas']} "
+          f"soluções diretas + adjuntas | desajuste RMS {resultado['desajuste_rms_inicial']:7.2f} -> "
+          f"{resultado['desajuste_rms']:5.2f} m/a | erro RMS de ln beta^2 {erro_beta2:.2f}")
+
+
+# ==============================================================================
+# 18. CINEMÁTICA COMPARTILHADA POR ITERAÇÃO (CacheCinematica)
+# ==============================================================================
+def benchmark_cinematica(n=1000, dx=1e3, nx_fo=400, n_camadas=10):
+    from GRESM.dinamica_central.cache_cinematica import CacheCinematica
+    from GRESM.dinamica_central.calculadora_viscosidade import CalculadoraViscosidade
+    from GRESM.dinamica_central.mecanica_dano import MecanicaDano
+    from GRESM.dinamica_central.solvedor_termico import SolvedorTermico
+    from GRESM.dinamica_central.solvedor_ordem_superior import SolvedorOrdemSuperior
+
+    print(f"\n[CINEMÁTICA] gradientes, e^2 e tensão uma vez por iteração, grade {n}x{n} e Blatter-Pattyn")
+    gerador = np.random.default_rng(0)
+    y, x = np.meshgrid(np.arange(n) * dx, np.arange(n) * dx, indexing="ij")
+    u = 100.0 * np.sin(x / 50e3) * np.cos(y / 70e3) + gerador.normal(0.0, 1.0, (n, n))
+    v = 50.0 * np.cos(x / 60e3) + gerador.normal(0.0, 1.0, (n, n))
+    temperatura = -10.0
+    viscosidade, dano, termico = CalculadoraViscosidade(), MecanicaDano(), SolvedorTermico()
+    D = np.zeros((n, n))
+
+    # Cada consumidor parte dos gradientes crus (o que cada módulo fazia por conta própria)
+    def consumidores_independentes():
+        def cinematica_crua():
+            dudy, dudx = np.gradient(u, dx)
+            dvdy, dvdx = np.gradient(v, dx)
+            e2 = dano.tensor.deformacao_efetiva_quadrado_planta(dudx, dudy, dvdx, dvdy)
+            return dudx, dudy, dvdx, dvdy, e2
+        eta = viscosidade.viscosidade_termica(cinematica_crua()[4], temperatura)
+        dudx, dudy, dvdx, dvdy, e2 = cinematica_crua()
+        fonte = dano.fonte_dano(D, dano.tensor.componentes_planta(
+            viscosidade.viscosidade_termica(e2, temperatura), dudx, dudy, dvdx, dvdy))
+        aquecimento = termico.aquecimento_deformacao(cinematica_crua()[4], temperatura)
+        return eta, fonte, aquecimento
+
+    def consumidores_com_cache():
+        cache = CacheCinematica("planta", dx=dx, dy=dx)
+        cache.atualizar(u, v)
+        eta = viscosidade.atualizar_viscosidade(cache, temperatura)
+        fonte = dano.fonte_dano(D, cache)
+        aquecimento = termico.aquecimento_deformacao(cache, temperatura)
+        return eta, fonte, aquecimento, cache
+
+    t_independente = cronometrar(consumidores_independentes)
+    t_cache = cronometrar(consumidores_com_cache)
+    *com_cache, cache = consumidores_com_cache()
+    diferenca = max(np.abs(a - b).max() / max(np.abs(b).max(), 1e-300)
+                    for a, b in zip(com_cache, consumidores_independentes()))
+    print(f"  viscosidade + fonte de dano + aquecimento: independentes {t_independente * 1e3:6.1f} ms vs. "
+          f"cache {t_cache * 1e3:6.1f} ms ({t_independente / t_cache:3.1f}x) | {cache.calculos} cálculos, "
+          f"{cache.reaproveitamentos} leituras reaproveitadas | diferença relativa {diferenca:.1e}")
+
+    # Newton de primeira ordem: resíduo, busca linear, Jacobiano e adjunto leem a mesma cache
+    xs = np.linspace(0.0, 400e3, nx_fo)
+    leito = 200.0 * np.sin(xs / 20e3)
+    espessura = np.maximum(3000.0 * np.sqrt(np.clip(1.0 - (xs / 350e3) ** 2, 0.0, None)), 0.0)
+    solvedor = SolvedorOrdemSuperior(n_camadas=n_camadas)
+    solvedor.resolver(xs, leito, espessura)
+    cache = solvedor.cinematica
+    antes = (cache.versao, cache.calculos, cache.reaproveitamentos)
+    solvedor.resolver(xs, leito, espessura * 1.002)
+    tau_xx, tau_xz = cache.tensao_desviadora()
+    print(f"  Newton BP ({nx_fo} colunas): {cache.versao - antes[0]} versões de u, {cache.calculos - antes[1]} "
+          f"grandezas calculadas, {cache.reaproveitamentos - antes[2]} leituras reaproveitadas | "
+          f"tau_xz máx. {np.abs(tau_xz).max() / 1e3:5.1f} kPa lido sem recalcular")
+
+
+# ==============================================================================
+# 19. ROTEAMENTO SUPRAGLACIAL D8/D-INF COM ORDEM TOPOLÓGICA (HidrologiaSupraglacial)
+# ==============================================================================
+def benchmark_supraglacial(n=1000, dx=100.0, n_passos=20, rebaixamento=0.05):
+    from GRESM.processos_superficie.hidrologia_supraglacial import HidrologiaSupraglacial
+    import scipy.sparse.linalg
+
+    print(f"\n[SUPRAGLACIAL] degelo roteado numa grade {n}x{n} (dx={dx:g} m), {n_passos} passos "
+          f"com rebaixamento de até {rebaixamento:g} m/passo")
+    gerador = np.random.default_rng(0)
+    y, x = np.meshgrid(np.arange(n) * dx, np.arange(n) * dx, indexing="ij")
+    superficie = 1500.0 - 0.01 * x - 0.004 * y + 15.0 * np.sin(x / 3e3) * np.cos(y / 4e3) + \
+        gerador.normal(0.0, 0.3, (n, n))
+    mascara = x < 0.95 * x.max()
+    derretimento = np.clip(2.0 - (superficie - 1000.0) / 500.0, 0.0, None)
+
+    for metodo in ("d8", "dinf"):
+        hidrologia = HidrologiaSupraglacial({"metodo_roteamento": metodo})
+        t_rede = cronometrar(lambda: hidrologia.construir_roteamento(superficie, dx, mascara=mascara), repeticoes=1)
+        vazao = np.empty((n, n))
+        t_acumular = cronometrar(lambda: hidrologia.acumular(derretimento, out=vazao))
+        c = hidrologia._cache
+        # Mesma acumulação sem a fatoração em cache: solução triangular a cada chamada
+        matriz = scipy.sparse.csr_matrix(c["lu"].L)
+        entrada = np.where(mascara, derretimento, 0.0).ravel()[c["ordem"]] * dx * dx
+        t_triangular = cronometrar(lambda: scipy.sparse.linalg.spsolve_triangular(matriz, entrada, lower=True),
+                                   repeticoes=1)
+        total = np.sum(derretimento[mascara]) * dx * dx
+        saida = vazao.ravel()[hidrologia.sumidouros()].sum() + vazao[~mascara].sum()
+        print(f"  {metodo:4s}: rede + ordem + fatoração {t_rede:5.2f} s | acumulação {t_acumular * 1e3:6.1f} ms "
+              f"vs. spsolve_triangular {t_triangular * 1e3:6.1f} ms ({t_triangular / t_acumular:3.1f}x) | "
+              f"{c['sumidouros'].size} sumidouros, balanço {abs(saida / total - 1.0):.1e}, "
+              f"vazão máx. {vazao.max() / 3.15e7:6.2f} m^3/s")
+
+    # Superfície evoluindo devagar: a rede só é refeita quando passa da tolerância
+    hidrologia = HidrologiaSupraglacial()
+    t0 = time.perf_counter()
+    for passo in range(n_passos):
+        atual = superficie - rebaixamento * passo * (1.0 + np.sin(x / 5e3))
+        hidrologia.rotear_agua_superficie(derretimento, atual, dx, mascara=mascara, out=vazao)
+    t_total = time.perf_counter() - t0
+    est = hidrologia.estatisticas
+    print(f"  {n_passos} passos: {t_total / n_passos * 1e3:6.1f} ms/passo, {est['reconstrucoes']} reconstrução(ões) "
+          f"da rede (tolerância {hidrologia._params['tolerancia_superficie']:g} m)")
+
+
+# ==============================================================================
+# 20. REDE SUBGLACIAL CANAL-CAVIDADE IMPLÍCITA (HidrologiaSubCanal.evoluir_rede)
+# ==============================================================================
+def benchmark_subglacial(ny=40, nx=80, dx=500.0, semanas_iniciais=6, dias=1):
+    from GRESM.processos_superficie.hidrologia_sub_canal import HidrologiaSubCanal
+    from GRESM.processos_superficie.hidrologia_sub_cavidade import fechamento_fluencia
+    from GRESM.dinamica_central.tabela_arrhenius import SEGUNDOS_POR_ANO
+
+    print(f"\n[SUBGLACIAL] rede lâmina + canais numa grade {ny}x{nx} (dx={dx:g} m), {dias} dia(s) "
+          f"após {semanas_iniciais} semanas de aquecimento em passos semanais")
+    x = np.arange(nx) * dx
+    espessura = np.broadcast_to(1500.0 * np.sqrt(np.clip((x - 0.5 * dx) / x[-1], 0.0, None)), (ny, nx)).copy()
+    leito = np.zeros((ny, nx))
+    gelo = espessura > 1.0
+    fonte = np.full((ny, nx), 0.01)
+    for j in (ny // 4, ny // 2, 3 * ny // 4):
+        fonte[j, nx // 5] += 2.0 * SEGUNDOS_POR_ANO / dx ** 2          # moulins de 2 m^3/s
+    deslizamento = 50.0
+    semana, dia = 7.0 / 365.25, 1.0 / 365.25
+
+    hidro = HidrologiaSubCanal()
+    phi, h, S = 0.9 * 917.0 * 9.81 * espessura, np.full((ny, nx), 0.05), None
+    for _ in range(semanas_iniciais):
+        r = hidro.evoluir_rede(phi, h, S, leito, espessura, deslizamento, fonte, semana, dx, mascara=gelo)
+        phi, h, S = r["potencial"], r["espessura_lamina"], r["secao_canal"]
+    inicial = (phi, h, S)
+
+    def implicito(n_passos):
+        phi, h, S = inicial
+        hidro._cache["fatoracoes"] = 0
+        for _ in range(n_passos):
+            r = hidro.evoluir_rede(phi, h, S, leito, espessura, deslizamento, fonte, dias * dia / n_passos,
+                                   dx, mascara=gelo)
+            phi, h, S = r["potencial"], r["espessura_lamina"], r["secao_canal"]
+        return r, hidro._cache["fatoracoes"]
+
+    t0 = time.perf_counter()
+    r_imp, fatoracoes = implicito(1)
+    t_implicito = time.perf_counter() - t0
+    r_ref, _ = implicito(4 * dias)
+
+    # Referência explícita: Euler explícito das mesmas equações discretas, passo
+    # limitado pela difusão do potencial (armazenamento / soma das condutâncias)
+    p, c = hidro._params, hidro._cache
+    a, b = c["arestas"].T
+    contorno, ativas, area, meio, n_nos = c["contorno"], c["ativas"], c["area"], 0.5 * c["comprimento"], ny * nx
+    capacidade = area * p["e_v"] / (p["rho_w"] * p["g"])
+    phi_0 = (p["rho_i"] * p["g"] * espessura).ravel()
+    m = fonte.ravel() / SEGUNDOS_POR_ANO
+    phi, h, S = inicial[0].ravel().copy(), inicial[1].ravel().copy(), inicial[2].copy()
+    t, t_final, subpassos = 0.0, dias * 86400.0, 0
+    t0 = time.perf_counter()
+    while t < t_final:
+        rede = hidro.condutancias(phi, h, S)
+        K = rede["K_lamina"] + rede["K_canal"]
+        dt = min(0.5 * np.min(capacidade / np.bincount(c["arestas"].ravel(), np.repeat(K, 2), n_nos)[~contorno]),
+                 t_final - t)
+        N = phi_0 - phi
+        dh = np.where(contorno, 0.0, hidro.cavidade.taxa_abertura(h, deslizamento, N) / SEGUNDOS_POR_ANO)
+        fechamento, _ = fechamento_fluencia(0.5 * (N[a] + N[b]), p["A_fluencia"], p["n_glen"])
+        dS = np.where(ativas, rede["dissipacao"] / (p["rho_i"] * p["L_f"]) - fechamento * S, 0.0)
+        vazao = K * (phi[a] - phi[b])
+        canal = meio * (dS - rede["dissipacao"] / (p["rho_w"] * p["L_f"]))
+        liquido = area * (m - dh) - np.bincount(a, vazao + canal, n_nos) - np.bincount(b, canal - vazao, n_nos)
+        phi = phi + np.where(contorno, 0.0, dt * liquido / capacidade)
+        h, S = h + dt * dh, S + dt * dS
+        t += dt
+        subpassos += 1
+    t_explicito = time.perf_counter() - t0
+
+    N_ref = r_ref["pressao_efetiva"][gelo]
+    erro_imp = np.max(np.abs(r_imp["pressao_efetiva"][gelo] - N_ref)) / np.max(N_ref)
+    erro_exp = np.max(np.abs((phi_0 - phi).reshape(ny, nx)[gelo] - N_ref)) / np.max(N_ref)
+    print(f"  implícito, 1 passo de {dias} dia(s): {t_implicito:6.2f} s ({r_imp['iteracoes']} iterações de Newton"
+          f"{'' if r_imp['convergiu'] else ' sem convergir'}, "
+          f"{fatoracoes} fatorações) | desvio de N vs. passos de 6 h {erro_imp:.1e}")
+    print(f"  explícito: {subpassos} subpassos de ~{t_final / subpassos:5.0f} s, {t_explicito:6.2f} s "
+          f"({t_explicito / t_implicito:4.1f}x) | desvio de N {erro_exp:.1e}")
+    print(f"  descarga nos exutórios {r_imp['descarga_contorno']:6.2f} m^3/s, canal máx. "
+          f"{np.max(r_imp['secao_canal']):5.2f} m^2, vazão máx. {np.max(np.abs(r_imp['vazao_canal'])):5.2f} m^3/s")
+
+
+# ==============================================================================
+# 21. TRANSPORTE ENGLACIAL: FENDAS/MOULINS E ATRASO EM FILTRO RECURSIVO (HidrologiaEnglacial)
+# ==============================================================================
+def benchmark_englacial(n=300, dx=500.0, n_passos=150, truncamento=1e-8):
+    from GRESM.processos_superficie.hidrologia_englacial import HidrologiaEnglacial
+
+    dt = 1.0 / 365.25
+    print(f"\n[ENGLACIAL] entrega ao leito numa grade {n}x{n} (dx={dx:g} m), {n_passos} passos diários")
+    gerador = np.random.default_rng(0)
+    y, x = np.meshgrid(np.arange(n) * dx, np.arange(n) * dx, indexing="ij")
+    tensao = (1.2e5 + 1e5 * np.sin(x / 7e3) * np.cos(y / 5e3) + gerador.normal(0.0, 3e4, (n, n)),
+              gerador.normal(0.0, 5e4, (n, n)), gerador.normal(0.0, 5e4, (n, n)))
+    espessura = 50.0 + 1500.0 * np.sqrt(x / x.max())
+    variacao = gerador.uniform(0.5, 1.5, (n, n))
+
+    def escoamento(k):
+        return max(0.0, 3.0 * np.sin(np.pi * k / 100.0)) * (k < 100) * variacao
+
+    englacial = HidrologiaEnglacial()
+    t_campos = cronometrar(lambda: englacial.campos_drenagem(tensao, espessura, escoamento(50), dx))
+    campos = englacial.campos_drenagem(tensao, espessura, escoamento(50), dx)
+    fendas, moulins = campos["fendas"], campos["moulins"]
+
+    # Núcleos discretos (resposta ao pulso unitário do próprio filtro), truncados
+    nucleos = []
+    for tempo in ("tempo_moulin", "tempo_fenda"):
+        filtro = HidrologiaEnglacial({"tempo_fenda": englacial._params[tempo]})
+        resposta = [filtro.transporte_vertical(np.ones(1), 1.0, dt)[0]]
+        while resposta[-1] > truncamento * max(resposta) or len(resposta) < 2:
+            resposta.append(filtro.transporte_vertical(np.zeros(1), 1.0, dt)[0])
+        nucleos.append(np.array(resposta))
+    L = max(k.size for k in nucleos)
+    nucleos = [np.pad(k, (0, L - k.size)) for k in nucleos]
+
+    entrega_filtro = np.empty((n, n))
+    t0 = time.perf_counter()
+    total_filtro = 0.0
+    for k in range(n_passos):
+        englacial.transporte_vertical(escoamento(k), fendas, dt, moulins, out=entrega_filtro)
+        total_filtro += entrega_filtro.sum() * dt
+    t_filtro = (time.perf_counter() - t0) / n_passos
+
+    # Convolução direta com buffer circular do histórico da entrada captada
+    historico = np.zeros((L, n, n))
+    t0 = time.perf_counter()
+    for k in range(n_passos):
+        entrada = escoamento(k)
+        historico[k % L] = np.where(moulins, entrada, entrada * fendas)
+        atraso = (k - np.arange(L)) % L          # atraso de cada posição do buffer
+        rapido = np.tensordot(nucleos[0][atraso], historico, axes=(0, 0))
+        lento = np.tensordot(nucleos[1][atraso], historico, axes=(0, 0))
+        entrega_convolucao = np.where(moulins, rapido, lento)
+    t_convolucao = (time.perf_counter() - t0) / n_passos
+
+    captado = sum(np.where(moulins, escoamento(k), escoamento(k) * fendas).sum() for k in range(n_passos)) * dt
+    balanco = abs(captado - total_filtro - englacial.armazenamento.sum()) / captado
+    print(f"  campos: {np.mean(fendas) * 100:4.1f}% com fendas, {np.mean(moulins) * 100:4.1f}% moulins, "
+          f"{t_campos * 1e3:5.1f} ms")
+    print(f"  filtro recursivo: {t_filtro * 1e3:6.2f} ms/passo, estado {englacial.reservatorios.nbytes / 2**20:5.1f} MiB"
+          f" | convolução ({L} passos): {t_convolucao * 1e3:7.2f} ms/passo, histórico "
+          f"{historico.nbytes / 2**20:6.1f} MiB ({t_convolucao / t_filtro:4.1f}x)")
+    print(f"  diferença máx. {np.max(np.abs(entrega_filtro - entrega_convolucao)):.1e} m/a | "
+          f"balanço (captado - entregue - armazenado) {balanco:.1e}")
+
+
+BENCHMARKS = {
+    "pdd": benchmark_pdd,
+    "passo": benchmark_passo_fundido,
+    "grade2d": benchmark_grade_2d,
+    "sia": benchmark_sia_semi_implicito,
+    "multitaxa": benchmark_multitaxa,
+    "ordem_superior": benchmark_ordem_superior,
+    "arrhenius": benchmark_arrhenius,
+    "termico": benchmark_termico,
+    "entalpia": benchmark_entalpia,
+    "sigma3d": benchmark_estado_sigma,
+    "deslizamento": benchmark_deslizamento,
+    "linha_base": benchmark_linha_base,
+    "calving": benchmark_calving,
+    "dano": benchmark_dano,
+    "anisotropia": benchmark_anisotropia,
+    "malha": benchmark_malha,
+    "inversao": benchmark_inversao,
+    "cinematica": benchmark_cinematica,
+    "supraglacial": benchmark_supraglacial,
+    "subglacial": benchmark_subglacial,
+    "englacial": benchmark_englacial,
+}
+
+if __name__ == "__main__":
+    selecionados = sys.argv[1:] or list(BENCHMARKS)
+    for nome in selecionados:
+        BENCHMARKS[nome]()
@@ -19,7 +19,7 @@ IMG_PATH = "/home/luiztiagowilcke188/.gemini/antigravity/brain/d2c03b6c-a33b-492
 print("Carregando resultados...")
 try:
     dados = np.load("resultados_gresm.npz", allow_pickle=True)
-    hist = dados['historico'].item()
+    hist = {k[len('historico_'):]: dados[k] for k in dados.files if k.startswith('historico_')}
     perfil = dados['perfis_finais'].item()
     
     anos = np.array(hist['ano'])
@@ -15,29 +15,82 @@ sys.path.append(os.getcwd())
 # Importar Modulos (Caminhos em Português)
 from GRESM.dinamica_central.solvedor_stokes import SolvedorStokes
 from GRESM.dinamica_central.conservacao_massa import ConservacaoMassa
+from GRESM.dinamica_central.integrador_temporal_dinamica import IntegradorTemporalDinamica
 from GRESM.dinamica_central.reologia_glen import ReologiaGlen
 from GRESM.dinamica_central.calculadora_viscosidade import CalculadoraViscosidade
+from GRESM.dinamica_central.friccao_basal import FriccaoBasal
 from GRESM.processos_superficie.smb_acumulo import SmbAcumulo
 from GRESM.processos_superficie.smb_ablacao import SmbAblacao
 from GRESM.condicoes_contorno.acoplador_atmosfera import AcopladorAtmosfera
 from GRESM.condicoes_contorno.leitor_topografia import LeitorTopografia
 from GRESM.condicoes_contorno.forcante_nivel_mar import ForcanteNivelMar
 from GRESM.geosfera_posglacial.gia_viscoelastico import GiaViscoelastico
+from GRESM.dinamica_central.malha_movel import MalhaMovel
+from GRESM.infraestrutura.buffers_trabalho import BuffersTrabalho, medir_alocacao
+from GRESM.infraestrutura.registro_historico import RegistroHistorico
+from GRESM.infraestrutura.driver_principal import DriverPrincipal
 
 class SimulacaoGRESM:
-    def __init__(self):
+    # Intervalos de acoplamento padrão (anos); ver _registrar_componentes
+    INTERVALOS_ACOPLAMENTO = {"temp_ar": 1.0, "nivel_mar": 1.0, "smb": 1.0, "gia": 50.0}
+
+    def __init__(self, modo_passo="fundido", diretorio_historico=None, grade="1d", dx_2d=5.0,
+                 config_topografia=None, dinamica="sia_semi_implicito", dt=1.0,
+                 intervalos_acoplamento=None, deslizamento=None):
         self.tempo_total = 200 # anos
-        self.dt = 1.0 # passo de tempo
-        self.anos = np.arange(0, self.tempo_total, self.dt)
+        self.dt = dt # intervalo das forçantes (anos); a dinâmica SIA é subciclada dentro dele
+        self.driver = DriverPrincipal()
+        self.anos = self.driver.loop_principal(self.tempo_total, self.dt)
+        self.lapse_rate = 0.0065
         
         # Inicializacao
-        self.topo = LeitorTopografia()
-        self.x, self.leito, self.superficie = self.topo.carregar_dados()
+        # grade "1d": transecto de 200 nós; "2d": planta (y, x) com espaçamento dx_2d (km).
+        # config_topografia={"rasters": {...}, "janela": ...} lê a planta de rasters mapeados
+        self.topo = LeitorTopografia(config_topografia)
+        if grade == "2d":
+            self.x, self.y, self.leito, self.superficie = self.topo.carregar_dados_2d(dx=dx_2d)
+            self.dy = self.y[1] - self.y[0]
+        else:
+            self.x, self.leito, self.superficie = self.topo.carregar_dados()
+            self.y, self.dy = None, 1.0
+        self.ndim = self.leito.ndim
         self.espessura = self.superficie - self.leito
+        self.dx = self.x[1] - self.x[0]
+        self.area_celula = self.dx * self.dy
+        # Métricas dos eixos (larguras e coeficientes do gradiente) em cache: os
+        # gradientes dos passos clássico e fundido (dinâmica "legado") leem daqui.
+        # Os modos SIA usam o espaçamento uniforme self.dx/self.dy; regradear
+        # refaz as métricas quando a grade é reamostrada
+        self.malha_x = MalhaMovel()
+        self.malha_x.iniciar_malha(self.x)
+        self.malha_y = None
+        if self.ndim == 2:
+            self.malha_y = MalhaMovel()
+            self.malha_y.iniciar_malha(self.y)
+
+        # "fundido": buffers alocados uma vez e kernels com out= (memória constante)
+        # "classico": expressões NumPy que alocam temporários a cada passo
+        self.modo_passo = modo_passo
+        # "sia_semi_implicito" (padrão): difusão SIA não linear com Picard, subciclada
+        # "sia_explicito": mesma física com Euler progressivo no limite de estabilidade
+        # "legado": cadeia explícita velocidade -> gradiente -> evoluir_espessura com dt
+        # fixo e sem controle de passo (diverge em poucos passos; mantida para os
+        # benchmarks dos kernels fundidos)
+        # Nos modos SIA o passo dinâmico vem do integrador (CFL dos campos correntes)
+        self.dinamica = dinamica
+        # deslizamento={"lei": "weertman" | "coulomb" | "budd", ...}: deslizamento basal
+        # (FriccaoBasal) somado à difusividade dos modos SIA
+        if deslizamento is not None and dinamica == "legado":
+            raise ValueError("Deslizamento basal requer dinamica='sia_semi_implicito' ou 'sia_explicito'")
+        self.friccao = FriccaoBasal(deslizamento) if deslizamento is not None else None
+        self.buffers = BuffersTrabalho(self.leito.shape) if modo_passo == "fundido" else None
+        self.velocidade = np.zeros_like(self.leito)
+        self.balanco = np.zeros_like(self.leito)
         
         # Sistemas
         self.stokes = SolvedorStokes()
         self.mass = ConservacaoMassa()
+        self.integrador = IntegradorTemporalDinamica()
         self.glen = ReologiaGlen()
         self.visc = CalculadoraViscosidade()
         
@@ -46,74 +99,316 @@ class SimulacaoGRESM:
         self.atmos = AcopladorAtmosfera()
         self.gia = GiaViscoelastico()
         self.sl = ForcanteNivelMar()
+        self.intervalos_acoplamento = dict(self.INTERVALOS_ACOPLAMENTO, **(intervalos_acoplamento or {}))
+        self._registrar_componentes()
 
-        # Armazenamento de Resultados
-        self.historico = {
-            'ano': [], 'vol_total': [], 'sl_contrib': [], 'temp_atmos': [], 
-            'smb_medio': [], 'gia_max': [], 'vel_max': [], 'leito_medio': []
-        }
+        # Armazenamento de Resultados: colunas pré-alocadas com len(self.anos) linhas
+        # (com diretorio_historico, blocos cheios são descarregados em disco)
+        self.t, self.temp_ar, self.erguimento = 0.0, 0.0, 0.0
+        self.historico = RegistroHistorico(n_linhas=len(self.anos), diretorio=diretorio_historico)
+        self._registrar_diagnosticos()
         self.perfis_finais = {}
 
+    def _registrar_diagnosticos(self):
+        """Séries gravadas a cada passo; novos diagnósticos entram aqui, não no laço."""
+        h = self.historico
+        h.registrar_diagnostico('ano', lambda s: s.t)
+        h.registrar_diagnostico('vol_total', lambda s: s.espessura.sum() * s.area_celula)
+        h.registrar_diagnostico('temp_atmos', lambda s: s.temp_ar)
+        h.registrar_diagnostico('smb_medio', lambda s: s.balanco.mean())
+        h.registrar_diagnostico('gia_max', lambda s: np.max(s.erguimento))
+        h.registrar_diagnostico('vel_max', lambda s: max(s.velocidade.max(), -s.velocidade.min()))
+        h.registrar_diagnostico('leito_medio', lambda s: s.leito.mean())
+        h.registrar_diagnostico('subpassos_dinamica', lambda s: s.integrador.subpassos_intervalo
+                                if s.dinamica != "legado" else 1, np.int32)
+
+    def _registrar_componentes(self):
+        """
+        Componentes acoplados com intervalo próprio no agendador do DriverPrincipal.
+
+        Forçantes escalares são interpoladas entre avaliações; o SMB é promediado
+        sobre o intervalo das forçantes (vários anos por passo longo da dinâmica)
+        e o GIA é mantido entre atualizações, de modo que componentes lentos não
+        são recalculados a cada ano.
+        """
+        fundido = self.modo_passo == "fundido"
+        intervalos = self.intervalos_acoplamento
+        d = self.driver
+        d.registrar_componente("temp_ar", lambda t: self.atmos.obter_temp_atmosfera(t, cenario_aquecimento=2.0),
+                               intervalos["temp_ar"], modo="interpolar")
+        d.registrar_componente("nivel_mar", self.sl.nivel_eustatico, intervalos["nivel_mar"], modo="interpolar")
+        d.registrar_componente("smb", self._smb_fundido if fundido else self._smb_classico, intervalos["smb"])
+        d.registrar_componente("gia", self._gia_fundido if fundido else self._gia_classico, intervalos["gia"])
+
+    def regradear(self, x, y=None):
+        """
+        Reamostra leito e espessura (interpolação linear, separável em planta)
+        para os nós `x` (e `y` em planta), em km, e refaz as métricas em cache
+        de malha_x/malha_y, os buffers do passo fundido e a área da célula.
+        Usar antes de rodar: campos acoplados já avaliados não são reamostrados.
+        """
+        x = np.asarray(x, dtype=float)
+        if self.ndim == 2 and y is None:
+            raise ValueError("Grade em planta requer os nós `y`")
+
+        def reamostrar(campo):
+            campo = np.apply_along_axis(lambda f: np.interp(x, self.x, f), -1, campo)
+            if self.ndim == 2:
+                campo = np.apply_along_axis(lambda f: np.interp(y, self.y, f), 0, campo)
+            return campo
+
+        self.leito = reamostrar(self.leito)
+        self.espessura = reamostrar(self.espessura)
+        self.superficie = self.leito + self.espessura
+        self.x, self.dx = x, x[1] - x[0]
+        self.malha_x.iniciar_malha(self.x)
+        if self.ndim == 2:
+            self.y = np.asarray(y, dtype=float)
+            self.dy = self.y[1] - self.y[0]
+            self.malha_y.iniciar_malha(self.y)
+        self.area_celula = self.dx * self.dy
+        self.velocidade = np.zeros_like(self.leito)
+        self.balanco = np.zeros_like(self.leito)
+        if self.modo_passo == "fundido":
+            self.buffers = BuffersTrabalho(self.leito.shape)
+
+    def _smb_classico(self, t):
+        precip = self.smb_acc.calcular_precipitacao(t)
+        # Ajuste simples de temperatura por altitude
+        temp_local = self.driver.obter("temp_ar", t) - self.lapse_rate * self.superficie
+        # PDD analítico vetorizado sobre toda a grade (neve do ano derrete primeiro)
+        derretimento = self.smb_abl.calcular_derretimento_pdd(temp_local, neve=precip)
+        return precip - derretimento
+
+    def _smb_fundido(self, t):
+        """SMB instantâneo em buffers.derretimento (a média vai para buffers.balanco)."""
+        b = self.buffers
+        precip = self.smb_acc.calcular_precipitacao(t)
+        np.multiply(self.superficie, -self.lapse_rate, out=b.temp_local)
+        b.temp_local += self.driver.obter("temp_ar", t)
+        self.smb_abl.calcular_derretimento_pdd(b.temp_local, neve=precip,
+                                               out=b.derretimento, trabalho=b.trabalho_pdd)
+        np.subtract(precip, b.derretimento, out=b.derretimento)
+        return b.derretimento
+
+    def _gia_classico(self, t):
+        # Carga média no transecto, carga local em planta
+        carga = (np.mean(self.espessura) if self.ndim == 1 else self.espessura) * 917.0 * 9.81
+        return self.gia.calcular_erguimento(t, carga)
+
+    def _gia_fundido(self, t):
+        if self.ndim == 1:
+            return self.gia.calcular_erguimento(t, self.espessura.mean() * 917.0 * 9.81)
+        b = self.buffers
+        np.multiply(self.espessura, 917.0 * 9.81, out=b.erguimento)
+        return self.gia.calcular_erguimento(t, b.erguimento, out=b.erguimento)
+
+    def _passo_classico(self, t):
+        # 1. Forcantes Climáticos (agendador multitaxa do DriverPrincipal)
+        temp_ar = self.driver.obter("temp_ar", t)
+        nivel_mar = self.driver.obter("nivel_mar", t)
+        
+        # 2. SMB (Balanço de Massa): média sobre o intervalo das forçantes
+        self.balanco = self.driver.media_intervalo("smb", t, t + self.dt)
+        
+        # 3. Dinâmica do Gelo
+        if self.dinamica != "legado":
+            self.velocidade = self._passo_dinamica_sia(self.balanco)
+        elif self.ndim == 1:
+            # Gradiente de superificie
+            declividade = self.malha_x.gradiente(self.superficie)
+            # Velocidade (SIA)
+            self.velocidade = self.stokes.resolver_velocidade(self.espessura, declividade)
+            fluxo = self.velocidade * self.espessura
+            div_fluxo = self.malha_x.gradiente(fluxo)
+        else:
+            declividade_x = self.malha_x.gradiente(self.superficie, eixo=1)
+            declividade_y = self.malha_y.gradiente(self.superficie, eixo=0)
+            u, v = self.stokes.resolver_velocidade_2d(self.espessura, declividade_x, declividade_y)
+            self.velocidade = np.hypot(u, v)
+            div_fluxo = self.malha_x.gradiente(u * self.espessura, eixo=1) + \
+                self.malha_y.gradiente(v * self.espessura, eixo=0)
+        
+        # Evolução da massa
+        if self.dinamica == "legado":
+            self.espessura = self.mass.evoluir_espessura(self.espessura, div_fluxo, self.balanco, self.dt)
+        self.superficie = self.leito + self.espessura
+        
+        # 4. Geossfera (GIA), mantido entre atualizações
+        erguimento = self.driver.obter("gia", t)
+        self.leito += erguimento * 1e-4 # Efeito pequeno incremental
+        return temp_ar, erguimento
+
+    def _passo_fundido(self, t):
+        """Mesmo passo de _passo_classico escrito inteiramente nos buffers pré-alocados."""
+        b = self.buffers
+        temp_ar = self.driver.obter("temp_ar", t)
+        nivel_mar = self.driver.obter("nivel_mar", t)
+
+        self.driver.media_intervalo("smb", t, t + self.dt, out=b.balanco)
+
+        if self.dinamica != "legado":
+            b.velocidade[...] = self._passo_dinamica_sia(b.balanco)
+        elif self.ndim == 1:
+            self.malha_x.gradiente(self.superficie, out=b.declividade)
+            self.stokes.resolver_velocidade(self.espessura, b.declividade, out=b.velocidade)
+            np.multiply(b.velocidade, self.espessura, out=b.fluxo)
+            self.malha_x.gradiente(b.fluxo, out=b.div_fluxo)
+        else:
+            self.malha_x.gradiente(self.superficie, out=b.declividade, eixo=1)
+            self.malha_y.gradiente(self.superficie, out=b.declividade_y, eixo=0)
+            self.stokes.resolver_velocidade_2d(self.espessura, b.declividade, b.declividade_y,
+                                               out=(b.velocidade_x, b.velocidade_y), trabalho=b.auxiliar)
+            np.hypot(b.velocidade_x, b.velocidade_y, out=b.velocidade)
+            np.multiply(b.velocidade_x, self.espessura, out=b.fluxo)
+            np.multiply(b.velocidade_y, self.espessura, out=b.fluxo_y)
+            self.malha_x.gradiente(b.fluxo, out=b.div_fluxo, eixo=1)
+            self.malha_y.gradiente(b.fluxo_y, out=b.auxiliar, eixo=0)
+            b.div_fluxo += b.auxiliar
+
+        if self.dinamica == "legado":
+            self.mass.evoluir_espessura(self.espessura, b.div_fluxo, b.balanco, self.dt,
+                                        out=self.espessura, trabalho=b.auxiliar)
+        np.add(self.leito, self.espessura, out=self.superficie)
+
+        erguimento = self.driver.obter("gia", t)
+        if self.ndim == 1:
+            self.leito += erguimento * 1e-4
+        else:
+            np.multiply(erguimento, 1e-4, out=b.auxiliar)
+            self.leito += b.auxiliar
+        self.velocidade = b.velocidade
+        self.balanco = b.balanco
+        return temp_ar, erguimento
+
+    def _difusividade_sia(self, espessura, superficie):
+        """
+        D da SIA nas faces com espaçamentos em metros (x, y da grade em km),
+        incluindo o deslizamento basal quando configurado.
+        """
+        dy = self.dy * 1e3 if self.ndim == 2 else None
+        if self.friccao is None:
+            return self.stokes.calcular_difusividade_sia(espessura, superficie, self.dx * 1e3, dy)
+        pressao_efetiva = None
+        if self.friccao.lei != "weertman":
+            pressao_efetiva = self.friccao.pressao_efetiva(espessura, superficie - espessura)
+        return self.stokes.calcular_difusividade_sia(espessura, superficie, self.dx * 1e3, dy,
+                                                     self.friccao, pressao_efetiva)
+
+    def _limite_estavel_sia(self):
+        """
+        Passo dinâmico permitido pelo estado corrente: limite difusivo da
+        difusividade SIA (deformação + deslizamento) e advectivo da velocidade
+        média na vertical que ela implica.
+        """
+        dx, dy = self.dx * 1e3, (self.dy * 1e3 if self.ndim == 2 else None)
+        D = self._difusividade_sia(self.espessura, self.superficie)
+        velocidade = self.stokes.velocidade_media_sia(self.espessura, self.superficie, D, dx, dy)
+        return self.integrador.passo_estavel(dx, velocidade=velocidade, difusividade=D, dy=dy,
+                                             implicito=self.dinamica == "sia_semi_implicito")
+
+    def _tentar_passo_sia(self, dt, balanco):
+        """Um subpasso SIA; rejeitado (estado intacto) se Picard não converge ou surge NaN."""
+        dx, dy = self.dx * 1e3, (self.dy * 1e3 if self.ndim == 2 else None)
+        if self.dinamica == "sia_semi_implicito":
+            H = self.mass.evoluir_espessura_semi_implicito(
+                self.espessura, self.leito, balanco, dt, dx, self._difusividade_sia, dy)
+            aceito = getattr(self.mass, "convergiu_picard", False)
+        else:
+            H = self.mass.evoluir_espessura_sia_explicito(
+                self.espessura, self.leito, balanco, dt, dx, self._difusividade_sia, dy)
+            aceito = True
+        if not aceito or np.shape(H) != self.espessura.shape or not np.all(np.isfinite(H)):
+            return False
+        self.espessura[...] = H
+        np.add(self.leito, self.espessura, out=self.superficie)
+        return True
+
+    def _passo_dinamica_sia(self, balanco):
+        """
+        Avança a espessura por um intervalo de forçantes (self.dt) em subpassos
+        adaptativos e retorna a velocidade média na vertical (u com sinal em 1D,
+        rapidez em planta) do estado novo. Levanta RuntimeError se o intervalo
+        não foi coberto.
+        """
+        aceitos = self.integrador.subciclar(lambda dt: self._tentar_passo_sia(dt, balanco), self.dt,
+                                            self._limite_estavel_sia)
+        if not aceitos:
+            # subciclar devolveu o retorno de segurança: erro já registrado no integrador
+            raise RuntimeError(f"Dinâmica SIA não avançou o intervalo de {self.dt:g} a no ano {self.t:g}")
+        dx, dy = self.dx * 1e3, (self.dy * 1e3 if self.ndim == 2 else None)
+        D = self._difusividade_sia(self.espessura, self.superficie)
+        velocidade = self.stokes.velocidade_media_sia(self.espessura, self.superficie, D, dx, dy)
+        return velocidade if self.ndim == 1 else np.hypot(*velocidade)
+
+    def medir_alocacao_passo(self, n_passos=20):
+        """
+        Verifica com tracemalloc que o passo em regime não aloca arrays.
+
+        Retorna o crescimento líquido e o pico transitório por passo (bytes). No
+        modo "fundido" ambos ficam abaixo do tamanho de um único campo da grade. O
+        interpretador (~10 kB) e os buffers fixos dos ufuncs do NumPy em vistas
+        estridadas da grade 2D (~200 kB) não dependem do tamanho da grade, então o
+        teste só é conclusivo em grades maiores que isso.
+        """
+        passo = self._passo_fundido if self.modo_passo == "fundido" else self._passo_classico
+        estado = (self.espessura.copy(), self.superficie.copy(), self.leito.copy())
+        # Instantes crescentes: com um t fixo o agendador manteria o SMB sem recalculá-lo
+        tempos = iter(np.arange(n_passos + 10) * self.dt)
+        self.driver.reiniciar_agendamento()
+        with np.errstate(all='ignore'):
+            medida = medir_alocacao(lambda: passo(next(tempos)), n_medidos=n_passos)
+        # Restaurar o estado: a medição não deve avançar a simulação
+        self.espessura[...], self.superficie[...], self.leito[...] = estado
+        self.driver.reiniciar_agendamento()
+        medida['bytes_campo'] = self.espessura.nbytes
+        medida['sem_alocacao'] = medida['crescimento_bytes'] < self.espessura.nbytes and \
+            medida['pico_passo_bytes'] < self.espessura.nbytes
+        return medida
+
     def rodar(self):
         print("Iniciando Simulação GRESM (Arquitetura em Português)...")
+        passo = self._passo_fundido if self.modo_passo == "fundido" else self._passo_classico
+        self.integrador.zerar_estatisticas()
+        self.driver.reiniciar_agendamento()
         
         for t in self.anos:
-            # 1. Forcantes Climáticos
-            temp_ar = self.atmos.obter_temp_atmosfera(t, cenario_aquecimento=2.0)
-            nivel_mar = self.sl.nivel_eustatico(t)
-            
-            # 2. SMB (Balanço de Massa)
-            precip = self.smb_acc.calcular_precipitacao(t)
-            # Ajuste simples de temperatura por altitude
-            lapse_rate = 0.0065
-            temp_local = temp_ar - lapse_rate * self.superficie
-            derretimento = np.array([self.smb_abl.calcular_derretimento(tmp) for tmp in temp_local])
-            balanco = precip - derretimento
-            
-            # 3. Dinâmica do Gelo
-            # Gradiente de superificie
-            declividade = np.gradient(self.superficie, self.x)
-            # Velocidade (SIA)
-            velocidade = self.stokes.resolver_velocidade(self.espessura, declividade)
-            fluxo = velocidade * self.espessura
-            div_fluxo = np.gradient(fluxo, self.x)
-            
-            # Evolução da massa
-            self.espessura = self.mass.evoluir_espessura(self.espessura, div_fluxo, balanco, self.dt)
-            self.superficie = self.leito + self.espessura
-            
-            # 4. Geossfera (GIA)
-            carga = np.mean(self.espessura) * 917.0 * 9.81
-            erguimento = self.gia.calcular_erguimento(t, carga)
-            self.leito += erguimento * 1e-4 # Efeito pequeno incremental
-            
-            # Log
-            self.historico['ano'].append(t)
-            self.historico['vol_total'].append(np.sum(self.espessura) * (self.x[1]-self.x[0]))
-            self.historico['temp_atmos'].append(temp_ar)
-            self.historico['smb_medio'].append(np.mean(balanco))
-            self.historico['gia_max'].append(erguimento)
-            self.historico['vel_max'].append(np.max(np.abs(velocidade)))
-            self.historico['leito_medio'].append(np.mean(self.leito))
+            self.t = t
+            self.temp_ar, self.erguimento = passo(t)
+            self.historico.gravar(self)
             
             if int(t) % 20 == 0:
-                print(f"Ano {int(t)}: Vol={self.historico['vol_total'][-1]:.2e} m2")
+                print(f"Ano {int(t)}: Vol={self.historico.ultimo('vol_total'):.2e} m{self.ndim + 1}")
+        self.historico.finalizar()
+        if self.dinamica != "legado":
+            print(f"Passos dinâmicos: {self.integrador.passos_totais} aceitos, "
+                  f"{self.integrador.passos_rejeitados} rejeitados em {len(self.anos)} intervalos")
+        for nome, r in self.driver.relatorio_componentes().items():
+            print(f"  {nome:10s}: a cada {r['intervalo']:g} a, {r['avaliacoes']} avaliações, {r['segundos']:.2f} s")
 
         # Salvar estado final
         self.perfis_finais = {
             'x': self.x,
+            'y': self.y,
             'superficie': self.superficie,
             'leito': self.leito,
             'espessura': self.espessura,
-            'velocidade': velocidade,
-            'smb': balanco
+            'velocidade': self.velocidade.copy(),
+            'smb': self.balanco.copy()
         }
         
         np.savez("resultados_gresm.npz", 
-                 historico=self.historico, 
-                 perfis_finais=self.perfis_finais)
+                 perfis_finais=self.perfis_finais,
+                 estatisticas_dinamica={'passos_totais': self.integrador.passos_totais,
+                                        'passos_rejeitados': self.integrador.passos_rejeitados},
+                 **self.historico.como_dicionario(prefixo="historico_"))
         print("Simulação concluída. Dados salvos em 'resultados_gresm.npz'.")
 
 if __name__ == "__main__":
-    sim = SimulacaoGRESM()
+    # python3 main_simulacao.py [1d|2d] [dx_km] [sia_semi_implicito|sia_explicito|legado] [dt_anos]
+    grade = sys.argv[1] if len(sys.argv) > 1 else "1d"
+    dx_2d = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    dinamica = sys.argv[3] if len(sys.argv) > 3 else "sia_semi_implicito"
+    dt = float(sys.argv[4]) if len(sys.argv) > 4 else 1.0
+    sim = SimulacaoGRESM(grade=grade, dx_2d=dx_2d, dinamica=dinamica, dt=dt)
     sim.rodar()